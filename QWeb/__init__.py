@@ -14,7 +14,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ---------------------------
-import time
 import traceback
 import types
 from functools import wraps
@@ -24,10 +23,11 @@ try:
     from robot.api import logger
     from robot.libraries import Dialogs
     from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
-    from robot.utils import timestr_to_secs as _timestr_to_secs
 
     from QWeb import custom_config
     from QWeb.internal import util
+    from QWeb.internal import decorators as _decorators
+    from QWeb.internal import screenshot as _screenshot
     from QWeb.internal.config_defaults import CONFIG
     from QWeb.keywords import (
         ajax,
@@ -300,6 +300,7 @@ class QWeb:
     """
 
     ROBOT_LIBRARY_SCOPE = "Global"
+    ROBOT_LISTENER_API_VERSION = 3
 
     def __init__(self, run_on_failure_keyword: str = DEFAULT_RUN_ON_FAILURE_KEYWORD) -> None:
         """Initializes the QWeb library and adds all the keywords to the instance.
@@ -309,6 +310,7 @@ class QWeb:
 
         """
         self._run_on_failure_keyword = run_on_failure_keyword
+        self.ROBOT_LIBRARY_LISTENER = self
         for module in (
             alert,
             browser,
@@ -352,11 +354,11 @@ class QWeb:
 
         @wraps(keyword_method)  # Preserves docstring of the original method.
         def inner(*args: Any, **kwargs: Any) -> None:  # pylint: disable=R1710
-            kwargs = {k.lower(): v for k, v in kwargs.items()}  # Kwargs keys to lowercase
             if "type_secret" not in str(keyword_method):
                 logger.debug("args: {}, kwargs: {}".format(args, kwargs))
             try:
-                time.sleep(_timestr_to_secs(kwargs.get("delay", CONFIG["Delay"])))
+                # Kwargs keys to lowercase and delay before keyword
+                kwargs = _decorators.prepare_keyword_kwargs(kwargs)
                 run_before = CONFIG["RunBefore"]
                 valid_pw = ["click", "get_text", "drop_down"]
                 if run_before and any(pw in str(keyword_method) for pw in valid_pw):
@@ -396,13 +398,27 @@ class QWeb:
         """Helper function to run the registered run_on_failure keyword."""
         # if default, embed screenshot kw directly for log readability
         if self._run_on_failure_keyword == DEFAULT_RUN_ON_FAILURE_KEYWORD:
-            screenshot.log_screenshot()
+            # file is not used by the caller, so it can be written in background
+            screenshot._log_screenshot(  # pylint: disable=protected-access
+                background=CONFIG["BackgroundScreenshots"]
+            )
         else:
             try:
                 BuiltIn().run_keyword(self._run_on_failure_keyword)
             except RobotNotRunningError:
                 logger.debug("Robot not running")
 
+    @staticmethod
+    def _end_suite(_data: Any, _result: Any) -> None:
+        """Listener method: screenshots written in background are on disk
+        before suite's log and report are finished."""
+        _screenshot.flush_screenshots()
+
+    @staticmethod
+    def _close() -> None:
+        """Listener method called when library goes out of scope."""
+        _screenshot.flush_screenshots()
+
     @staticmethod
     def _xpath_decorator(keyword_method: Callable[..., Any]) -> Callable[..., Callable[..., Any]]:
         """Decorator method for selector-attribute. If selector attribute
@@ -15,10 +15,17 @@
 # limitations under the License.
 # ---------------------------
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import contextvars
 import re
 from robot.libraries.BuiltIn import BuiltIn
+from selenium.webdriver.remote.webdriver import WebDriver
+from QWeb.internal import browser, decorators
+from QWeb.internal.config_defaults import CONFIG
+
+Step = tuple[Callable[..., Any], list[Any], dict[str, Any]]
 
 
 def set_robot_args(*args: Any, **kwargs: Any) -> list[Any]:
@@ -96,3 +103,46 @@ def _contains_var(arg: str, from_start: bool = True) -> bool:
     if from_start:
         return any(arg.strip().startswith(v) for v in var_types)
     return any(v in arg and "}" in arg for v in var_types)
+
+
+def parse_step(step: Union[str, list[Any]]) -> tuple[str, list[Any], dict[str, Any]]:
+    """Return keyword name, args and kwargs from step given as keyword name or
+    list containing keyword name and arguments."""
+    if isinstance(step, str):
+        return step.strip(), [], {}
+    line = [str(s) for s in step]
+    args, kwargs = _parse_arguments(line, starting_point=1)
+    return line[0].strip(), args, kwargs
+
+
+def run_in_sessions(
+    drivers: list[WebDriver], steps: list[Step], max_workers: int = 0
+) -> list[tuple[Any, Optional[Exception]]]:
+    """Run steps against each browser concurrently in a thread pool.
+
+    Every thread uses its own browser and its own copy of configuration.
+
+    Returns
+    -------
+    list
+        (result of last step, exception or None) for each browser in given order.
+    """
+
+    def run(driver: WebDriver) -> Any:
+        with browser.session(driver), CONFIG.session():
+            result = None
+            for fn, args, kwargs in steps:
+                # Delay and lowercase argument names as in library keyword wrapper
+                result = fn(*args, **decorators.prepare_keyword_kwargs(kwargs))
+            return result
+
+    results: list[tuple[Any, Optional[Exception]]] = []
+    workers = max_workers or len(drivers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qweb-session") as pool:
+        futures = [pool.submit(contextvars.copy_context().run, run, d) for d in drivers]
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except Exception as e:  # pylint: disable=broad-except
+                results.append((None, e))
+    return results
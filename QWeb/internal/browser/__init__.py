@@ -15,7 +15,9 @@
 # limitations under the License.
 # ---------------------------
 from __future__ import annotations
-from typing import Union, Optional
+from typing import Iterator, Union, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from QWeb.internal.exceptions import QWebDriverError, QWebValueError
@@ -87,18 +89,57 @@ MIME_TYPES = (
 
 _current_browser: Optional[WebDriver] = None
 _open_browsers: list[WebDriver] = []
+# Browser of current session (thread/context), overrides _current_browser when set
+_session_browser: ContextVar[Optional[WebDriver]] = ContextVar(
+    "qweb_session_browser", default=None
+)
+# False while launching browsers which should not be added to open browsers (pool)
+_register_browsers: ContextVar[bool] = ContextVar("qweb_register_browsers", default=True)
 
 
 def get_current_browser() -> WebDriver:
-    if _current_browser is None:
+    driver = _session_browser.get()
+    if driver is None:
+        driver = _current_browser
+    if driver is None:
         raise QWebDriverError("No browser open. Use OpenBrowser keyword to open browser first")
-    return _current_browser
+    return driver
 
 
-def set_current_browser(target: Union[int, str]) -> None:
+def _set_current(driver: Optional[WebDriver]) -> None:
     # pylint: disable=global-statement
     global _current_browser
+    if _session_browser.get() is not None:
+        _session_browser.set(driver)
+    else:
+        _current_browser = driver
+
+
+@contextmanager
+def session(driver: WebDriver) -> Iterator[WebDriver]:
+    """Use given browser as current browser in current context only.
+
+    Used to drive several browsers at the same time from different threads.
+    """
+    token = _session_browser.set(driver)
+    try:
+        yield driver
+    finally:
+        _session_browser.reset(token)
+
 
+@contextmanager
+def unregistered() -> Iterator[None]:
+    """Browsers opened inside the with block are not added to open browsers
+    and do not change current browser."""
+    token = _register_browsers.set(False)
+    try:
+        yield
+    finally:
+        _register_browsers.reset(token)
+
+
+def set_current_browser(target: Union[int, str]) -> None:
     if str(target).isdigit():
         if int(target) == 0:
             raise QWebValueError("SwitchBrowser index starts at 1.")
@@ -106,18 +147,18 @@ def set_current_browser(target: Union[int, str]) -> None:
         i = int(target) - 1
 
         if i < len(_open_browsers):
-            _current_browser = _open_browsers[i]
+            _set_current(_open_browsers[i])
         else:
             raise QWebDriverError(f"Tried to select browser with index {target} but there are \
                                   {len(_open_browsers)} browsers open")
     elif str(target) == "NEW":
-        _current_browser = _open_browsers[-1]
+        _set_current(_open_browsers[-1])
     else:
         # Try to find a browser by open page title. If multiple matches, first one is selected
         for browser in _open_browsers:
             try:
                 if target == browser.title:
-                    _current_browser = browser
+                    _set_current(browser)
                     return
             except Exception:  # pylint: disable=broad-except
                 # Browser might be closed already etc.
@@ -130,24 +171,22 @@ def get_open_browsers() -> list[WebDriver]:
 
 
 def cache_browser(driver: WebDriver) -> None:
-    # pylint: disable=global-statement
-    global _current_browser
     # pylint: disable=global-statement, global-variable-not-assigned
     global _open_browsers  # noqa: F824
-    _current_browser = driver
+    if not _register_browsers.get():
+        return
+    _set_current(driver)
     _open_browsers.append(driver)
 
 
 def remove_from_browser_cache(driver: WebDriver) -> None:
     """Removes specific entry from browser cache.
     Control is moved to previously opened browser"""
-    # pylint: disable=global-statement
-    global _current_browser
     # pylint: disable=global-statement, global-variable-not-assigned
     global _open_browsers  # noqa: F824
     _open_browsers.remove(driver)
     # there's at least one browser open, move to latest
-    _current_browser = _open_browsers[-1] if _open_browsers else None
+    _set_current(_open_browsers[-1] if _open_browsers else None)
 
 
 def clear_browser_cache() -> None:
@@ -0,0 +1,190 @@
+from __future__ import annotations
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from robot.api import logger
+from QWeb.internal import browser, javascript
+from QWeb.internal.config_defaults import CONFIG
+
+# Browsers which can be pre-launched to the pool
+NAMES: list[str] = ["chrome", "gc", "edge", "firefox", "ff"]
+
+PoolKey = tuple[Hashable, ...]
+
+
+def make_key(browser_alias: str, options: list[str], kwargs: dict[str, Any]) -> PoolKey:
+    """Sessions are reusable only for OpenBrowser calls with same browser and arguments."""
+    return (browser_alias, tuple(options), tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+
+
+class BrowserPool:
+    """Pre-launched browser sessions waiting to be handed out by OpenBrowser.
+
+    Sessions are launched in background threads. Closed sessions are reset
+    and returned to the pool according to BrowserPoolReset.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, list[WebDriver]] = {}
+        self._launching: dict[PoolKey, int] = {}
+        self._factories: dict[PoolKey, Callable[[], WebDriver]] = {}
+        # id(driver) -> key for all sessions owned by the pool
+        self._owned: dict[int, PoolKey] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def acquire(self, key: PoolKey) -> Optional[WebDriver]:
+        """Return idle session for key or None if there's none ready."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                driver = idle.pop(0)
+            if _is_alive(driver):
+                logger.debug("Using pre-launched browser session from pool")
+                return driver
+            self._discard(driver)
+
+    def adopt(self, key: PoolKey, driver: WebDriver, factory: Callable[[], WebDriver]) -> None:
+        """Make pool owner of driver and keep pool filled with sessions created by factory."""
+        with self._lock:
+            self._owned[id(driver)] = key
+            self._factories[key] = factory
+        self.fill(key)
+
+    def fill(self, key: PoolKey) -> None:
+        """Launch sessions in background until there are BrowserPoolSize idle ones."""
+        size = CONFIG["BrowserPoolSize"]
+        with self._lock:
+            factory = self._factories.get(key)
+            missing = size - len(self._idle.get(key, [])) - self._launching.get(key, 0)
+            if not factory or missing <= 0:
+                return
+            self._launching[key] = self._launching.get(key, 0) + missing
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="qweb-pool")
+        for _ in range(missing):
+            self._executor.submit(self._launch, key, factory)
+
+    def release(self, driver: WebDriver) -> bool:
+        """Reset session and return it to pool.
+
+        Returns False if the driver is not owned by pool and should be quit by caller.
+        """
+        with self._lock:
+            key = self._owned.get(id(driver))
+        if key is None:
+            return False
+        policy = CONFIG["BrowserPoolReset"]
+        if policy == "restart" or not self._reset(driver, policy):
+            self._discard(driver)
+            self.fill(key)
+            return True
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            keep = len(idle) < CONFIG["BrowserPoolSize"]
+            if keep:
+                idle.append(driver)
+        if not keep:
+            self._discard(driver)
+        return True
+
+    def shutdown(self) -> None:
+        """Quit all idle sessions."""
+        with self._lock:
+            drivers = [d for idle in self._idle.values() for d in idle]
+            self._idle.clear()
+            self._factories.clear()
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+            # sessions launched after the first clear
+            with self._lock:
+                drivers += [d for idle in self._idle.values() for d in idle]
+                self._idle.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+    def _launch(self, key: PoolKey, factory: Callable[[], WebDriver]) -> None:
+        driver = None
+        try:
+            with browser.unregistered(), CONFIG.session():
+                driver = factory()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Failed to launch browser to pool: {e}")
+        with self._lock:
+            self._launching[key] -= 1
+            if driver is not None:
+                self._owned[id(driver)] = key
+                self._idle.setdefault(key, []).append(driver)
+
+    @staticmethod
+    def _reset(driver: WebDriver, policy: str) -> bool:
+        try:
+            if policy == "reset":
+                reset_browser(driver)
+            else:
+                driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            logger.debug(f"Unable to reset pooled browser: {e}")
+            return False
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._owned.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.debug(f"Error while quitting pooled browser: {e}")
+
+
+def reset_browser(driver: WebDriver) -> None:
+    """Close all but the first window, clear cookies, storages and cache
+    and navigate to about:blank.
+
+    Storages are cleared from the origin of the first window with JS. Cookies
+    and cache of all sites are cleared with CDP (Chromium) or BiDi when available.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    try:
+        with browser.session(driver):
+            logger.debug(f"Cleared storages: {javascript.clear_storage()}")
+    except WebDriverException as e:
+        logger.debug(f"Unable to clear storages: {e}")
+    driver.delete_all_cookies()
+    # delete_all_cookies clears only cookies of current domain
+    if _is_chromium(driver):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    elif isinstance(driver.capabilities.get("webSocketUrl"), str):
+        # BiDi storage module is not available in all supported Selenium versions
+        try:
+            driver.storage.delete_cookies()
+        except (AttributeError, WebDriverException) as e:
+            logger.debug(f"Unable to clear cookies of all sites: {e}")
+    driver.get("about:blank")
+
+
+def _is_chromium(driver: WebDriver) -> bool:
+    capabilities = driver.capabilities
+    return "goog:chromeOptions" in capabilities or "ms:edgeOptions" in capabilities
+
+
+def _is_alive(driver: WebDriver) -> bool:
+    try:
+        return bool(driver.window_handles)
+    except WebDriverException:
+        return False
+
+
+POOL = BrowserPool()
+atexit.register(POOL.shutdown)
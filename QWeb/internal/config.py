@@ -15,9 +15,11 @@
 # limitations under the License.
 # ---------------------------
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 
 class Config:
@@ -31,7 +33,36 @@ class Config:
             _k = self._clean_string(k)
             _config_defaults[_k] = copy.deepcopy(v)
         self._config_defaults.update(_config_defaults)
-        self.config = copy.deepcopy(self._config_defaults)
+        self._config = copy.deepcopy(self._config_defaults)
+        # Session specific configuration, see session()
+        self._session_config: ContextVar[Optional[dict[str, Any]]] = ContextVar(
+            f"qweb_config_{id(self)}", default=None
+        )
+
+    @property
+    def config(self) -> dict[str, Any]:
+        session_config = self._session_config.get()
+        return self._config if session_config is None else session_config
+
+    @config.setter
+    def config(self, value: dict[str, Any]) -> None:
+        if self._session_config.get() is None:
+            self._config = value
+        else:
+            self._session_config.set(value)
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """Use a copy of current configuration in current context.
+
+        Changes done inside the with block (for example in another thread)
+        do not affect configuration outside of it.
+        """
+        token = self._session_config.set(copy.deepcopy(self.config))
+        try:
+            yield
+        finally:
+            self._session_config.reset(token)
 
     def is_value(self, par: str) -> bool:
         """Return True if parameter exists."""
@@ -46,6 +46,10 @@ CONFIG_DEFAULTS: dict[str, Any] = {
     "ClearKey": (None, util.set_clear_key),
     "CssSelectors": (True, util.par2bool),
     "LogScreenshot": (True, util.par2bool),
+    "BackgroundScreenshots": (True, util.par2bool),
+    "ScreenshotFormat": ("png", util.validate_screenshot_format),
+    "ScreenshotQuality": (80, util.validate_screenshot_quality),
+    "ScreenshotScale": (1.0, util.validate_screenshot_scale),
     "SearchDirection": ("closest", SearchStrategies.search_direction_validation),
     "CheckInputValue": (False, util.par2bool),
     "DefaultTimeout": ("10s", SearchStrategies.timeout_validator),
@@ -93,15 +97,23 @@ CONFIG_DEFAULTS: dict[str, Any] = {
     "RetryError": (None, None),
     "StayInCurrentFrame": (False, util.par2bool),
     "FrameTimeout": ("10s", SearchStrategies.timeout_validator),
+    "FrameCache": (False, util.par2bool),
+    "FrameAffinity": (False, util.par2bool),
     "AllTextNodes": (False, util.par2bool),
     "OSScreenshots": (False, util.par2bool),
     "RetinaDisplay": (util.is_retina(), util.par2bool),
     "LogMatchedIcons": (False, util.par2bool),
+    "IconMatchWorkers": (0, util.non_negative_int),
+    "IconMatcher": ("template", util.validate_icon_matcher),
     "ShadowDOM": (False, util.par2bool),
     "HighlightColor": ("blue", util.highlight_validation),
     "SpinnerCSS": ("none", None),
     "RenderWait": ("200ms", util.validate_ms),
     "WaitStrategy": ("enhanced", util.validate_wait_strategy),
+    "LocatorEngine": ("default", util.validate_locator_engine),
+    "RetryWait": ("poll", util.validate_retry_wait),
+    "BrowserPoolSize": (0, util.non_negative_int),
+    "BrowserPoolReset": ("reset", util.validate_browser_pool_reset),
 }
 
 CONFIG: Config = Config(CONFIG_DEFAULTS)
@@ -32,7 +32,7 @@ from selenium.common.exceptions import (
     InvalidSessionIdException,
 )
 from QWeb.keywords import config
-from QWeb.internal import frame
+from QWeb.internal import frame, javascript
 from QWeb.internal.config_defaults import CONFIG, SHORT_DELAY, LONG_DELAY
 from QWeb.internal.exceptions import (
     QWebElementNotFoundError,
@@ -49,6 +49,21 @@ from QWeb.internal.exceptions import (
     FATAL_MESSAGES,
 )
 
+# Max time to wait for DOM change in one retry round. Cross origin frames are not
+# observed so changes there are noticed latest after this.
+EVENT_WAIT_MAX: float = 1.0
+
+
+def prepare_keyword_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return keyword arguments with lowercase names after waiting the keyword delay.
+
+    Delay is the delay argument of the keyword or Delay configuration. Used by
+    the library wrapper of every keyword and by keywords run in worker threads.
+    """
+    kwargs = {k.lower(): v for k, v in kwargs.items()}
+    time.sleep(timestr_to_secs(kwargs.get("delay", CONFIG["Delay"])))
+    return kwargs
+
 
 # pylint: disable=too-many-statements
 # pylint: disable=too-many-branches
@@ -90,8 +105,11 @@ def timeout_decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
                     StaleElementReferenceException,
                     QWebIconNotFoundError,
                 ) as e:
-                    time.sleep(SHORT_DELAY)
                     logger.debug("Got exception: {}. Trying to retry..".format(e))
+                    if isinstance(e, QWebIconNotFoundError):
+                        time.sleep(SHORT_DELAY)
+                    else:
+                        _wait_before_retry(locator, timeout + start)
                 except InvalidSessionIdException as e:
                     CONFIG.set_value("OSScreenshots", True)
                     raise QWebBrowserError("Browser session lost. Did browser crash?") from e
@@ -174,6 +192,36 @@ def timeout_decorator_for_actions(fn: Callable[..., Any]) -> Callable[..., Any]:
     return perform
 
 
+def _wait_before_retry(locator: Any, deadline: float) -> None:
+    """Wait before searching element again.
+
+    With RetryWait "event" waits in browser until locator text appears in DOM
+    (or EVENT_WAIT_MAX passes) instead of sleeping SHORT_DELAY.
+    """
+    if CONFIG["RetryWait"] != "event" or not _is_text_locator(locator):
+        time.sleep(SHORT_DELAY)
+        return
+    wait = min(deadline - time.time(), EVENT_WAIT_MAX)
+    if wait <= 0:
+        return
+    try:
+        result = javascript.wait_for_text(locator, int(wait * 1000))
+    except (WebDriverException, QWebDriverError) as e:
+        logger.debug("Event wait failed: {}. Polling instead".format(e))
+        time.sleep(SHORT_DELAY)
+        return
+    logger.debug("Event wait for {}: {}".format(locator, result))
+    if not isinstance(result, dict) or result.get("status") == "present":
+        # text is in DOM already, element is just not usable yet
+        time.sleep(SHORT_DELAY)
+
+
+def _is_text_locator(locator: Any) -> bool:
+    if not isinstance(locator, str) or not locator.strip():
+        return False
+    return not locator.startswith(("//", "(//", "xpath=", "css="))
+
+
 def get_timeout(**kwargs: Any) -> Union[int, float]:
     timeout = timestr_to_secs(CONFIG["DefaultTimeout"])
     if "timeout" in kwargs:
@@ -210,6 +258,7 @@ def _equal_sign_handler(
                 "xpath",
                 "steps",
                 "image",
+                "images",
                 "input_texts",
                 "input_values",
                 "text",
@@ -17,7 +17,7 @@
 from __future__ import annotations
 from typing import Optional, Callable, Any, Union
 
-import math
+import numpy as np
 from robot.api import logger
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
@@ -31,6 +31,7 @@ from selenium.common.exceptions import (
 )
 from QWeb.internal import frame
 from QWeb.internal.exceptions import (
+    QWebDriverError,
     QWebElementNotFoundError,
     QWebStalingElementError,
     QWebValueError,
@@ -103,6 +104,9 @@ def get_closest_element(
 ) -> WebElement:
     """Get the closest element in a list of elements to a wanted element.
 
+    Bounding rects of locator and all candidates are fetched with a single
+    javascript call and distances are calculated for all candidates at once.
+
     Parameters
     ----------
     locator_element : WebElement
@@ -114,23 +118,31 @@ def get_closest_element(
     """
     if not candidate_elements:
         raise QWebElementNotFoundError("No elements visible")
-    closest_element_list = []
+    debug = util.is_debug_log_level()
+    rects, html = _get_bounding_rects([locator_element, *candidate_elements], debug)
+    anchor_rect, candidate_rects = rects[0], rects[1:]
+    if debug:
+        for info in html[1:]:
+            logger.debug("Measuring distance for: {}".format(info))
+
+    overlapping = np.flatnonzero(_overlaps(anchor_rect, candidate_rects))
+    if overlapping.size:
+        index = int(overlapping[0])
+        if debug:
+            logger.debug("Elements overlap, returning this: {}".format(html[index + 1]))
+        return candidate_elements[index]
+
+    distances = _closest_distances(anchor_rect, candidate_rects, CONFIG["SearchDirection"])
+    closest_indexes: list[int] = []
     closest_distance = DEFAULT_DISTANCE
-    for candidate_element in candidate_elements:
-        element_info = _list_info(candidate_element)
-        logger.debug("Measuring distance for: {}".format(element_info))
-        if _overlap(locator_element, candidate_element):
-            logger.debug("Elements overlap, returning this: {}".format(element_info))
-            return candidate_element
-        distance = _calculate_closest_distance(locator_element, candidate_element)
-        logger.debug("Candidate {}: distance: {}".format(candidate_element, distance))
-
+    for i, distance in enumerate(distances.tolist()):
+        logger.debug("Candidate {}: distance: {}".format(i, distance))
         if abs(distance - closest_distance) < 2:
-            closest_element_list.append(candidate_element)
+            closest_indexes.append(i)
             closest_distance = distance
         elif distance < closest_distance:
             closest_distance = distance
-            closest_element_list = [candidate_element]
+            closest_indexes = [i]
     # if search direction is "forced" and closest distance is in default value
     # then we don't have the element on correct direction from the anchor
     enforce_direction = CONFIG.enforce_direction()
@@ -138,11 +150,102 @@ def get_closest_element(
         logger.debug(f'No elements in expected direction {CONFIG.get_value("SearchDirection")}')
         raise QWebElementNotFoundError("No elements found in enforced direction")
 
-    closest_element = _get_closest_ortho_element(locator_element, closest_element_list)
+    index = _closest_ortho_index(anchor_rect, candidate_rects, closest_indexes)
 
     logger.debug(f"Closest distance found is {closest_distance}")
-    logger.debug(f"Closest element is: {_list_info(closest_element)}")
-    return closest_element
+    if debug:
+        logger.debug(f"Closest element is: OuterHTML: {html[index + 1]}")
+    return candidate_elements[index]
+
+
+def _get_bounding_rects(
+    elements: list[WebElement], with_html: bool = False
+) -> tuple[np.ndarray, list[str]]:
+    """Return (x, y, width, height) rows for elements and their outerHTML if requested.
+
+    Uses one javascript call for all elements. Falls back to reading location and
+    size of each element if javascript can't be executed.
+    """
+    try:
+        result = javascript.get_bounding_rects(elements, with_html)
+        if isinstance(result, dict):
+            rects = np.asarray(result["rects"], dtype=float).reshape(-1, 4)
+            if len(rects) == len(elements):
+                return rects, result["html"] or []
+    except (QWebDriverError, WebDriverException, AttributeError, TypeError, KeyError,
+            ValueError) as e:
+        logger.debug(f"Could not get bounding rects with javascript: {e}")
+    rects = np.array(
+        [[e.location["x"], e.location["y"], e.size["width"], e.size["height"]] for e in elements],
+        dtype=float,
+    )
+    html = [_list_info(e) for e in elements] if with_html else []
+    return rects, html
+
+
+def _rect_corners(rects: np.ndarray) -> np.ndarray:
+    """Return corners (top left, top right, bottom left, bottom right) of rects as (N, 4, 2)."""
+    x, y, w, h = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+    xs = np.stack([x, x + w, x, x + w], axis=1)
+    ys = np.stack([y, y, y + h, y + h], axis=1)
+    return np.stack([xs, ys], axis=2)
+
+
+def _in_direction(angles: np.ndarray, search_direction: str) -> np.ndarray:
+    """Return mask of angles (degrees) that are in arc of given search direction."""
+    direction = search_direction.rstrip("!")
+    if direction == "down":
+        return (angles > 5) & (angles < 175)
+    if direction == "up":
+        return (angles > -175) & (angles < -5)
+    if direction == "left":
+        return np.abs(angles) > 95
+    if direction == "right":
+        return (angles > -85) & (angles < 85)
+    return np.ones(angles.shape, dtype=bool)
+
+
+def _closest_distances(
+    anchor_rect: np.ndarray, rects: np.ndarray, search_direction: str
+) -> np.ndarray:
+    """Return closest Manhattan distance between corners of anchor rect and each rect.
+
+    Distances of corners that are not in search direction are DEFAULT_DISTANCE.
+    """
+    anchor_corners = _rect_corners(anchor_rect.reshape(1, 4))[0]
+    # delta[n, i, j] is vector from anchor corner i to candidate n corner j
+    delta = _rect_corners(rects)[:, None, :, :] - anchor_corners[None, :, None, :]
+    distances = np.abs(delta).sum(axis=-1)
+    if search_direction != "closest":
+        # y coordinate goes up downwards on page
+        angles = np.degrees(np.arctan2(delta[..., 1], delta[..., 0]))
+        distances = np.where(_in_direction(angles, search_direction), distances, DEFAULT_DISTANCE)
+    distances = np.where(distances > 0, distances, DEFAULT_DISTANCE)
+    return np.minimum(distances.reshape(len(rects), -1).min(axis=1), DEFAULT_DISTANCE)
+
+
+def _overlaps(anchor_rect: np.ndarray, rects: np.ndarray) -> np.ndarray:
+    """Return mask of rects that overlap with anchor rect."""
+    x, y, w, h = anchor_rect
+    return (
+        (x <= rects[:, 0] + rects[:, 2])
+        & (rects[:, 0] <= x + w)
+        & (y <= rects[:, 1] + rects[:, 3])
+        & (rects[:, 1] <= y + h)
+    )
+
+
+def _closest_ortho_index(anchor_rect: np.ndarray, rects: np.ndarray, indexes: list[int]) -> int:
+    """Return index of rect having shortest ortho distance between centers to anchor."""
+    if len(indexes) == 1:
+        return indexes[0]
+    if not indexes:
+        raise IndexError
+    anchor_center = anchor_rect[:2] + anchor_rect[2:] / 2
+    centers = rects[indexes, :2] + rects[indexes, 2:] / 2
+    ortho = np.abs(centers - anchor_center).min(axis=1)
+    logger.debug("Candidates {}: ortho distances: {}".format(indexes, ortho.tolist()))
+    return indexes[int(np.argmin(ortho))]
 
 
 def get_unique_element_by_xpath(
@@ -355,201 +458,6 @@ def draw_borders(elements: Union[WebElement, list[WebElement]]) -> None:
             javascript.highlight_element(e, False, True, color=color)
 
 
-def _calculate_closest_distance(element1: WebElement, element2: WebElement) -> float:
-    """Calculate closest distance between elements in pixel units.
-
-    Gets corners' locations for both elements and use them to calculate the
-    closest distance between the elements.
-
-    Uses Manhattan distance.
-
-    Parameters
-    ----------
-    element1 : WebElement
-    element2 : WebElement
-
-    Returns
-    -------
-    float
-    """
-    search_direction = CONFIG["SearchDirection"]
-    corners_locations1 = _get_corners_locations(element1)
-    corners_locations2 = _get_corners_locations(element2)
-    closest_distance = DEFAULT_DISTANCE
-    for corner1 in corners_locations1:
-        for corner2 in corners_locations2:
-            distance = _manhattan_distance(corner1["x"], corner1["y"], corner2["x"], corner2["y"])
-            if search_direction != "closest":
-                # y coordinate goes up downwards on page
-                # small y is above
-                angle = math.degrees(
-                    math.atan2(corner2["y"] - corner1["y"], corner2["x"] - corner1["x"])
-                )
-
-            if search_direction in ("down", "down!"):
-                if not 5 < angle < 175:
-                    logger.debug(
-                        "Search direction is {} and element is not in arc".format(search_direction)
-                    )
-                    distance = DEFAULT_DISTANCE
-            elif search_direction in ("up", "up!"):
-                if not -175 < angle < -5:
-                    logger.debug(
-                        "Search direction is {} and element is not in arc".format(search_direction)
-                    )
-                    distance = DEFAULT_DISTANCE
-            elif search_direction in ("left", "left!"):
-                if not abs(angle) > 95:
-                    logger.debug(
-                        "Search direction is {} and element is not in arc".format(search_direction)
-                    )
-                    distance = DEFAULT_DISTANCE
-            elif search_direction in ("right", "right!"):
-                if not -85 < angle < 85:
-                    logger.debug(
-                        "Search direction is {} and element is not in arc".format(search_direction)
-                    )
-                    distance = DEFAULT_DISTANCE
-
-            if closest_distance > distance > 0:
-                closest_distance = distance
-    return closest_distance
-
-
-def _calculate_closest_ortho_distance(element1: WebElement, element2: WebElement) -> float:
-    """Returns shortest ortho  distance between locator and candidate element centers
-
-    Parameters
-    ----------
-    element1 : WebElement
-    element2 : WebElement
-
-    Returns
-    -------
-    float
-    """
-    center_1 = _get_center_location(element1)
-    center_2 = _get_center_location(element2)
-    distance_h = abs(center_1["x"] - center_2["x"])
-    distance_v = abs(center_1["y"] - center_2["y"])
-    return min(distance_h, distance_v)
-
-
-def _get_center_location(element: WebElement) -> dict[str, float]:
-    """Calculate rectangle's center locations
-
-       Each element on a web page is in a rectangle. Uses the WebElement's
-    location and size attributes to get center.
-
-    Parameters
-    ----------
-    element : WebElement
-
-    Returns
-    -------
-    tuple
-        A tuple with 2 elements: center x and y coordinates.
-    """
-    location = element.location
-    size = element.size
-    center = {"x": location["x"] + (size["width"] / 2), "y": location["y"] + (size["height"] / 2)}
-    return center
-
-
-def _get_corners_locations(
-    element: WebElement,
-) -> tuple[dict[str, float], dict[str, float], dict[str, float], dict[str, float]]:
-    """Calculate rectangle's corners' locations
-
-    Each element on a web page is in a rectangle. Uses the WebElement's
-    location and size attributes to get all corners.
-
-    Parameters
-    ----------
-    element : WebElement
-
-    Returns
-    -------
-    tuple
-        A tuple with 4 elements: top left corner, top right corner, bottom
-        left corner, bottom right corner.
-    """
-    location = element.location
-    size = element.size
-    top_left_corner = {"x": location["x"], "y": location["y"]}
-    top_right_corner = {"x": location["x"] + size["width"], "y": location["y"]}
-    bottom_left_corner = {"x": location["x"], "y": location["y"] + size["height"]}
-    bottom_right_corner = {"x": top_right_corner["x"], "y": bottom_left_corner["y"]}
-    corners_locations = (top_left_corner, top_right_corner, bottom_left_corner, bottom_right_corner)
-    return corners_locations
-
-
-def _manhattan_distance(x0: float, y0: float, x1: float, y1: float) -> float:
-    """Get manhattan distance between points (x0, y0) and (x1, y1)."""
-    return abs(x0 - x1) + abs(y0 - y1)
-
-
-def _overlap(element1: WebElement, element2: WebElement) -> float:
-    """Detects if two rectangles overlap"""
-    corners_locations1 = _get_corners_locations(element1)
-    corners_locations2 = _get_corners_locations(element2)
-
-    # pylint: disable=R1728
-    r1_left = min([i["x"] for i in corners_locations1])
-    r1_right = max([i["x"] for i in corners_locations1])
-    r1_top = max([i["y"] for i in corners_locations1])
-    r1_bottom = min([i["y"] for i in corners_locations1])
-
-    r2_left = min([i["x"] for i in corners_locations2])
-    r2_right = max([i["x"] for i in corners_locations2])
-    r2_top = max([i["y"] for i in corners_locations2])
-    r2_bottom = min([i["y"] for i in corners_locations2])
-
-    return _range_overlap(r1_left, r1_right, r2_left, r2_right) and _range_overlap(
-        r1_bottom, r1_top, r2_bottom, r2_top
-    )
-
-
-def _range_overlap(a_min: float, a_max: float, b_min: float, b_max: float) -> float:
-    """Neither range is completely greater than the other"""
-    return (a_min <= b_max) and (b_min <= a_max)
-
-
-def _get_closest_ortho_element(
-    locator_element: WebElement, element_list: list[WebElement]
-) -> WebElement:
-    """Return closest element by orthogonal distance
-
-    Compares all elements from a list against locator element based on their horizontal
-    or vertical distance. Returns one that has shortest.
-
-    Parameters
-    ----------
-    locator_element : WebElement
-    element_list: list of WebElements
-
-    Returns
-    -------
-    WebElement
-    """
-    list_len = len(element_list)
-    # pylint: disable=no-else-return
-    if list_len == 1:
-        return element_list[0]
-    elif list_len == 0:
-        raise IndexError
-
-    closest_distance = DEFAULT_DISTANCE
-    for candidate_element in element_list:
-        distance = _calculate_closest_ortho_distance(locator_element, candidate_element)
-        logger.debug("Candidate {}: horizontal distance: {}".format(candidate_element, distance))
-        if distance < closest_distance:
-            closest_distance = distance
-            closest_element = candidate_element
-
-    return closest_element
-
-
 def operator_verify(value: str, expected: str, operator: str) -> None:
     """verify value based on given operator / condition"""
     EQUALS = ["equal", "equals", "=="]
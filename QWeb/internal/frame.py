@@ -17,6 +17,7 @@
 from __future__ import annotations
 from typing import Optional, Callable, Any, Union, List
 import os
+import threading
 import time
 from functools import wraps
 from robot.api import logger
@@ -43,6 +44,13 @@ from QWeb.internal.exceptions import (
 from QWeb.internal import xhr, browser, util
 from QWeb.internal.config_defaults import CONFIG
 
+# Frame path (from top document) where each search function last found an element,
+# key: (function name, id of browser)
+_FRAME_AFFINITY: dict[tuple[str, int], tuple[WebElement, ...]] = {}
+FRAME_AFFINITY_STATS: dict[str, int] = {"hits": 0, "misses": 0}
+# RunInBrowsers searches from several threads
+_AFFINITY_LOCK = threading.Lock()
+
 
 def wait_page_loaded() -> None:
     """Wait for webpage to be loaded.
@@ -197,13 +205,17 @@ def all_frames(fn: Callable[..., Any]) -> Callable[..., Any]:
         # Default behavior is not to continue searching
         continue_search = kwargs.get("continue_search", False)
 
+        keep_frame = kwargs.get("stay_in_current_frame", CONFIG["StayInCurrentFrame"])
+        affinity = CONFIG["FrameAffinity"] and not continue_search and not keep_frame
+
         # pylint: disable=too-many-branches
         def search_from_frames(
-            driver: Optional[WebDriver] = None, current_frame: Optional[WebElement] = None
+            driver: Optional[WebDriver] = None,
+            current_frame: Optional[WebElement] = None,
+            path: tuple[WebElement, ...] = (),
         ) -> Union[List[Any], Any]:
             # Initialize the list to store found elements if continue_search is True
             all_elements = []
-            keep_frame = kwargs.get("stay_in_current_frame", CONFIG["StayInCurrentFrame"])
             if keep_frame:
                 return fn(*args, **kwargs)
 
@@ -218,6 +230,7 @@ def all_frames(fn: Callable[..., Any]) -> Callable[..., Any]:
                     logger.debug(f"Switching to child frame {str(fn)}")
                 except (StaleElementReferenceException, WebDriverException) as e:
                     logger.debug(str(e))
+                    fc.clear_frame_cache()
                     driver.switch_to.default_content()
                     raise e
 
@@ -229,6 +242,9 @@ def all_frames(fn: Callable[..., Any]) -> Callable[..., Any]:
 
             if is_valid(web_element):
                 if not continue_search:
+                    if affinity:
+                        with _AFFINITY_LOCK:
+                            _FRAME_AFFINITY[(fn.__name__, id(driver))] = path
                     return web_element
                 if not isinstance(web_element, tuple):
                     web_element = list(web_element)
@@ -238,12 +254,15 @@ def all_frames(fn: Callable[..., Any]) -> Callable[..., Any]:
             start = time.time()
             timeout = CONFIG["FrameTimeout"]
             while time.time() < timeout + start:
-                frames = fc.check_frames(driver)
+                frames_key, frames = fc.get_frames(driver, reorder=not continue_search)
                 for frame in frames:
-                    web_element = search_from_frames(driver=driver, current_frame=frame)
+                    web_element = search_from_frames(
+                        driver=driver, current_frame=frame, path=(*path, frame)
+                    )
                     if is_valid(web_element):
                         logger.debug(f"Found web element = {web_element}")
                         if not continue_search:
+                            fc.remember_hit(frames_key, frame)
                             return web_element
                         if not isinstance(web_element, tuple):
                             web_element = list(web_element)
@@ -345,12 +364,60 @@ def all_frames(fn: Callable[..., Any]) -> Callable[..., Any]:
 
         if util.is_safari():
             return search_from_frames_safari()
+        if affinity:
+            web_element = _search_from_last_frame(fn, *args, **kwargs)
+            if is_valid(web_element):
+                return web_element
         return search_from_frames()
 
     logger.debug("wrapped = {}".format(wrapped))
     return wrapped
 
 
+def _search_from_last_frame(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Search element from the frame where fn last found an element.
+
+    Returns None if there is no stored frame or element is not found from it.
+    Updates FRAME_AFFINITY_STATS.
+    """
+    driver = browser.get_current_browser()
+    key = (fn.__name__, id(driver))
+    with _AFFINITY_LOCK:
+        path = _FRAME_AFFINITY.get(key)
+    if not path:
+        return None
+    try:
+        driver.switch_to.default_content()
+        for frame in path:
+            driver.switch_to.frame(frame)
+        web_element = fn(*args, **kwargs)
+    except (QWebElementNotFoundError, StaleElementReferenceException, WebDriverException) as e:
+        logger.debug(f"Element not found from last used frame: {e}")
+        web_element = None
+    if is_valid(web_element):
+        with _AFFINITY_LOCK:
+            FRAME_AFFINITY_STATS["hits"] += 1
+        logger.debug(f"Found element from last used frame, depth {len(path)}")
+        return web_element
+    with _AFFINITY_LOCK:
+        FRAME_AFFINITY_STATS["misses"] += 1
+        _FRAME_AFFINITY.pop(key, None)
+    driver.switch_to.default_content()
+    return None
+
+
+def get_frame_affinity_stats() -> dict[str, int]:
+    with _AFFINITY_LOCK:
+        return dict(FRAME_AFFINITY_STATS)
+
+
+def reset_frame_affinity() -> None:
+    with _AFFINITY_LOCK:
+        _FRAME_AFFINITY.clear()
+        FRAME_AFFINITY_STATS["hits"] = 0
+        FRAME_AFFINITY_STATS["misses"] = 0
+
+
 def is_valid(web_element: Any) -> bool:
     if web_element and not isinstance(web_element, tuple):
         return True
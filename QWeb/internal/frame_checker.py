@@ -15,13 +15,27 @@
 # limitations under the License.
 # ---------------------------
 from __future__ import annotations
+from typing import Optional
+import threading
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 
 from robot.api import logger
 from QWeb.internal import javascript
 from QWeb.internal.config_defaults import CONFIG
+from QWeb.internal.exceptions import QWebDriverError
+
+FrameKey = tuple[str, str]
+
+# Visible frames per document, key: (document id, url), value: (generation, frames)
+_FRAME_CACHE: dict[FrameKey, tuple[int, list[WebElement]]] = {}
+# Frame where element was last found, per document
+_LAST_HIT: dict[FrameKey, WebElement] = {}
+MAX_CACHED_DOCUMENTS = 100
+# RunInBrowsers searches from several threads
+_CACHE_LOCK = threading.Lock()
 
 
 def check_frames(driver: WebDriver, **kwargs) -> list[WebElement]:
@@ -46,3 +60,61 @@ def check_frames(driver: WebDriver, **kwargs) -> list[WebElement]:
     if visible_frames:
         logger.debug("Found {} visible frames".format(len(visible_frames)))
     return visible_frames
+
+
+def get_frames(
+    driver: WebDriver, reorder: bool = True
+) -> tuple[Optional[FrameKey], list[WebElement]]:
+    """Return visible frames of current document, using cache if FrameCache is on.
+
+    Cached frames are reused as long as the document is same and no frames have
+    been added, removed or changed in it. If reorder is True, the frame where
+    element was last found is returned first.
+
+    Returns
+    -------
+    tuple
+        Cache key of current document (None if cache is not used) and list of frames.
+    """
+    if not CONFIG["FrameCache"] or CONFIG["ShadowDOM"]:
+        return None, check_frames(driver)
+    try:
+        state = javascript.get_frame_state()
+    except (WebDriverException, QWebDriverError) as e:
+        logger.debug(f"Unable to get frame state: {e}")
+        return None, check_frames(driver)
+    if not isinstance(state, dict) or state.get("gen", -1) < 0:
+        return None, check_frames(driver)
+
+    key = (state["id"], state["url"])
+    with _CACHE_LOCK:
+        cached = _FRAME_CACHE.get(key)
+    if cached and cached[0] == state["gen"]:
+        frames = cached[1]
+        logger.debug(f"Using {len(frames)} cached frames for {state['url']}")
+    else:
+        frames = check_frames(driver)
+        with _CACHE_LOCK:
+            if len(_FRAME_CACHE) >= MAX_CACHED_DOCUMENTS:
+                _FRAME_CACHE.clear()
+                _LAST_HIT.clear()
+            _FRAME_CACHE[key] = (state["gen"], frames)
+
+    with _CACHE_LOCK:
+        last_hit = _LAST_HIT.get(key)
+    if reorder and last_hit is not None and last_hit in frames:
+        frames = [last_hit] + [f for f in frames if f != last_hit]
+    return key, frames
+
+
+def remember_hit(key: Optional[FrameKey], frame: WebElement) -> None:
+    """Store frame where element was found so it is searched first next time."""
+    if key is not None:
+        with _CACHE_LOCK:
+            _LAST_HIT[key] = frame
+
+
+def clear_frame_cache() -> None:
+    with _CACHE_LOCK:
+        _FRAME_CACHE.clear()
+        _LAST_HIT.clear()
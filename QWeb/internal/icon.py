@@ -18,20 +18,80 @@ from __future__ import annotations
 from numpy import ndarray
 
 import cv2
+import dataclasses
 import numpy as np
 import math
 import os
+import threading
 from pathlib import Path
-from QWeb.internal import frame, download, util
+from QWeb.internal import frame, download, util, javascript
 from QWeb.internal.meas import MEAS
 from QWeb.internal.screenshot import (
-    save_screenshot,
+    get_screenshot_image,
     log_screenshot_file,
-    SCREEN_SHOT_DIR_NAME,
+    save_image_async,
 )
 from QWeb.internal.config_defaults import CONFIG
 from robot.api import logger
 from uuid import uuid4
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+
+# Downsampling factors tried for coarse search, template must stay at least
+# COARSE_MIN_SIZE pixels. Coarse matches within COARSE_TOLERANCE of the
+# tolerance are refined with full resolution.
+COARSE_FACTORS: tuple[float, ...] = (0.25, 0.5)
+COARSE_MIN_SIZE: int = 8
+COARSE_TOLERANCE: float = 0.25
+COARSE_CANDIDATES: int = 5
+
+# Keypoint matchers for IconMatcher "orb" and "akaze". Matches pass Lowe's
+# ratio test with FEATURE_RATIO, at least FEATURE_MIN_INLIERS of them must
+# agree on icon position and scale. Match is then verified with correlation
+# of scaled template around that position, so tolerance means the same as
+# with template matching.
+FEATURE_MATCHERS: tuple[str, ...] = ("orb", "akaze")
+FEATURE_BORDER: int = 16
+FEATURE_RATIO: float = 0.8
+FEATURE_MIN_INLIERS: int = 4
+ORB_MAX_FEATURES: int = 5000
+AKAZE_THRESHOLD: float = 0.0005
+
+# Decoded and scaled icon templates and their keypoint descriptors,
+# least recently used first.
+# key: (absolute path, mtime, grayscale, scale ratios) or (absolute path, mtime, matcher)
+# value: (entry, size in bytes)
+TEMPLATE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+TemplateKey = tuple[Any, ...]
+_TEMPLATE_CACHE: OrderedDict[TemplateKey, tuple[Any, int]] = OrderedDict()
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+TEMPLATE_CACHE_STATS: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+
+@dataclasses.dataclass
+class IconMatch:
+    """Best match of one needle. Location is the center of the match in
+    device pixels, (-1, -1) when nothing correlated. Boxes (x, y, width,
+    height) in screenshot pixels are all matches of found icon when drawn
+    (draw is 1 and LogMatchedIcons is on)."""
+
+    found: bool
+    score: float
+    location: tuple[int, int]
+    scale_ratio: float
+    template: ndarray
+    matched_image: ndarray
+    boxes: list[tuple[int, int, int, int]] = dataclasses.field(default_factory=list)
+
+
+_VIEWPORT_JS = (
+    "return {innerWidth: window.innerWidth, innerHeight: window.innerHeight, "
+    "outerWidth: window.outerWidth, outerHeight: window.outerHeight, "
+    "screenX: window.screenX, screenY: window.screenY, screenWidth: screen.width};"
+)
 
 
 class QIcon:
@@ -155,6 +215,179 @@ class QIcon:
                     )
         return image_levels
 
+    @classmethod
+    def _match_scale(
+        cls,
+        haystack: ndarray,
+        coarse_haystack: Optional[ndarray],
+        factor: Optional[float],
+        tolerance: float,
+        scaled_template: ndarray,
+    ) -> tuple[float, tuple[int, int], list[tuple[int, int]]]:
+        """Match scaled template against haystack. Uses coarse to fine search
+        when coarse_haystack is given. Returns best correlation value, its top
+        left location and locations over tolerance.
+        """
+        if any(t > h for t, h in zip(scaled_template.shape[:2], haystack.shape[:2])):
+            # template doesn't fit to (region of) haystack
+            return 0.0, (-1, -1), []
+        if coarse_haystack is not None and factor:
+            max_val, top_left = cls._match_coarse_to_fine(
+                haystack, coarse_haystack, scaled_template, factor, tolerance
+            )
+            return max_val, top_left, [top_left]
+        res = cv2.matchTemplate(haystack, scaled_template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, top_left = cv2.minMaxLoc(res)
+        matches = list(zip(*np.where(res >= tolerance)[::-1])) if max_val > tolerance else []
+        return max_val, top_left, matches
+
+    @staticmethod
+    def _get_coarse_factor(height: float, width: float) -> Optional[float]:
+        """Returns scale factor for coarse search or None if template is too small
+        to be downsampled. Template is kept at least COARSE_MIN_SIZE pixels.
+        """
+        for factor in COARSE_FACTORS:
+            if min(height, width) * factor >= COARSE_MIN_SIZE:
+                return factor
+        return None
+
+    @staticmethod
+    def _match_coarse_to_fine(
+        haystack: ndarray,
+        coarse_haystack: ndarray,
+        template: ndarray,
+        factor: float,
+        threshold: float,
+    ) -> tuple[float, tuple[int, int]]:
+        """Match downsampled template against downsampled haystack and refine
+        the best candidates by matching full resolution template only around them.
+        Returns the best correlation value and top left location in haystack.
+        Value is 0.0 if no coarse match is within COARSE_TOLERANCE of threshold.
+        """
+        hay_h, hay_w = haystack.shape[:2]
+        h, w = template.shape[:2]
+        if h > hay_h or w > hay_w:
+            return 0.0, (-1, -1)
+        coarse_template = cv2.resize(
+            template, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA
+        )
+        coarse_h, coarse_w = coarse_template.shape[:2]
+        if coarse_h > coarse_haystack.shape[0] or coarse_w > coarse_haystack.shape[1]:
+            return 0.0, (-1, -1)
+        res = cv2.matchTemplate(coarse_haystack, coarse_template, cv2.TM_CCOEFF_NORMED)
+        # coarse location is accurate to one downsampled pixel
+        margin = int(math.ceil(1 / factor)) + 2
+        best_val = 0.0
+        best_loc = (-1, -1)
+        for _ in range(COARSE_CANDIDATES):
+            _, coarse_val, _, (coarse_x, coarse_y) = cv2.minMaxLoc(res)
+            if coarse_val < threshold - COARSE_TOLERANCE:
+                break
+            x = min(int(round(coarse_x / factor)), hay_w - w)
+            y = min(int(round(coarse_y / factor)), hay_h - h)
+            x1, y1 = max(x - margin, 0), max(y - margin, 0)
+            region = haystack[y1 : y + h + margin, x1 : x + w + margin]  # noqa: E203
+            fine = cv2.matchTemplate(region, template, cv2.TM_CCOEFF_NORMED)
+            _, val, _, (fine_x, fine_y) = cv2.minMaxLoc(fine)
+            if val > best_val:
+                best_val = val
+                best_loc = (x1 + fine_x, y1 + fine_y)
+            if best_val >= threshold:
+                break
+            res[
+                max(coarse_y - coarse_h // 2, 0) : coarse_y + coarse_h // 2 + 1,  # noqa: E203
+                max(coarse_x - coarse_w // 2, 0) : coarse_x + coarse_w // 2 + 1,  # noqa: E203
+            ] = -1.0
+        logger.debug(f"Coarse to fine match {best_val} at {best_loc}, factor {factor}")
+        return best_val, best_loc
+
+    @staticmethod
+    def _match_features(
+        needle: str,
+        template: ndarray,
+        image_haystack: ndarray,
+        matcher: str,
+        haystack_features: Optional[tuple[ndarray, Optional[ndarray]]] = None,
+    ) -> Optional[tuple[float, tuple[int, int], float, ndarray]]:
+        """Locate template by matching its keypoints to haystack keypoints.
+
+        Position and scale agreed by matched keypoints are verified by
+        correlating the scaled template around that position.
+        Returns (correlation, top left, scale ratio, scaled template), correlation
+        is 0.0 if keypoints don't agree. Returns None if template has too few
+        keypoints to be matched this way.
+        """
+        points, descriptors = get_template_features(needle, matcher)
+        if descriptors is None or len(points) < FEATURE_MIN_INLIERS:
+            return None
+        no_match = (0.0, (-1, -1), 1.0, template)
+
+        if haystack_features is None:
+            gray_haystack = (
+                image_haystack
+                if image_haystack.ndim == 2
+                else cv2.cvtColor(image_haystack, cv2.COLOR_BGR2GRAY)
+            )
+            haystack_features = _detect_features(gray_haystack, matcher)
+        hay_points, hay_descriptors = haystack_features
+        if hay_descriptors is None or len(hay_points) < 2:
+            return no_match
+
+        pairs = cv2.BFMatcher(cv2.NORM_HAMMING).knnMatch(descriptors, hay_descriptors, k=2)
+        good = [
+            pair[0]
+            for pair in pairs
+            if len(pair) == 2 and pair[0].distance < FEATURE_RATIO * pair[1].distance
+        ]
+        if len(good) < FEATURE_MIN_INLIERS:
+            return no_match
+        # translation, rotation and uniform scale
+        transform, inliers = cv2.estimateAffinePartial2D(
+            points[[m.queryIdx for m in good]],
+            hay_points[[m.trainIdx for m in good]],
+            method=cv2.RANSAC,
+            ransacReprojThreshold=3.0,
+        )
+        if transform is None or int(inliers.sum()) < FEATURE_MIN_INLIERS:
+            return no_match
+
+        height, width = template.shape[:2]
+        scale = float(np.hypot(transform[0, 0], transform[1, 0]))
+        center_x, center_y = transform @ (width / 2, height / 2, 1.0)
+        # estimated scale can be a pixel off, verify neighbouring sizes too
+        best = no_match
+        for scaled_w in range(int(round(width * scale)) - 1, int(round(width * scale)) + 2):
+            scale_ratio = scaled_w / width
+            interpolation_method = cv2.INTER_LINEAR if scale_ratio > 1.0 else cv2.INTER_AREA
+            scaled_template = cv2.resize(
+                template, None, fx=scale_ratio, fy=scale_ratio, interpolation=interpolation_method
+            )
+            scaled_h, scaled_w = scaled_template.shape[:2]
+            if min(scaled_h, scaled_w) < COARSE_MIN_SIZE:
+                continue
+            margin = max(4, int(0.1 * max(scaled_h, scaled_w)))
+            x1 = max(int(center_x - scaled_w / 2) - margin, 0)
+            y1 = max(int(center_y - scaled_h / 2) - margin, 0)
+            roi = image_haystack[
+                y1 : y1 + scaled_h + 2 * margin, x1 : x1 + scaled_w + 2 * margin  # noqa: E203
+            ]
+            if roi.shape[0] < scaled_h or roi.shape[1] < scaled_w:
+                continue
+            res = cv2.matchTemplate(roi, scaled_template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(res)
+            if max_val > best[0]:
+                best = (
+                    float(max_val),
+                    (x1 + max_loc[0], y1 + max_loc[1]),
+                    scale_ratio,
+                    scaled_template,
+                )
+        logger.debug(
+            f"{len(good)} {matcher} keypoint matches, {int(inliers.sum())} inliers, "
+            f"scale {scale:.3f}, correlation {best[0]}"
+        )
+        return best
+
     def get_template_locations(
         self,
         image_obj: ndarray,
@@ -209,30 +442,24 @@ class QIcon:
 
         logger.debug(f"Different resamplings used: {str(len(template_levels))} ")
 
-        MEAS.start("WHOLE TEMPLATE MATCHING AND POINT EXTRACTION TIME")
-        for template_level in template_levels:
+        def match_level(template_level: tuple[ndarray, float]) -> tuple:
             w, h = self._get_image_size(template_level[0])
-            logger.debug(
-                f"Resampled needle (template_level) with scale {template_level[1]},"
-                "image size: {w}x{h}"
-            )
-            MEAS.start("CV2.MATCHTEMPLATE TIME")
             res = cv2.matchTemplate(image_levels[0][0], template_level[0], cv2.TM_CCOEFF_NORMED)
-            MEAS.stop()
-            MEAS.start("EXTRACT POINTS TIME")
-            current_points, highest_max_val, highest_max_val_loc = self._extract_points(
-                h, res, threshold, w
-            )
-            MEAS.stop()
-
-            if highest_max_val > best_highest_max_val:
-                best_highest_max_val = highest_max_val
-                best_highest_max_val_loc = highest_max_val_loc
-                points = current_points
-                best_scale = template_level[1]
-                best_matched_image = template_level[0]
-                if best_highest_max_val >= threshold:
-                    break
+            return self._extract_points(h, res, threshold, w)
+
+        MEAS.start("WHOLE TEMPLATE MATCHING AND POINT EXTRACTION TIME")
+        with closing(_map_in_order(match_level, template_levels)) as results:
+            for template_level, (current_points, highest_max_val, highest_max_val_loc) in zip(
+                template_levels, results
+            ):
+                if highest_max_val > best_highest_max_val:
+                    best_highest_max_val = highest_max_val
+                    best_highest_max_val_loc = highest_max_val_loc
+                    points = current_points
+                    best_scale = template_level[1]
+                    best_matched_image = template_level[0]
+                    if best_highest_max_val >= threshold:
+                        break
         MEAS.stop()
 
         if points:
@@ -266,111 +493,213 @@ class QIcon:
     def image_location(
         self,
         needle: str,
-        haystack: str,
+        haystack: Union[str, ndarray],
         tolerance: float = 0.95,
         draw: int = 1,
         template_res_w: int = 1440,
         device_res_w: int = 1080,
         grayscale: bool = True,
+        region: Optional[tuple[int, int, int, int]] = None,
+        matcher: Optional[str] = None,
     ) -> tuple[int, int]:
         """Locate an image (needle) within an bigger image (haystack). Tolarance
         is pixel tolerance, i.e. 1.0 = all pixels are correct, 0.5 = 50% of the pixels
         are correct. If we know the original resolution, from which the template
         image is coming, we can supply it as template_res_w.
+        Haystack is a path to image file or an image as BGR NumPy array.
+        Region (x, y, width, height) in haystack pixels limits the search to that
+        part of haystack, returned location is still relative to whole haystack.
+        Matcher is "template", "orb" or "akaze", IconMatcher configuration by default.
         Return value is the central (x,y) of the first image found.
-        Draw function will plot red lines where needle image is found.
+        Draw function will plot red lines where needle image is found to the
+        image logged with LogMatchedIcons.
         """
 
         logger.info("_image_location Starts")
 
-        image = cv2.imread(haystack)
+        # haystack is either image file or screenshot decoded to BGR array
+        image = cv2.imread(haystack) if isinstance(haystack, str) else haystack
         image_haystack = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if grayscale else image
-        _hay_h, hay_w = image_haystack.shape[:2]
+        image_haystack, offset = self._crop_region(image_haystack, region)
 
-        needle_path = Path(needle)
-        if not needle_path.exists():
-            raise FileNotFoundError(f"Needle file does not exist. Tried: {needle_path}")
-        template = (
-            cv2.imread(str(needle_path.resolve()), 0)
-            if grayscale
-            else cv2.imread(str(needle_path.resolve()), cv2.IMREAD_COLOR)
-        )  # Read in color
+        match = self.match_needle(
+            needle,
+            image,
+            image_haystack,
+            offset,
+            tolerance=tolerance,
+            draw=draw,
+            template_res_w=template_res_w,
+            device_res_w=device_res_w,
+            matcher=matcher,
+        )
+        self._log_matched_image(
+            image,
+            match.template,
+            match.matched_image,
+            match.location,
+            match.scale_ratio,
+            grayscale=grayscale,
+            boxes=match.boxes,
+        )
 
-        if template is None:
-            raise FileNotFoundError(f"Cannot read template image. Tried: {needle}")
+        if match.found:
+            return match.location
 
-        height, width = template.shape[:2]
+        return -1, -1
 
-        scale_ratios = self._get_scale_ratios(template_res_w, device_res_w)
-        logger.debug(f"Scale ratios to be used in order: {scale_ratios}")
+    @staticmethod
+    def _crop_region(
+        image_haystack: ndarray, region: Optional[tuple[int, int, int, int]]
+    ) -> tuple[ndarray, tuple[int, int]]:
+        """Returns region (x, y, width, height) of haystack and its offset."""
+        if not region:
+            return image_haystack, (0, 0)
+        hay_h, hay_w = image_haystack.shape[:2]
+        offset_x, offset_y = min(max(region[0], 0), hay_w), min(max(region[1], 0), hay_h)
+        logger.debug(f"Searching from region {region} of {hay_w}x{hay_h} image")
+        cropped = image_haystack[
+            offset_y : region[1] + region[3], offset_x : region[0] + region[2]  # noqa: E203
+        ]
+        return cropped, (offset_x, offset_y)
 
-        best_highest_max_val = 0.0
-        best_highest_max_val_loc = (-1, -1)
-        best_scale_ratio: float  # = None
-        best_matched_image: ndarray  # = None
+    def match_needle(
+        self,
+        needle: str,
+        image: ndarray,
+        image_haystack: ndarray,
+        offset: tuple[int, int] = (0, 0),
+        tolerance: float = 0.95,
+        draw: int = 1,
+        template_res_w: int = 1440,
+        device_res_w: int = 1080,
+        workers: Optional[int] = None,
+        matcher: Optional[str] = None,
+        haystack_features: Optional[tuple[ndarray, Optional[ndarray]]] = None,
+    ) -> IconMatch:
+        """Search needle from preprocessed (grayscale or BGR, cropped) haystack.
 
-        logger.debug("Resampling loop Starts")
-        for scale_ratio in scale_ratios:
-            interpolation_method = cv2.INTER_LINEAR if scale_ratio > 1.0 else cv2.INTER_AREA
+        Image is the original BGR screenshot used for device resolution and
+        drawing, offset is the position of image_haystack in it. Haystack
+        is only read, so one capture can be matched against several needles
+        in parallel when draw is 0.
+        Matcher is "template" or keypoint matcher "orb" / "akaze", IconMatcher
+        configuration by default. Keypoint matchers find icon at any scale
+        and use haystack_features if already detected.
+        """
+        hay_w = image.shape[1]
+        offset_x, offset_y = offset
+        grayscale = image_haystack.ndim == 2
 
-            logger.debug(f"resize starts: for scale {scale_ratio}")
+        ratio = device_res_w / hay_w
+        if CONFIG.get_value("RetinaDisplay"):
+            ratio = ratio * 2
+        elif ratio < 1.1:
+            ratio = 1.0
 
-            if math.isclose(scale_ratio, 1.0, rel_tol=0.03):
-                scaled_img_template = template
-            else:
-                scaled_img_template = cv2.resize(
-                    template,
-                    None,
-                    fx=scale_ratio,
-                    fy=scale_ratio,
-                    interpolation=interpolation_method,
+        matcher = util.validate_icon_matcher(matcher) if matcher else CONFIG["IconMatcher"]
+        if matcher in FEATURE_MATCHERS:
+            template, _ = get_templates(needle, grayscale, (1.0,))
+            feature_match = self._match_features(
+                needle, template, image_haystack, matcher, haystack_features
+            )
+            if feature_match:
+                score, top_left, scale_ratio, scaled_template = feature_match
+                location = (-1, -1)
+                if score > 0.0:
+                    scaled_h, scaled_w = scaled_template.shape[:2]
+                    location = (
+                        int(round((top_left[0] + offset_x + scaled_w / 2) * ratio)),
+                        int(round((top_left[1] + offset_y + scaled_h / 2) * ratio)),
+                    )
+                logger.debug(
+                    f"{matcher} match location: {location}, correlation value: {score}, "
+                    f"scale ratio: {scale_ratio}"
+                )
+                return IconMatch(
+                    found=score >= tolerance,
+                    score=score,
+                    location=location,
+                    scale_ratio=scale_ratio,
+                    template=template,
+                    matched_image=scaled_template,
                 )
-            logger.debug("matchTemplate Starts:")
+            logger.debug(f"Too few {matcher} keypoints in {needle}, using template matching")
 
-            res = cv2.matchTemplate(image_haystack, scaled_img_template, cv2.TM_CCOEFF_NORMED)
+        scale_ratios = self._get_scale_ratios(template_res_w, device_res_w)
+        logger.debug(f"Scale ratios to be used in order: {scale_ratios}")
 
-            ratio = device_res_w / hay_w
+        template, scaled_templates = get_templates(needle, grayscale, scale_ratios)
+        height, width = template.shape[:2]
 
-            if CONFIG.get_value("RetinaDisplay"):
-                ratio = ratio * 2
-            elif ratio < 1.1:
-                ratio = 1.0
+        best_highest_max_val = 0.0
+        best_highest_max_val_loc = (-1, -1)
+        best_scale_ratio: float  # = None
+        best_matched_image: ndarray  # = None
+        boxes: list[tuple[int, int, int, int]] = []
 
-            logger.debug("_extract_points Starts:")
-            (
-                _current_points,
-                highest_max_val,
-                highest_max_val_loc,
-            ) = self._extract_points(
-                height * scale_ratio, res, tolerance, width * scale_ratio, ratio
+        # Search downsampled images first. If that doesn't find the icon, search
+        # again with full resolution images the scales that had a coarse match
+        # within COARSE_TOLERANCE of tolerance (coarse value is 0.0 otherwise).
+        factor = self._get_coarse_factor(height * min(scale_ratios), width * min(scale_ratios))
+        coarse_haystack = None
+        if factor:
+            coarse_haystack = cv2.resize(
+                image_haystack, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA
             )
+        candidates = list(range(len(scale_ratios)))
+        found = False
+        for coarse in ([True, False] if factor else [False]):
+            logger.debug(f"Resampling loop Starts, coarse to fine: {coarse}, scales: {candidates}")
+            match_scale = partial(
+                self._match_scale,
+                image_haystack,
+                coarse_haystack if coarse else None,
+                factor,
+                tolerance,
+            )
+            templates = [scaled_templates[i] for i in candidates]
+            near = []
+            with closing(_map_in_order(match_scale, templates, workers)) as results:
+                for index, (highest_max_val, top_left, matches) in zip(candidates, results):
+                    scale_ratio = scale_ratios[index]
+                    scaled_img_template = scaled_templates[index]
+                    if highest_max_val > 0.0:
+                        near.append(index)
+                    highest_max_val_loc = (
+                        int(round((top_left[0] + offset_x + width * scale_ratio / 2) * ratio)),
+                        int(round((top_left[1] + offset_y + height * scale_ratio / 2) * ratio)),
+                    )
+                    if highest_max_val > best_highest_max_val:
+                        best_highest_max_val = highest_max_val
+                        best_highest_max_val_loc = highest_max_val_loc
 
-            if highest_max_val > best_highest_max_val:
-                best_highest_max_val = highest_max_val
-                best_highest_max_val_loc = highest_max_val_loc
-
-                best_scale_ratio = scale_ratio
-                best_matched_image = scaled_img_template
-                logger.debug(
-                    f"Current best match location: {best_highest_max_val_loc},\n"
-                    f"max_value: {best_highest_max_val},\n"
-                    f"scale_ratio: {best_scale_ratio}"
-                )
+                        best_scale_ratio = scale_ratio
+                        best_matched_image = scaled_img_template
+                        logger.debug(
+                            f"Current best match location: {best_highest_max_val_loc},\n"
+                            f"max_value: {best_highest_max_val},\n"
+                            f"scale_ratio: {best_scale_ratio}"
+                        )
 
-                if best_highest_max_val > tolerance:
-                    if draw == 1:
-                        loc = np.where(res >= tolerance)
-
-                        for pt in zip(*loc[::-1]):
-                            cv2.rectangle(
-                                image,
-                                pt,
-                                (pt[0] + width, pt[1] + height),
-                                (0, 0, 255),
-                                2,
-                            )
-                        cv2.imwrite("temp_matched_area.png", image)
-                    break
+                        if best_highest_max_val > tolerance:
+                            if draw == 1 and CONFIG.get_value("LogMatchedIcons"):
+                                if coarse:
+                                    # coarse search refines only the best match
+                                    matches = self._match_scale(
+                                        image_haystack, None, None, tolerance,
+                                        scaled_img_template,
+                                    )[2]
+                                scaled_h, scaled_w = scaled_img_template.shape[:2]
+                                boxes = [
+                                    (x + offset_x, y + offset_y, scaled_w, scaled_h)
+                                    for x, y in matches
+                                ]
+                            found = True
+                            break
+            if found:
+                break
+            candidates = near
 
         # No match found, set to a default scale ratio and original image
         if best_highest_max_val == 0.0:
@@ -383,20 +712,16 @@ class QIcon:
             f"Best match location: {best_highest_max_val_loc}, "
             f"best correlation value: {best_highest_max_val}, best scale ratio: {best_scale_ratio}"
         )
-        self._log_matched_image(
-            image,
-            template,
-            best_matched_image,
-            best_highest_max_val_loc,
-            best_scale_ratio,
-            grayscale=grayscale,
+        return IconMatch(
+            found=best_highest_max_val >= tolerance,
+            score=float(best_highest_max_val),
+            location=best_highest_max_val_loc,
+            scale_ratio=best_scale_ratio,
+            template=template,
+            matched_image=best_matched_image,
+            boxes=boxes,
         )
 
-        if best_highest_max_val >= tolerance:
-            return best_highest_max_val_loc
-
-        return -1, -1
-
     @staticmethod
     def _extract_points(
         height: int,
@@ -429,19 +754,12 @@ class QIcon:
                     int(round((top_left[1] + height / 2) * coordinate_ratio)),
                 )
             if max_val > threshold:
-                # flood fill the already found area
-                for loc_x in range(
-                    int(round(top_left[0] - width / 2)),
-                    int(round(top_left[0] + width / 2)),
-                ):
-                    for loc_y in range(
-                        int(round(top_left[1] - height / 2)),
-                        int(round(top_left[1] + height / 2)),
-                    ):
-                        try:
-                            res[loc_y][loc_x] = np.float32(-10000)  # -MAX
-                        except IndexError:  # ignore out of bounds
-                            pass
+                # mask the already found area, clipped to result matrix
+                x1 = max(int(round(top_left[0] - width / 2)), 0)
+                x2 = max(int(round(top_left[0] + width / 2)), 0)
+                y1 = max(int(round(top_left[1] - height / 2)), 0)
+                y2 = max(int(round(top_left[1] + height / 2)), 0)
+                res[y1:y2, x1:x2] = np.float32(-10000)  # -MAX
                 points.append(highest_max_val_loc)
                 i += 1
             else:
@@ -463,12 +781,18 @@ class QIcon:
         loc: tuple[int, int],
         best_scale: float,
         grayscale: bool = True,
+        boxes: Sequence[tuple[int, int, int, int]] = (),
     ) -> None:
         """Draw a composite image with the needle image, the haystack image,
         the scaled needle that matches the best and show where in haystack
-        the best match is. This is best used in debugging, but it could be
-        modified to add the image to the Robot log as well.
+        the best match is. Boxes are other drawn matches.
+
+        Composite is rendered only with LogMatchedIcons, it is written to
+        screenshots folder in background and linked to the Robot log.
+        Haystack is not modified.
         """
+        if not CONFIG.get_value("LogMatchedIcons"):
+            return
         if grayscale:
             needle = cv2.cvtColor(needle, cv2.COLOR_GRAY2BGR)
             scaled_needle = cv2.cvtColor(scaled_needle, cv2.COLOR_GRAY2BGR)
@@ -476,18 +800,22 @@ class QIcon:
         hs, ws = scaled_needle.shape[:2]
         h2, w2 = haystack.shape[:2]
         max_left_w = max(w1, ws)
-        cv2.rectangle(
-            haystack,
-            (loc[0] - int(w1 / 2 * best_scale), loc[1] - int(h1 / 2 * best_scale)),
-            (loc[0] + int(w1 / 2 * best_scale), loc[1] + int(h1 / 2 * best_scale)),
-            (0, 0, 255),
-            2,
-        )
-        result = np.zeros((max(h2, h1), w2 + max_left_w, 3), np.uint8)
+        result = np.zeros((max(h2, h1 + hs), w2 + max_left_w, 3), np.uint8)
         result[:h1, :w1, :3] = needle
         result[h1 : h1 + hs, :ws, :3] = scaled_needle  # noqa: E203
         result[:h2, max_left_w : max_left_w + w2, :3] = haystack  # noqa: E203
 
+        for x, y, w, h in boxes:
+            cv2.rectangle(
+                result, (x + max_left_w, y), (x + max_left_w + w, y + h), (0, 0, 255), 2
+            )
+        cv2.rectangle(
+            result,
+            (loc[0] + max_left_w - int(w1 / 2 * best_scale), loc[1] - int(h1 / 2 * best_scale)),
+            (loc[0] + max_left_w + int(w1 / 2 * best_scale), loc[1] + int(h1 / 2 * best_scale)),
+            (0, 0, 255),
+            2,
+        )
         cv2.line(
             result,
             (ws, h1),
@@ -503,12 +831,144 @@ class QIcon:
             2,
         )
 
-        if CONFIG.get_value("LogMatchedIcons"):
-            output = util.get_rfw_variable_value("${OUTPUT DIR}") or os.getcwd()
-            filename = f"temp_matched_image-{uuid4()}.png"
-            filepath = os.path.join(output, SCREEN_SHOT_DIR_NAME, filename)
-            cv2.imwrite(filepath, result)
-            log_screenshot_file(filepath)
+        filepath, _ = save_image_async(result, f"temp_matched_image-{uuid4()}.png")
+        log_screenshot_file(filepath)
+
+
+def get_templates(
+    needle: str, grayscale: bool, scale_ratios: Sequence[float]
+) -> tuple[ndarray, tuple[ndarray, ...]]:
+    """Returns decoded needle image and its versions scaled with scale_ratios.
+
+    Images are cached (read-only) until needle file changes or cache grows
+    over TEMPLATE_CACHE_MAX_BYTES, when least recently used ones are evicted.
+    """
+    needle_path = Path(needle)
+    if not needle_path.exists():
+        raise FileNotFoundError(f"Needle file does not exist. Tried: {needle_path}")
+    path = str(needle_path.resolve())
+    key = (path, os.path.getmtime(path), bool(grayscale), tuple(scale_ratios))
+    cached = _cache_get(key)
+    if cached:
+        return cached
+
+    template = cv2.imread(path, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
+    if template is None:
+        raise FileNotFoundError(f"Cannot read template image. Tried: {needle}")
+    scaled_templates = []
+    for scale_ratio in scale_ratios:
+        if math.isclose(scale_ratio, 1.0, rel_tol=0.03):
+            scaled_templates.append(template)
+            continue
+        interpolation_method = cv2.INTER_LINEAR if scale_ratio > 1.0 else cv2.INTER_AREA
+        scaled_templates.append(
+            cv2.resize(
+                template, None, fx=scale_ratio, fy=scale_ratio, interpolation=interpolation_method
+            )
+        )
+    for image in scaled_templates:
+        image.flags.writeable = False
+    entry = (template, tuple(scaled_templates))
+    size = template.nbytes + sum(i.nbytes for i in scaled_templates if i is not template)
+    _cache_put(key, entry, size)
+    return entry
+
+
+def get_template_features(needle: str, matcher: str) -> tuple[ndarray, Optional[ndarray]]:
+    """Returns keypoint coordinates (N x 2) and descriptors of needle image
+    for feature matcher ("orb" or "akaze"). Cached like get_templates.
+    """
+    template, _ = get_templates(needle, True, (1.0,))
+    path = str(Path(needle).resolve())
+    key = (path, os.path.getmtime(path), matcher)
+    cached = _cache_get(key)
+    if cached:
+        return cached
+
+    # keypoints are not detected near image borders, pad with background
+    padded = cv2.copyMakeBorder(
+        template, *[FEATURE_BORDER] * 4, cv2.BORDER_CONSTANT, value=int(template[0, 0])
+    )
+    points, descriptors = _detect_features(padded, matcher)
+    points -= FEATURE_BORDER
+    for array in (points, descriptors):
+        if array is not None:
+            array.flags.writeable = False
+    entry = (points, descriptors)
+    _cache_put(key, entry, points.nbytes + (descriptors.nbytes if descriptors is not None else 0))
+    return entry
+
+
+def _cache_get(key: TemplateKey) -> Any:
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(key)
+        if cached:
+            _TEMPLATE_CACHE.move_to_end(key)
+            TEMPLATE_CACHE_STATS["hits"] += 1
+            return cached[0]
+        TEMPLATE_CACHE_STATS["misses"] += 1
+        return None
+
+
+def _cache_put(key: TemplateKey, entry: Any, size: int) -> None:
+    with _TEMPLATE_CACHE_LOCK:
+        if size <= TEMPLATE_CACHE_MAX_BYTES and key not in _TEMPLATE_CACHE:
+            _TEMPLATE_CACHE[key] = (entry, size)
+            TEMPLATE_CACHE_STATS["bytes"] += size
+            while TEMPLATE_CACHE_STATS["bytes"] > TEMPLATE_CACHE_MAX_BYTES:
+                _, (_, old_size) = _TEMPLATE_CACHE.popitem(last=False)
+                TEMPLATE_CACHE_STATS["bytes"] -= old_size
+                TEMPLATE_CACHE_STATS["evictions"] += 1
+
+
+def _detect_features(image: ndarray, matcher: str) -> tuple[ndarray, Optional[ndarray]]:
+    """Returns keypoint coordinates (N x 2, float32) and binary descriptors
+    (None if no keypoints) of grayscale image.
+    """
+    if matcher == "akaze":
+        detector = cv2.AKAZE_create(threshold=AKAZE_THRESHOLD)
+    else:
+        # smaller patches than default, so small icons get keypoints too
+        detector = cv2.ORB_create(
+            nfeatures=ORB_MAX_FEATURES, edgeThreshold=15, patchSize=15, fastThreshold=10
+        )
+    keypoints, descriptors = detector.detectAndCompute(image, None)
+    points = np.array([kp.pt for kp in keypoints], np.float32).reshape(-1, 2)
+    return points, descriptors
+
+
+def get_template_cache_stats() -> dict[str, int]:
+    with _TEMPLATE_CACHE_LOCK:
+        return dict(TEMPLATE_CACHE_STATS, size=len(_TEMPLATE_CACHE))
+
+
+def clear_template_cache() -> None:
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE.clear()
+        TEMPLATE_CACHE_STATS.update(hits=0, misses=0, evictions=0, bytes=0)
+
+
+def _map_in_order(
+    fn: Callable[[Any], Any], items: Sequence[Any], workers: Optional[int] = None
+) -> Iterator[Any]:
+    """Yields fn(item) for each item in order. With IconMatchWorkers (or given
+    workers) > 1 all items are evaluated in parallel threads (OpenCV releases
+    the GIL), items not yet started are cancelled when caller stops iterating.
+    """
+    if workers is None:
+        workers = CONFIG["IconMatchWorkers"]
+    workers = min(workers, len(items))
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qweb-icon") as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
 
 
 def image_recognition(
@@ -518,22 +978,127 @@ def image_recognition(
     pyautog: bool,
     tolerance: float = 0.95,
     grayscale: bool = True,
+    region: Union[str, tuple[float, ...], None] = None,
+    matcher: Optional[str] = None,
 ) -> tuple[int, int]:
-    """Return icon's coordinates."""
+    """Return icon's coordinates.
+
+    Region is "viewport" or (x, y, width, height) in viewport CSS pixels.
+    """
     image_rec = QIcon()
     frame.wait_page_loaded()
-    screenshot_path = save_screenshot("screenshot.png", pyautog=pyautog)
+    screenshot = get_screenshot_image(pyautog=pyautog)
+    pixel_region = None
+    if region:
+        os_screenshot = pyautog or bool(CONFIG["OSScreenshots"])
+        pixel_region = _region_to_pixels(region, screenshot.shape[1], os_screenshot)
     x, y = image_rec.image_location(
         needle=image_path,
-        haystack=screenshot_path,
+        haystack=screenshot,
         tolerance=tolerance,
         template_res_w=template_res_w,
         device_res_w=browser_res_w,
         grayscale=grayscale,
+        region=pixel_region,
+        matcher=matcher,
     )
     return x, y
 
 
+def images_recognition(
+    image_paths: Sequence[str],
+    template_res_w: int,
+    browser_res_w: int,
+    pyautog: bool,
+    tolerance: float = 0.95,
+    grayscale: bool = True,
+    region: Union[str, tuple[float, ...], None] = None,
+    matcher: Optional[str] = None,
+) -> dict[str, IconMatch]:
+    """Match several icons against one screenshot, return matches by image path.
+
+    Screenshot is captured, converted and cropped once (and its keypoints
+    detected once with keypoint matchers). With IconMatchWorkers > 1
+    icons are matched in parallel threads, scales of each icon sequentially.
+    """
+    image_rec = QIcon()
+    frame.wait_page_loaded()
+    screenshot = get_screenshot_image(pyautog=pyautog)
+    image_haystack = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY) if grayscale else screenshot
+    pixel_region = None
+    if region:
+        os_screenshot = pyautog or bool(CONFIG["OSScreenshots"])
+        pixel_region = _region_to_pixels(region, screenshot.shape[1], os_screenshot)
+    image_haystack, offset = image_rec._crop_region(image_haystack, pixel_region)
+    matcher = util.validate_icon_matcher(matcher) if matcher else CONFIG["IconMatcher"]
+    haystack_features = None
+    if matcher in FEATURE_MATCHERS:
+        gray_haystack = (
+            image_haystack
+            if image_haystack.ndim == 2
+            else cv2.cvtColor(image_haystack, cv2.COLOR_BGR2GRAY)
+        )
+        haystack_features = _detect_features(gray_haystack, matcher)
+
+    match_needle = partial(
+        image_rec.match_needle,
+        image=screenshot,
+        image_haystack=image_haystack,
+        offset=offset,
+        tolerance=tolerance,
+        draw=0,
+        template_res_w=template_res_w,
+        device_res_w=browser_res_w,
+        workers=1,
+        matcher=matcher,
+        haystack_features=haystack_features,
+    )
+    matches = {}
+    with closing(_map_in_order(match_needle, image_paths)) as results:
+        for image_path, match in zip(image_paths, results):
+            logger.info(
+                f"Icon {image_path}: found {match.found}, score {match.score:.3f}, "
+                f"location {match.location}"
+            )
+            image_rec._log_matched_image(
+                screenshot,
+                match.template,
+                match.matched_image,
+                match.location,
+                match.scale_ratio,
+                grayscale=grayscale,
+            )
+            matches[image_path] = match
+    return matches
+
+
+def _region_to_pixels(
+    region: Union[str, tuple[float, ...]], screenshot_width: int, os_screenshot: bool
+) -> tuple[int, int, int, int]:
+    """Convert region in viewport CSS pixels to screenshot pixels.
+
+    Browser screenshot contains only the viewport. Screenshot of the whole
+    screen (pyautogui) is offset by window position and browser toolbars.
+    """
+    view = javascript.execute_javascript(_VIEWPORT_JS)
+    if region == "viewport":
+        x, y, w, h = 0.0, 0.0, view["innerWidth"], view["innerHeight"]
+    else:
+        x, y, w, h = region  # type: ignore[misc]
+    if os_screenshot:
+        scale = screenshot_width / view["screenWidth"]
+        x += view["screenX"] + view["outerWidth"] - view["innerWidth"]
+        y += view["screenY"] + view["outerHeight"] - view["innerHeight"]
+    else:
+        scale = screenshot_width / view["innerWidth"]
+    return (
+        int(x * scale),
+        int(y * scale),
+        int(math.ceil(w * scale)),
+        int(math.ceil(h * scale)),
+    )
+
+
 def get_full_image_path(icon: str) -> Path:
     """Return image's full path."""
     if icon.endswith(".png") or icon.endswith(".jpg"):
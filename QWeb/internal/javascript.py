@@ -46,6 +46,11 @@ _GET_ALL_FRAMES_FROM_SHADOW_DOM_JS = load_js('get_all_frames_from_shadow_dom.js'
 _GET_ALL_INPUT_ELEMENTS_FROM_SHADOW_DOM_JS = load_js('get_all_input_elements_from_shadow_dom.js')
 _GET_ALL_DROPDOWN_ELEMENTS_FROM_SHADOW_DOM_JS = load_js('get_all_dropdown_elements_shadow_dom.js')
 _GET_ITEM_ELEMENTS_FROM_SHADOW_DOM_JS = load_js('get_item_elements_from_shadow_dom.js')
+_GET_TEXT_USING_ANCHOR_JS = load_js('get_text_using_anchor.js')
+_GET_BOUNDING_RECTS_JS = load_js('get_bounding_rects.js')
+_WAIT_FOR_TEXT_JS = load_js('wait_for_text.js')
+_GET_FRAME_STATE_JS = load_js('get_frame_state.js')
+_CLEAR_STORAGE_JS = load_js('clear_storage.js')
 
 
 def execute_javascript(script: str, *args) -> Any:
@@ -72,6 +77,44 @@ def execute_javascript(script: str, *args) -> Any:
     return driver.execute_script(script, *args)
 
 
+def execute_async_javascript(script: str, *args) -> Any:
+    """Run given asynchronous javascript on current window.
+
+    Script gets callback function as last item of "arguments" and must call it
+    with the return value.
+    """
+    driver = browser.get_current_browser()
+    return driver.execute_async_script(script, *args)
+
+
+def wait_for_text(text: str, timeout_ms: int) -> dict[str, Any]:
+    """Wait until text appears in DOM using MutationObserver
+       (using external JS file, preloaded)."""
+    js = _WAIT_FOR_TEXT_JS
+    return execute_async_javascript(js, text, timeout_ms)
+
+
+def get_bounding_rects(web_elements: list[WebElement], with_html: bool = False) -> dict[str, list]:
+    """Return bounding rects and optionally outerHTML of elements in one call
+       (using external JS file, preloaded)."""
+    js = _GET_BOUNDING_RECTS_JS
+    return execute_javascript(js, web_elements, with_html)
+
+
+def get_frame_state() -> dict[str, Any]:
+    """Return id, url and frame generation of current document
+       (using external JS file, preloaded)."""
+    js = _GET_FRAME_STATE_JS
+    return execute_javascript(js)
+
+
+def clear_storage(timeout_ms: int = 2000) -> dict[str, Any]:
+    """Clear web storages, IndexedDB and caches of current origin
+       (using external JS file, preloaded)."""
+    js = _CLEAR_STORAGE_JS
+    return execute_async_javascript(js, timeout_ms)
+
+
 def get_visibility(web_elements: list[WebElement]) -> list[dict]:
     """Return web element objects (using external JS file, preloaded)."""
     js = _GET_VISIBILITY_JS
@@ -147,6 +190,13 @@ def get_clickable(locator: str) -> list[WebElement]:
     return execute_javascript(js, locator)
 
 
+def get_text_using_anchor(locator: str, anchor: str, cfg: dict[str, Any]) -> dict[str, Any]:
+    """Find text element, filter visible ones and rank them by anchor in one call
+       (using external JS file, preloaded)."""
+    js = _GET_TEXT_USING_ANCHOR_JS
+    return execute_javascript(js, locator, anchor, cfg)
+
+
 def get_text_elements_from_shadow_dom(locator: str, partial: bool) -> list[WebElement]:
     """Find elements in shadow DOM whose textContent matches to preferred text (using
        external JS file, preloaded)."""
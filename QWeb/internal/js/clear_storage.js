@@ -0,0 +1,61 @@
+// clear_storage.js
+// Async script: clears localStorage, sessionStorage, IndexedDB databases,
+// CacheStorage and service workers of the current origin.
+// Returns {cleared: [storage types], ms: float}. Storages which can't be
+// accessed (about:blank, sandboxed frames etc.) are skipped.
+
+function clearStorage(timeoutMs, done) {
+    var t0 = performance.now();
+    var cleared = [];
+    var pending = [];
+    var finished = false;
+
+    function finish() {
+        if (finished) return;
+        finished = true;
+        done({cleared: cleared, ms: Math.round((performance.now() - t0) * 100) / 100});
+    }
+
+    function track(name, promise) {
+        pending.push(promise.then(function () { cleared.push(name); }, function () {}));
+    }
+
+    try { window.localStorage.clear(); cleared.push("localStorage"); } catch (e) {}
+    try { window.sessionStorage.clear(); cleared.push("sessionStorage"); } catch (e) {}
+
+    try {
+        if (window.indexedDB && indexedDB.databases) {
+            track("indexedDB", indexedDB.databases().then(function (dbs) {
+                return Promise.all(dbs.map(function (db) {
+                    return new Promise(function (resolve) {
+                        var req = indexedDB.deleteDatabase(db.name);
+                        // blocked: open connection in page, deleted when it closes
+                        req.onsuccess = req.onerror = req.onblocked = resolve;
+                    });
+                }));
+            }));
+        }
+    } catch (e) {}
+
+    try {
+        if (window.caches) {
+            track("cacheStorage", caches.keys().then(function (keys) {
+                return Promise.all(keys.map(function (key) { return caches.delete(key); }));
+            }));
+        }
+    } catch (e) {}
+
+    try {
+        if (navigator.serviceWorker && navigator.serviceWorker.getRegistrations) {
+            track("serviceWorkers", navigator.serviceWorker.getRegistrations().then(function (regs) {
+                return Promise.all(regs.map(function (reg) { return reg.unregister(); }));
+            }));
+        }
+    } catch (e) {}
+
+    setTimeout(finish, timeoutMs);
+    Promise.all(pending).then(finish);
+}
+
+// Entrypoint for Selenium execute_async_script
+clearStorage(arguments[0], arguments[arguments.length - 1]);
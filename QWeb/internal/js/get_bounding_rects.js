@@ -0,0 +1,19 @@
+// get_bounding_rects.js
+// Returns bounding rectangles [x, y, width, height] for a list of elements
+// and optionally their outerHTML for debug logging
+
+function getBoundingRects(elems, withHtml) {
+    var rects = [];
+    var html = [];
+    for (var i = 0; i < elems.length; i++) {
+        var r = elems[i].getBoundingClientRect();
+        rects.push([r.left, r.top, r.width, r.height]);
+        if (withHtml) {
+            html.push(elems[i].outerHTML);
+        }
+    }
+    return {rects: rects, html: html};
+}
+
+// Entrypoint for Selenium execute_script
+return getBoundingRects(arguments[0], arguments[1]);
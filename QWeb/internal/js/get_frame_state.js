@@ -0,0 +1,54 @@
+// get_frame_state.js
+// Returns identity, url and frame generation of current document.
+// Generation is increased by MutationObserver whenever frames are added,
+// removed or their attributes (or their ancestors' attributes) change.
+// Navigation creates new document and thus new id.
+// Returns {id: str, url: str, gen: int}, gen -1 means frames can't be tracked
+
+function getFrameState() {
+    var mon = window.__xhrMon = window.__xhrMon || {};
+    var FRAMES = "iframe, frame";
+
+    function hasFrames(node) {
+        if (!node || node.nodeType !== 1) return false;
+        return node.matches(FRAMES) || !!node.querySelector(FRAMES);
+    }
+
+    function onMutations(records) {
+        for (var i = 0; i < records.length; i++) {
+            var record = records[i];
+            var changed = record.type === "attributes" && hasFrames(record.target);
+            for (var j = 0; !changed && j < record.addedNodes.length; j++) {
+                changed = hasFrames(record.addedNodes[j]);
+            }
+            for (var k = 0; !changed && k < record.removedNodes.length; k++) {
+                changed = hasFrames(record.removedNodes[k]);
+            }
+            if (changed) {
+                mon.frames.gen++;
+                return;
+            }
+        }
+    }
+
+    if (!mon.frames) {
+        mon.frames = {
+            id: Date.now().toString(36) + Math.random().toString(36).slice(2),
+            gen: 0
+        };
+        try {
+            new MutationObserver(onMutations).observe(document.documentElement, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                attributeFilter: ["src", "style", "class", "hidden", "width", "height"]
+            });
+        } catch (e) {
+            mon.frames.gen = -1;
+        }
+    }
+    return {id: mon.frames.id, url: document.URL, gen: mon.frames.gen};
+}
+
+// Entrypoint for Selenium execute_script
+return getFrameState();
@@ -0,0 +1,250 @@
+// get_text_using_anchor.js
+// Single round trip text locator: text matching, slot handling, visibility
+// filtering and anchor distance ranking done inside the page.
+// Returns {elem: WebElement|null, status: str, diagnostics: {...}}
+
+function getTextUsingAnchor(locator, anchor, cfg) {
+    var t0 = performance.now();
+    var DEFAULT_DISTANCE = 1000000.0;
+    var diagnostics = {
+        engine: "bundled",
+        clickable: 0,
+        textMatches: 0,
+        slots: 0,
+        visible: 0,
+        anchorMatches: 0,
+        distance: null
+    };
+
+    function result(elem, status) {
+        diagnostics.ms = Math.round((performance.now() - t0) * 100) / 100;
+        return {elem: elem, status: status, diagnostics: diagnostics};
+    }
+
+    function xpathAll(xpath, context) {
+        var found = [];
+        try {
+            var snap = document.evaluate(xpath, context || document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < snap.snapshotLength; i++) {
+                found.push(snap.snapshotItem(i));
+            }
+        } catch (e) {
+            // invalid xpath (weird characters in locator etc.), treat as no match
+        }
+        return found;
+    }
+
+    function activeArea() {
+        var areas = xpathAll(cfg.activeAreaXpath);
+        return areas.length ? areas[0] : null;
+    }
+
+    function inActiveArea(xpath, area) {
+        // same as element.get_webelements_in_active_area: search relative to active area
+        return area ? xpathAll(xpath.replace("//", ".//"), area) : [];
+    }
+
+    function clickable(text) {
+        var full = [];
+        var partial = [];
+        var elems = document.querySelectorAll('button, a, label, *[type="submit"], *[type="button"], *[type="reset"], li[data-value], input[type="radio"], *[role="tab"], *[role="button"], *[ng-click], *[data-ng-click],[href]');
+        for (var i = 0; i < elems.length; i++) {
+            var value = elems[i].tagName.toLowerCase() === "input" ? elems[i].value : elems[i].innerText;
+            value = (value || "").trim();
+            if (value === text) {
+                full.push(elems[i]);
+            } else if (value.toLowerCase() === text.toLowerCase()) {
+                partial.push(elems[i]);
+            }
+        }
+        return full.concat(partial);
+    }
+
+    function merge(target, source) {
+        for (var i = 0; i < source.length; i++) {
+            if (target.indexOf(source[i]) === -1) {
+                target.push(source[i]);
+            }
+        }
+        return target;
+    }
+
+    function visibleOnly(elems) {
+        if (!cfg.visibility) return elems;
+        var visible = [];
+        var hiding = [];
+        for (var i = 0; i < elems.length; i++) {
+            var rects = elems[i].getBoundingClientRect();
+            var style = getComputedStyle(elems[i]);
+            var onscreen = rects.top >= 0 && rects.top < window.innerHeight &&
+                rects.left >= 0 && rects.left < window.innerWidth;
+            var css = style.display !== "none" && style.visibility !== "hidden";
+            var offset = elems[i].offsetWidth > 0 || rects.width > 0;
+            if (css && onscreen) {
+                if (cfg.offsetCheck) {
+                    if (offset) visible.push(elems[i]);
+                } else {
+                    visible.push(elems[i]);
+                }
+            } else if (css) {
+                hiding.push(elems[i]);
+            }
+        }
+        return cfg.viewport ? visible : visible.concat(hiding);
+    }
+
+    function textElements(partialMatch, area) {
+        if (partialMatch) {
+            return visibleOnly(inActiveArea(cfg.containsXpath, area));
+        }
+        return visibleOnly(inActiveArea(cfg.exactXpath, area));
+    }
+
+    function corners(r) {
+        return [[r.left, r.top], [r.right, r.top], [r.left, r.bottom], [r.right, r.bottom]];
+    }
+
+    function inDirection(angle) {
+        var direction = cfg.searchDirection.replace("!", "");
+        if (direction === "down") return angle > 5 && angle < 175;
+        if (direction === "up") return angle > -175 && angle < -5;
+        if (direction === "left") return Math.abs(angle) > 95;
+        if (direction === "right") return angle > -85 && angle < 85;
+        return true;
+    }
+
+    function closestDistance(r1, r2) {
+        var closest = DEFAULT_DISTANCE;
+        var c1 = corners(r1);
+        var c2 = corners(r2);
+        for (var i = 0; i < 4; i++) {
+            for (var j = 0; j < 4; j++) {
+                var distance = Math.abs(c1[i][0] - c2[j][0]) + Math.abs(c1[i][1] - c2[j][1]);
+                if (cfg.searchDirection !== "closest") {
+                    var angle = Math.atan2(c2[j][1] - c1[i][1], c2[j][0] - c1[i][0]) * 180 / Math.PI;
+                    if (!inDirection(angle)) distance = DEFAULT_DISTANCE;
+                }
+                if (closest > distance && distance > 0) closest = distance;
+            }
+        }
+        return closest;
+    }
+
+    function overlap(r1, r2) {
+        return r1.left <= r2.right && r2.left <= r1.right &&
+            r1.top <= r2.bottom && r2.top <= r1.bottom;
+    }
+
+    function orthoDistance(r1, r2) {
+        var dx = Math.abs((r1.left + r1.width / 2) - (r2.left + r2.width / 2));
+        var dy = Math.abs((r1.top + r1.height / 2) - (r2.top + r2.height / 2));
+        return Math.min(dx, dy);
+    }
+
+    function closestElement(anchorElem, elems) {
+        var ar = anchorElem.getBoundingClientRect();
+        var closestList = [];
+        var closestRects = [];
+        var closest = DEFAULT_DISTANCE;
+        for (var i = 0; i < elems.length; i++) {
+            var r = elems[i].getBoundingClientRect();
+            if (overlap(ar, r)) {
+                diagnostics.distance = 0;
+                return elems[i];
+            }
+            var distance = closestDistance(ar, r);
+            if (Math.abs(distance - closest) < 2) {
+                closestList.push(elems[i]);
+                closestRects.push(r);
+                closest = distance;
+            } else if (distance < closest) {
+                closest = distance;
+                closestList = [elems[i]];
+                closestRects = [r];
+            }
+        }
+        diagnostics.distance = closest;
+        if (cfg.enforceDirection && closest === DEFAULT_DISTANCE) return null;
+        var best = closestList[0];
+        var bestOrtho = DEFAULT_DISTANCE;
+        if (closestList.length > 1) {
+            for (var k = 0; k < closestList.length; k++) {
+                var ortho = orthoDistance(ar, closestRects[k]);
+                if (ortho < bestOrtho) {
+                    bestOrtho = ortho;
+                    best = closestList[k];
+                }
+            }
+        }
+        return best;
+    }
+
+    function slotElements(partialMatch) {
+        return xpathAll(partialMatch ? cfg.slotContainsXpath : cfg.slotExactXpath);
+    }
+
+    var area = activeArea();
+    var candidates = [];
+
+    if (!cfg.skipClickable) {
+        var slots = slotElements(cfg.partialMatch);
+        var clickables = clickable(locator);
+        diagnostics.clickable = clickables.length;
+        diagnostics.slots = slots.length;
+        candidates = visibleOnly(merge(slots, clickables));
+    }
+    if (!candidates.length) {
+        candidates = textElements(cfg.partialMatch, area);
+        diagnostics.textMatches = candidates.length;
+        var visibleSlots = visibleOnly(slotElements(cfg.partialMatch));
+        diagnostics.slots = visibleSlots.length;
+        candidates = candidates.concat(visibleSlots);
+    }
+    diagnostics.visible = candidates.length;
+
+    if (!candidates.length) return result(null, "not_found");
+    if (candidates.length === 1 && !cfg.enforceDirection) return result(candidates[0], "found");
+
+    if (cfg.anchorIndex !== null) {
+        if (cfg.anchorIndex >= 0 && cfg.anchorIndex < candidates.length) {
+            return result(candidates[cfg.anchorIndex], "found");
+        }
+        return result(null, "index_out_of_range");
+    }
+
+    var anchorElem = null;
+    var anchorCandidates = visibleOnly(inActiveArea(cfg.anchorExactXpath, area));
+    if (cfg.multipleAnchors) {
+        // first exact match is used as anchor, then first partial match
+        var exactAnchor = anchorCandidates.length > 0;
+        if (!exactAnchor) {
+            anchorCandidates = visibleOnly(inActiveArea(cfg.anchorContainsXpath, area));
+        }
+        diagnostics.anchorMatches = anchorCandidates.length;
+        if (!anchorCandidates.length) return result(null, "anchor_not_found");
+        for (var i = 0; i < anchorCandidates.length; i++) {
+            var inner = anchorCandidates[i].innerText || "";
+            if ((exactAnchor && inner === anchor) || (!exactAnchor && inner.indexOf(anchor) !== -1)) {
+                anchorElem = anchorCandidates[i];
+                break;
+            }
+        }
+        anchorElem = anchorElem || anchorCandidates[0];
+    } else {
+        if (cfg.partialMatch) {
+            anchorCandidates = visibleOnly(inActiveArea(cfg.anchorContainsXpath, area));
+        }
+        diagnostics.anchorMatches = anchorCandidates.length;
+        if (!anchorCandidates.length) return result(null, "anchor_not_found");
+        if (anchorCandidates.length > 1) return result(null, "anchor_not_unique");
+        anchorElem = anchorCandidates[0];
+    }
+
+    var winner = closestElement(anchorElem, candidates);
+    if (!winner) return result(null, "direction");
+    return result(winner, "found");
+}
+
+// Entrypoint for Selenium execute_script
+return getTextUsingAnchor(arguments[0], arguments[1], arguments[2]);
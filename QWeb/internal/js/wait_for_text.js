@@ -0,0 +1,84 @@
+// wait_for_text.js
+// Async script: resolves as soon as given text appears in the DOM or when
+// timeout is reached. Uses MutationObserver instead of polling.
+// Returns {status: "present"|"appeared"|"timeout", ms: float}
+
+function waitForText(text, timeoutMs, done) {
+    var t0 = performance.now();
+    var observers = [];
+    var timer = null;
+    var finished = false;
+    var present = false;
+
+    function finish(status) {
+        if (finished) return;
+        finished = true;
+        clearTimeout(timer);
+        for (var i = 0; i < observers.length; i++) {
+            observers[i].disconnect();
+        }
+        done({status: status, ms: Math.round((performance.now() - t0) * 100) / 100});
+    }
+
+    function contains(node) {
+        // attribute values count too (title, aria-label etc. used by item searches)
+        if (!node) return false;
+        if ((node.textContent || "").indexOf(text) !== -1) return true;
+        return node.nodeType === 1 && (node.outerHTML || "").indexOf(text) !== -1;
+    }
+
+    function changed(record) {
+        // only changed parts are checked, target subtree is not serialized again.
+        // Text split over several mutations is noticed by the next search round.
+        if (record.type === "characterData") {
+            return (record.target.data || "").indexOf(text) !== -1;
+        }
+        if (record.type === "attributes") {
+            var value = record.target.getAttribute(record.attributeName);
+            return value !== null && value.indexOf(text) !== -1;
+        }
+        for (var j = 0; j < record.addedNodes.length; j++) {
+            if (contains(record.addedNodes[j])) return true;
+        }
+        return false;
+    }
+
+    function onMutations(records) {
+        for (var i = 0; i < records.length; i++) {
+            if (changed(records[i])) {
+                finish("appeared");
+                return;
+            }
+        }
+    }
+
+    function observe(doc) {
+        if (!doc || !doc.documentElement) return;
+        present = present || contains(doc.body);
+        var observer = new MutationObserver(onMutations);
+        observer.observe(doc.documentElement, {
+            childList: true, subtree: true, characterData: true, attributes: true
+        });
+        observers.push(observer);
+        // same origin frames are observed too, cross origin ones are skipped
+        var frames = doc.querySelectorAll("iframe, frame");
+        for (var i = 0; i < frames.length; i++) {
+            try {
+                observe(frames[i].contentDocument);
+            } catch (e) {
+                // cross origin frame
+            }
+        }
+    }
+
+    observe(document);
+    if (present) {
+        // text is already in DOM but not found by search (hidden, anchor etc.)
+        finish("present");
+        return;
+    }
+    timer = setTimeout(function () { finish("timeout"); }, timeoutMs);
+}
+
+// Entrypoint for Selenium execute_async_script
+waitForText(arguments[0], arguments[1], arguments[arguments.length - 1]);
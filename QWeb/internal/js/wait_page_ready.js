@@ -0,0 +1,70 @@
+// wait_page_ready.js
+// Async script: installs network/DOM monitor if missing and waits inside the page
+// in order readyState -> network idle -> spinner gone -> DOM quiet (capped).
+// Expects installMonitor, statusLite and isSpinnerBusy functions, which xhr.py
+// prepends from install_monitor.js, wait_status_lite.js and spinner_busy.js.
+// Resolves once with the last status and {done: bool, phase: string, ms: float}.
+// phase is "idle" or "domQuietCap" when done, otherwise the step which timed out.
+
+function waitPageReady(opts, done) {
+    var t0 = performance.now();
+    var domPhaseStart = null;
+    var finished = false;
+    var st = null;
+
+    function finish(isDone, phase) {
+        if (finished) return;
+        finished = true;
+        var result = st || {};
+        result.done = isDone;
+        result.phase = phase;
+        result.ms = Math.round((performance.now() - t0) * 100) / 100;
+        done(result);
+    }
+
+    function spinnerBusy() {
+        if (!opts.spinners) return false;
+        try {
+            return isSpinnerBusy(opts.spinners) === true;
+        } catch (e) {
+            // probe failure is ignored, DOM quiet is still waited
+            return false;
+        }
+    }
+
+    function step(now) {
+        // DOM quiet is waited last and at most domQuietCapMs
+        if (domPhaseStart !== null) {
+            if (st.domQuiet) return "idle";
+            return (now - domPhaseStart >= opts.domQuietCapMs) ? "domQuietCap" : "domQuiet";
+        }
+        if (!st.ready) return "ready";
+        if (!opts.skipNetwork && !st.networkIdle) return "network";
+        if (spinnerBusy()) return "spinner";
+        if (st.domQuiet) return "idle";
+        domPhaseStart = now;
+        return opts.domQuietCapMs > 0 ? "domQuiet" : "domQuietCap";
+    }
+
+    function check() {
+        var phase = "status";
+        try {
+            installMonitor();
+            var next = statusLite(opts.quietMs);
+            if (next && typeof next === "object") {
+                st = next;
+                phase = step(performance.now());
+            }
+        } catch (e) {
+            // status probe failed, treated as not ready
+        }
+        if (phase === "idle" || phase === "domQuietCap") return finish(true, phase);
+        if (performance.now() - t0 >= opts.timeoutMs) return finish(false, phase);
+        setTimeout(check, opts.pollMs);
+    }
+
+    check();
+}
+
+// Entrypoint for Selenium execute_async_script
+waitPageReady(arguments[0], arguments[arguments.length - 1]);
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+"""Areas of the page used by icon and screenshot keywords."""
+from __future__ import annotations
+from typing import Optional, Union
+from selenium.webdriver.remote.webelement import WebElement
+from QWeb.internal import browser, element, javascript, text, util
+from QWeb.internal.exceptions import QWebElementNotFoundError
+
+# Rect of element in top level viewport CSS pixels. Offsets of same origin
+# frames are added, null if element is inside a cross origin frame.
+_REGION_RECT_JS = (
+    "var el = arguments[0];"
+    "el.scrollIntoView({block: 'nearest', inline: 'nearest'});"
+    "var r = el.getBoundingClientRect(), x = r.x, y = r.y, w = window;"
+    "while (w !== w.top) {"
+    " var fe = null;"
+    " try { fe = w.frameElement; } catch (e) {}"
+    " if (!fe) return null;"
+    " var fr = fe.getBoundingClientRect(), cs = w.parent.getComputedStyle(fe);"
+    " x += fr.x + fe.clientLeft + parseFloat(cs.paddingLeft);"
+    " y += fr.y + fe.clientTop + parseFloat(cs.paddingTop);"
+    " w = w.parent;"
+    "}"
+    "return {x: x, y: y, width: r.width, height: r.height};"
+)
+
+
+def get_region(
+    region: Optional[str], top_element: bool = False
+) -> Union[str, tuple[float, ...], WebElement, None]:
+    """Returns "viewport" or region (x, y, width, height) in viewport CSS pixels.
+
+    region is "viewport", "x, y, width, height" or locator of an element:
+    xpath, visible text or attribute value (title, alt, aria-label etc.).
+    Element is scrolled into view. Elements in frames are supported as long
+    as the frames are from the same origin as the top document.
+    If top_element is True, element of the top document is returned as is.
+    """
+    if not region:
+        return None
+    if region.strip().lower() == "viewport":
+        return "viewport"
+    parts = region.split(",")
+    if len(parts) == 4:
+        try:
+            return tuple(float(part) for part in parts)
+        except ValueError:
+            pass
+    web_element = get_region_element(region)
+    try:
+        if top_element and javascript.execute_javascript("return window === window.top"):
+            return web_element
+        rect = javascript.execute_javascript(_REGION_RECT_JS, web_element)
+    finally:
+        # element search may leave the driver in a frame, screenshots are of top level
+        browser.get_current_browser().switch_to.default_content()
+    if rect is None:
+        raise QWebElementNotFoundError(
+            f"Region element {region} is inside a frame from another origin"
+        )
+    return rect["x"], rect["y"], rect["width"], rect["height"]
+
+
+def get_region_element(locator: str) -> WebElement:
+    """Returns element by xpath, visible text or attribute value."""
+    web_element: Optional[WebElement]
+    if util.xpath_validator(locator):
+        web_element = element.get_unique_element_by_xpath(locator)
+    else:
+        web_element = text.get_element_by_locator_text(locator, allow_non_existent=True)
+        if web_element is None:
+            web_element = text.get_item_using_anchor(
+                locator, anchor="1", allow_non_existent=True
+            )
+    if web_element is None:
+        raise QWebElementNotFoundError(f"Region element {locator} not found")
+    return web_element
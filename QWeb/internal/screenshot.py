@@ -15,16 +15,23 @@
 # limitations under the License.
 # ---------------------------
 from __future__ import annotations
-from typing import Union, Optional
+from typing import Any, Callable, Union, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from numpy import ndarray
 
+import atexit
 import base64
+import hashlib
 import json
 import os
+import queue
+import threading
 from uuid import uuid4
 
 import cv2
+import numpy as np
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
     UnexpectedAlertPresentException,
     WebDriverException,
@@ -46,6 +53,105 @@ VERIFYAPP_DIR_NAME = "verifyapp"
 VALID_FILENAME_CHARS = "-_.() abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 MAX_LENGTH = 100  # filenames longer than 255 are not allowed by os
 
+# VerifyApp compares SSIM only for tiles with changed pixels. SSIM of a window
+# with identical pixels is exactly 1, so score is the same as full-frame SSIM.
+SSIM_TILE_SIZE = 64
+SSIM_WIN_SIZE = 7  # structural_similarity default
+SSIM_WORKERS = min(8, os.cpu_count() or 1)
+
+# Screenshots waiting to be written by background writer. Taking a screenshot
+# blocks when queue is full, so slow disk can't fill the memory.
+SCREENSHOT_QUEUE_SIZE = 8
+
+# File extension and cv2.imencode quality flag of ScreenshotFormat values
+SCREENSHOT_FORMATS: dict[str, tuple[str, Optional[int]]] = {
+    "png": (".png", None),
+    "jpeg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+}
+
+
+class _ScreenshotWriter:
+    """Decodes, encodes and writes screenshots in one background thread.
+
+    Tasks are run in order. Failures are collected and reported by flush,
+    as Robot Framework logger can only be used from the main thread.
+    """
+
+    def __init__(self, max_queue: int = SCREENSHOT_QUEUE_SIZE) -> None:
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._errors: list[str] = []
+
+    def submit(self, filepath: str, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run fn(*args) in writer thread, filepath is used in error messages."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="qweb-screenshot-writer", daemon=True
+                )
+                self._thread.start()
+        future: Future = Future()
+        self._queue.put((future, filepath, fn, args))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            future, filepath, fn, args = self._queue.get()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args))
+                    except Exception as e:  # pylint: disable=W0703
+                        self._errors.append(f"Writing {filepath} failed: {e}")
+                        future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> list[str]:
+        """Wait until queued screenshots are written, return errors since last flush."""
+        self._queue.join()
+        errors, self._errors = self._errors, []
+        return errors
+
+
+SCREENSHOT_WRITER = _ScreenshotWriter()
+atexit.register(SCREENSHOT_WRITER.flush)
+
+# Rect of element (scrolled into view) or of viewport region [x, y, width,
+# height] in page CSS pixels, and viewport scroll position and width.
+_CLIP_RECT_JS = (
+    "var r = arguments[0];"
+    "if (Array.isArray(r)) {"
+    " r = {x: r[0], y: r[1], width: r[2], height: r[3]};"
+    "} else {"
+    " r.scrollIntoView({block: 'nearest', inline: 'nearest'});"
+    " r = r.getBoundingClientRect();"
+    "}"
+    "return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width,"
+    " height: r.height, scrollX: window.scrollX, scrollY: window.scrollY,"
+    " innerWidth: window.innerWidth};"
+)
+
+# Scroll and stitch full page screenshots are cut at this height (CSS pixels)
+# so that memory use of the preallocated image stays bounded.
+STITCH_MAX_HEIGHT = 16384
+
+_PAGE_METRICS_JS = (
+    "return {height: Math.max(window.innerHeight, document.body.scrollHeight,"
+    " document.documentElement.scrollHeight)|0, innerWidth: window.innerWidth,"
+    " innerHeight: window.innerHeight, scrollX: window.scrollX, scrollY: window.scrollY};"
+)
+_SCROLL_TO_JS = (
+    "window.scrollTo({left: arguments[0], top: arguments[1], behavior: 'instant'});"
+    "return window.scrollY;"
+)
+
+# Generated screenshot files by folder, content hash and encoding. Identical
+# screenshots are stored once and later log entries link to the same file.
+_SCREENSHOT_FILES: dict[tuple, tuple[str, Optional[Future]]] = {}
+
 
 def _create_screenshot_folder(foldername: str) -> str:
     try:
@@ -73,11 +179,16 @@ def _remove_invalid_chars(text_to_check: str) -> str:
     return valid if len(valid) <= MAX_LENGTH else valid[: MAX_LENGTH - 1]
 
 
-def compare_screenshots(filename: str, accuracy: Union[str, float]) -> bool:
+def compare_screenshots(
+    filename: str,
+    accuracy: Union[str, float],
+    clip: Union[WebElement, tuple[float, ...], None] = None,
+) -> bool:
     # pylint: disable=no-member
     """Compare screenshot against reference, take reference if missing.
 
     :param filename:
+    :param clip: element or region to compare instead of the whole viewport
     :return:
     """
     screenshot_dir = _create_screenshot_folder(SCREEN_SHOT_DIR_NAME)
@@ -94,7 +205,7 @@ def compare_screenshots(filename: str, accuracy: Union[str, float]) -> bool:
         raise ValueError("Invalid accuracy: {}".format(accuracy)) from e
     # Save reference screenshot if it does not exist
     if not os.path.isfile(os.path.join(verifyapp_dir, filename_ref)):
-        filepath_ref = save_screenshot(filename_ref, VERIFYAPP_DIR_NAME)
+        filepath_ref = save_screenshot(filename_ref, VERIFYAPP_DIR_NAME, clip=clip)
 
         logger.info("Reference screenshot missing, saving.")
         logger.info("Image path: {}".format(filename_ref))
@@ -103,23 +214,21 @@ def compare_screenshots(filename: str, accuracy: Union[str, float]) -> bool:
     # Compare screenshots if reference exists
     else:
         filepath_ref = os.path.join(verifyapp_dir, filename_ref)
-        filepath_cmp = save_screenshot(filename_cmp, SCREEN_SHOT_DIR_NAME)
-        ref_image = cv2.imread(filepath_ref, cv2.IMREAD_GRAYSCALE)
-        ref_image_c = cv2.imread(filepath_ref, cv2.IMREAD_COLOR)
-        new_image = cv2.imread(filepath_cmp, cv2.IMREAD_GRAYSCALE)
-
-        (score, diff) = structural_similarity(ref_image, new_image, full=True)
+        filepath_cmp = save_screenshot(filename_cmp, SCREEN_SHOT_DIR_NAME, clip=clip)
+        score, changed_areas, exact = _compare_image_files(filepath_ref, filepath_cmp, accuracy)
         if score > accuracy:
-            logger.info("Images match with score: {}".format(score))
+            logger.info("Images match with {}".format(_score_text(score, exact, accuracy)))
             log_screenshot_file(filepath_cmp)
             logger.info("Image path: {}".format(filename_cmp))
             status = True
         else:
-            logger.error("Images differ with score: {}".format(score))
+            logger.error("Images differ with {}".format(_score_text(score, exact, accuracy)))
             logger.info("Reference image: {}".format(filename_ref))
             log_screenshot_file(filepath_ref)
             logger.info("Comparison image: {}".format(filename_cmp))
-            ref_image_c = _draw_contours(diff, ref_image_c)
+            ref_image_c = _draw_rectangles(
+                changed_areas, cv2.imread(filepath_ref, cv2.IMREAD_COLOR)
+            )
 
             log_screenshot_file(filepath_cmp)
 
@@ -131,21 +240,158 @@ def compare_screenshots(filename: str, accuracy: Union[str, float]) -> bool:
     return status
 
 
-def _draw_contours(diff: ndarray, ref_image_c: ndarray) -> ndarray:
-    # pylint: disable=no-member
-    """Draw contours on ref_image_c based on diff
+def _score_text(score: float, exact: bool, accuracy: float) -> str:
+    """Return score for logging, bound of the score if comparison stopped early."""
+    if exact:
+        return "score: {}".format(score)
+    return "score {} {}".format("\u2265" if score > accuracy else "\u2264", score)
 
-    :param diff:
-    :param ref_image_c:
-    :return:
+
+def _compare_image_files(
+    filepath_ref: str, filepath_cmp: str, accuracy: Optional[float] = None
+) -> tuple[float, list[tuple[int, int, int, int]], bool]:
+    """Return SSIM score of two image files, changed areas (x, y, width, height)
+    and whether the score is exact instead of a bound.
+
+    Staged so that mostly passing comparisons stay cheap: identical files and
+    identical pixels are not compared further, otherwise SSIM is computed only
+    for tiles with changed pixels. See _tiled_structural_similarity for accuracy.
     """
-    diff = (diff * 255).astype("uint8")
-    thresh = cv2.threshold(diff, 220, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)[1]
-    # Modified as per latest minimum required opencv version
-    contours, _ = cv2.findContours(thresh.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    with open(filepath_ref, "rb") as ref_file, open(filepath_cmp, "rb") as cmp_file:
+        ref_bytes, cmp_bytes = ref_file.read(), cmp_file.read()
+    if ref_bytes == cmp_bytes:
+        logger.debug("Screenshot file is identical to reference")
+        return 1.0, [], True
+    ref_image = cv2.imdecode(np.frombuffer(ref_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+    new_image = cv2.imdecode(np.frombuffer(cmp_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+    if ref_image.shape != new_image.shape or min(ref_image.shape) < SSIM_WIN_SIZE:
+        # structural_similarity raises for different sizes
+        score = structural_similarity(ref_image, new_image)
+        return score, [(0, 0, ref_image.shape[1], ref_image.shape[0])], True
+    return _tiled_structural_similarity(ref_image, new_image, accuracy)
+
+
+def _tiled_structural_similarity(
+    ref_image: ndarray, new_image: ndarray, accuracy: Optional[float] = None
+) -> tuple[float, list[tuple[int, int, int, int]], bool]:
+    """Same score as structural_similarity, computed only for changed tiles.
+
+    Tiles are dirty if any SSIM window of their pixels contains a changed
+    pixel. Dirty tiles are compared in parallel threads with a margin of half
+    window, so that their SSIM values equal the ones of full-frame comparison.
+
+    With accuracy, comparison stops as soon as the result is certain: returned
+    score is then the bound (SSIM of a pixel is between -1 and 1) which is
+    above accuracy or not, and exact (last returned value) is False.
+    Changed areas are adjacent tiles with changed pixels, cropped to the pixels.
+    """
+    pad = (SSIM_WIN_SIZE - 1) // 2
+    height, width = ref_image.shape
+    changed = cv2.absdiff(ref_image, new_image)
+    if not changed.any():
+        logger.debug("Screenshot pixels are identical to reference")
+        return 1.0, [], True
+    affected = cv2.dilate(changed, np.ones((SSIM_WIN_SIZE, SSIM_WIN_SIZE), np.uint8))
+
+    y_edges, x_edges = _tile_edges(height), _tile_edges(width)
+    tiles = [
+        (y, y2, x, x2)
+        for y, y2 in y_edges
+        for x, x2 in x_edges
+        if affected[y:y2, x:x2].any()
+    ]
+    changed_areas = _changed_areas(changed, y_edges, x_edges)
+
+    # structural_similarity leaves out image borders of half window from mean,
+    # SSIM of unaffected pixels is 1
+    valid_pixels = (height - 2 * pad) * (width - 2 * pad)
+    remaining = sum(_valid_tile_size(tile, height, width, pad) for tile in tiles)
+    total = float(valid_pixels - remaining)
+    score = None
+    with ThreadPoolExecutor(
+        max_workers=min(SSIM_WORKERS, len(tiles)), thread_name_prefix="qweb-ssim"
+    ) as executor:
+        futures = [
+            executor.submit(_tile_structural_similarity, ref_image, new_image, tile, pad)
+            for tile in tiles
+        ]
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                tile_total, tile_size = future.result()
+                total += tile_total
+                remaining -= tile_size
+                if accuracy is None or not remaining:
+                    continue
+                if (total - remaining) / valid_pixels > accuracy:
+                    score = (total - remaining) / valid_pixels
+                elif (total + remaining) / valid_pixels <= accuracy:
+                    score = (total + remaining) / valid_pixels
+                if score is not None:
+                    logger.debug(f"SSIM result certain after {done}/{len(tiles)} changed tiles")
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+    if score is not None:
+        return score, changed_areas, False
+    logger.debug(f"SSIM computed for {len(tiles)} changed tiles")
+    return total / valid_pixels, changed_areas, True
+
+
+def _tile_structural_similarity(
+    ref_image: ndarray, new_image: ndarray, tile: tuple[int, int, int, int], pad: int
+) -> tuple[float, int]:
+    """Return sum of SSIM values of tile pixels inside valid area and their count."""
+    y, y2, x, x2 = tile
+    height, width = ref_image.shape
+    top, left = max(y - pad, 0), max(x - pad, 0)
+    bottom, right = min(y2 + pad, height), min(x2 + pad, width)
+    _, tile_map = structural_similarity(
+        ref_image[top:bottom, left:right], new_image[top:bottom, left:right], full=True
+    )
+    valid = tile_map[
+        max(pad, y) - top : max(min(height - pad, y2), y) - top,  # noqa: E203
+        max(pad, x) - left : max(min(width - pad, x2), x) - left,  # noqa: E203
+    ]
+    return float(valid.sum()), valid.size
+
+
+def _valid_tile_size(tile: tuple[int, int, int, int], height: int, width: int, pad: int) -> int:
+    y, y2, x, x2 = tile
+    return max(min(height - pad, y2) - max(pad, y), 0) * max(min(width - pad, x2) - max(pad, x), 0)
+
 
-    for c in contours:
-        (x, y, w, h) = cv2.boundingRect(c)
+def _tile_edges(size: int) -> list[tuple[int, int]]:
+    """Split size to SSIM_TILE_SIZE tiles, last tile is at least SSIM_WIN_SIZE."""
+    starts = list(range(0, size, SSIM_TILE_SIZE))
+    if len(starts) > 1 and size - starts[-1] < SSIM_WIN_SIZE:
+        starts.pop()
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _changed_areas(
+    changed: ndarray, y_edges: list[tuple[int, int]], x_edges: list[tuple[int, int]]
+) -> list[tuple[int, int, int, int]]:
+    """Return (x, y, width, height) of groups of adjacent tiles with changed pixels,
+    cropped to the changed pixels."""
+    grid = np.array(
+        [[changed[y:y2, x:x2].any() for x, x2 in x_edges] for y, y2 in y_edges], np.uint8
+    )
+    count, _, stats, _ = cv2.connectedComponentsWithStats(grid, connectivity=8)
+    areas = []
+    for col, row, cols, rows, _ in stats[1:count]:
+        top, left = y_edges[row][0], x_edges[col][0]
+        bottom, right = y_edges[row + rows - 1][1], x_edges[col + cols - 1][1]
+        x, y, w, h = cv2.boundingRect(changed[top:bottom, left:right])
+        areas.append((left + x, top + y, w, h))
+    return areas
+
+
+def _draw_rectangles(
+    areas: list[tuple[int, int, int, int]], ref_image_c: ndarray
+) -> ndarray:
+    """Draw changed areas (x, y, width, height) on ref_image_c."""
+    for x, y, w, h in areas:
         cv2.rectangle(ref_image_c, (x, y), ((x + w), (y + h)), (0, 0, 255), 2)
     return ref_image_c
 
@@ -156,6 +402,8 @@ def save_screenshot(
     folder: str = SCREEN_SHOT_DIR_NAME,
     pyautog: bool = False,
     fullpage: bool = False,
+    background: bool = False,
+    clip: Union[WebElement, tuple[float, ...], None] = None,
 ) -> str:
     """Save screenshot of web page to a file.
 
@@ -174,12 +422,27 @@ def save_screenshot(
     pyautog : bool (default False)
         True if pyautogui shall be used for screenshots and
         False if selenium shall be used
+    background : bool (default False)
+        Only capture the screenshot and leave decoding and writing to background
+        thread. File exists after flush_screenshots. Full page screenshots are
+        always written right away.
+    clip : WebElement or tuple (default None)
+        Save only the element or region (x, y, width, height) in viewport CSS
+        pixels, see clipped_screenshot. Overrides fullpage.
+
+    Screenshots with generated filename (the default) are encoded using
+    ScreenshotFormat, ScreenshotQuality and ScreenshotScale configurations. If
+    identical screenshot has already been saved to the same folder, path of
+    that file is returned instead of writing a new one. Full page screenshots
+    are always saved as PNG.
 
     Returns
     -------
     str
         Filepath to the saved file.
     """
+    if clip is not None:
+        fullpage = False
     test_name = None
     try:
         robot_output = BuiltIn().get_variable_value("${OUTPUT DIR}")
@@ -195,13 +458,18 @@ def save_screenshot(
     if not os.path.isdir(screen_shot_dir):
         os.makedirs(screen_shot_dir)
 
-    if filename == "screenshot_{}.png" and test_name is None:
-        filename = filename.format(uuid4())
-
-    elif filename == "screenshot_{}.png":
-        name_with_underscores = str(test_name).replace(" ", "_")
-        valid_name = _remove_invalid_chars(name_with_underscores)
-        filename = "screenshot-" + valid_name + "-{}".format(uuid4()) + ".png"
+    encoding: Optional[tuple[str, int, float]] = None
+    if filename == "screenshot_{}.png":
+        extension = ".png"
+        if not fullpage:
+            encoding = _screenshot_encoding()
+            extension = SCREENSHOT_FORMATS[encoding[0]][0]
+        if test_name is None:
+            filename = "screenshot_{}".format(uuid4()) + extension
+        else:
+            name_with_underscores = str(test_name).replace(" ", "_")
+            valid_name = _remove_invalid_chars(name_with_underscores)
+            filename = "screenshot-" + valid_name + "-{}".format(uuid4()) + extension
 
     filepath = os.path.join(screen_shot_dir, filename)
 
@@ -218,7 +486,17 @@ def save_screenshot(
         except OSError:
             pass
 
-        pyscreenshot(filepath)
+        if clip is not None:
+            logger.info("Element and region screenshots need a browser, saving whole screen")
+        if encoding:
+            image = pyscreenshot()
+            digest = hashlib.sha1(image.tobytes()).hexdigest()
+            filepath = _store_screenshot(filepath, image, digest, encoding, background)
+        elif background:
+            image = pyscreenshot()
+            SCREENSHOT_WRITER.submit(filepath, image.save, filepath)
+        else:
+            pyscreenshot(filepath)
         logger.info("Saved screenshot to {}".format(filepath))
         return filepath
 
@@ -226,10 +504,25 @@ def save_screenshot(
         saved: Union[str, bool]
         try:
             browser_name = driver.capabilities["browserName"]
-            if not fullpage:
+            if fullpage:
+                saved = full_page_screenshot(driver, filepath, browser_name)
+            elif clip is None and not encoding and not background:
                 saved = driver.save_screenshot(filepath)
             else:
-                saved = full_page_screenshot(driver, filepath, browser_name)
+                if clip is not None:
+                    png_base64 = clipped_screenshot(driver, clip, browser_name)
+                else:
+                    png_base64 = driver.get_screenshot_as_base64()
+                if encoding:
+                    digest = hashlib.sha1(png_base64.encode("ascii")).hexdigest()
+                    filepath = _store_screenshot(
+                        filepath, png_base64, digest, encoding, background
+                    )
+                elif background:
+                    SCREENSHOT_WRITER.submit(filepath, _write_base64_png, filepath, png_base64)
+                else:
+                    _write_base64_png(filepath, png_base64)
+                saved = True
 
         except (
             UnexpectedAlertPresentException,
@@ -245,6 +538,131 @@ def save_screenshot(
     return filepath
 
 
+def get_screenshot_image(pyautog: bool = False) -> ndarray:
+    """Take screenshot of web page as BGR image without saving it to disk.
+
+    Parameters
+    ----------
+    pyautog : bool (default False)
+        True if pyautogui shall be used for screenshots and
+        False if selenium shall be used
+
+    Returns
+    -------
+    ndarray
+        Screenshot as uint8 NumPy array in BGR color space.
+    """
+    try:
+        driver = browser.get_current_browser()
+    except QWebDriverError:
+        driver = None
+        config.set_config("OSScreenshots", True)
+
+    if driver and not pyautog and not config.get_config("OSScreenshots"):
+        try:
+            png = driver.get_screenshot_as_png()
+            image = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+            if image is not None:
+                return image
+        except (
+            UnexpectedAlertPresentException,
+            WebDriverException,
+            QWebDriverError,
+            InvalidSessionIdException,
+        ):
+            pass
+    return cv2.cvtColor(np.asarray(pyscreenshot()), cv2.COLOR_RGB2BGR)
+
+
+def save_image_async(
+    image: ndarray, filename: str, folder: str = SCREEN_SHOT_DIR_NAME
+) -> tuple[str, Future]:
+    """Write BGR image to folder in output directory in background thread.
+
+    Returns file path, which can be logged right away, and future of the write.
+    """
+    filepath = os.path.join(_create_screenshot_folder(folder), filename)
+    return filepath, SCREENSHOT_WRITER.submit(filepath, cv2.imwrite, filepath, image)
+
+
+def flush_screenshots() -> None:
+    """Wait until screenshots saved in background are written to disk."""
+    for error in SCREENSHOT_WRITER.flush():
+        logger.warn(error)
+
+
+def _write_base64_png(filepath: str, png_base64: str) -> None:
+    with open(filepath, "wb") as png_file:
+        png_file.write(base64.b64decode(png_base64.encode("ascii")))
+
+
+def _screenshot_encoding() -> tuple[str, int, float]:
+    return (
+        config.get_config("ScreenshotFormat"),
+        config.get_config("ScreenshotQuality"),
+        config.get_config("ScreenshotScale"),
+    )
+
+
+def _store_screenshot(
+    filepath: str,
+    image: Any,
+    digest: str,
+    encoding: tuple[str, int, float],
+    background: bool,
+) -> str:
+    """Write screenshot unless identical one is already stored, return path of the file.
+
+    image is base64 encoded PNG from webdriver or PIL image from pyautogui and
+    digest is hash of its content.
+    """
+    key = (os.path.dirname(filepath), digest, *encoding)
+    if key in _SCREENSHOT_FILES:
+        stored, pending = _SCREENSHOT_FILES[key]
+        if pending and not background:
+            # caller uses the file, identical one may still be in writer queue
+            try:
+                pending.result()
+            except Exception as e:  # pylint: disable=W0703
+                # error is reported by flush, screenshot is written again below
+                logger.debug("Writing {} failed: {}".format(stored, e))
+        if (pending and not pending.done()) or os.path.exists(stored):
+            logger.info("Screenshot is identical to {}".format(stored))
+            return stored
+    future: Optional[Future] = None
+    if background:
+        future = SCREENSHOT_WRITER.submit(
+            filepath, _write_encoded_screenshot, filepath, image, encoding
+        )
+    else:
+        _write_encoded_screenshot(filepath, image, encoding)
+    _SCREENSHOT_FILES[key] = (filepath, future)
+    return filepath
+
+
+def _write_encoded_screenshot(
+    filepath: str, image: Any, encoding: tuple[str, int, float]
+) -> None:
+    image_format, quality, scale = encoding
+    if isinstance(image, str):
+        if image_format == "png" and scale == 1:
+            _write_base64_png(filepath, image)
+            return
+        data = np.frombuffer(base64.b64decode(image.encode("ascii")), np.uint8)
+        image = cv2.imdecode(data, cv2.IMREAD_COLOR)
+    else:
+        image = cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2BGR)
+    if scale < 1:
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    extension, quality_flag = SCREENSHOT_FORMATS[image_format]
+    params = [quality_flag, quality] if quality_flag is not None else []
+    ok, encoded = cv2.imencode(extension, image, params)
+    if not ok:
+        raise ValueError("Encoding screenshot as {} failed".format(image_format))
+    with open(filepath, "wb") as image_file:
+        image_file.write(encoded.tobytes())
+
+
 def log_screenshot_file(filepath: str) -> None:
     """Log screenshot file to robot framework log.
 
@@ -306,15 +724,79 @@ def get_source() -> str:
     return driver.page_source
 
 
+def _chromium_send(driver: WebDriver, cmd: str, params: dict) -> Any:
+    resource = f"/session/{driver.session_id}/chromium/send_command_and_get_result"
+
+    # pylint:disable=W0212
+    url = driver.service.service_url + resource
+    body = json.dumps({"cmd": cmd, "params": params})
+    response = driver.command_executor._request("POST", url, body)
+    return response.get("value")
+
+
+def clipped_screenshot(
+    driver: WebDriver, clip: Union[WebElement, tuple[float, ...]], browser_name: str
+) -> str:
+    """Return base64 encoded PNG of element or region (x, y, width, height).
+
+    Region is in viewport CSS pixels. Chromium based browsers capture only the
+    clip rect with Page.captureScreenshot, also parts outside of the viewport.
+    Other browsers use element screenshot, regions are cropped from viewport
+    screenshot.
+    """
+    if browser_name in chrome.NAMES or browser_name in edge.NAMES:
+        try:
+            return _chromium_clip_screenshot(driver, clip)
+        except (AttributeError, WebDriverException) as e:
+            # remote sessions do not have chromium command endpoint
+            logger.debug("CDP clipped screenshot failed: {}".format(e))
+    if isinstance(clip, WebElement):
+        return clip.screenshot_as_base64
+    rect = _clip_rect(driver, clip)
+    png = driver.get_screenshot_as_png()
+    image = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+    scale = image.shape[1] / rect["innerWidth"]
+    x = int((rect["x"] - rect["scrollX"]) * scale)
+    y = int((rect["y"] - rect["scrollY"]) * scale)
+    right = min(image.shape[1], x + int(np.ceil(rect["width"] * scale)))
+    bottom = min(image.shape[0], y + int(np.ceil(rect["height"] * scale)))
+    x, y = max(0, x), max(0, y)
+    if right <= x or bottom <= y:
+        raise ValueError("Region {} is outside of viewport".format(clip))
+    encoded = cv2.imencode(".png", image[y:bottom, x:right])[1]
+    return base64.b64encode(encoded.tobytes()).decode("ascii")
+
+
+def _chromium_clip_screenshot(
+    driver: WebDriver, clip: Union[WebElement, tuple[float, ...]]
+) -> str:
+    rect = _clip_rect(driver, clip)
+    params = {
+        "format": "png",
+        "captureBeyondViewport": True,
+        "clip": {
+            "x": rect["x"],
+            "y": rect["y"],
+            "width": rect["width"],
+            "height": rect["height"],
+            "scale": 1,
+        },
+    }
+    return _chromium_send(driver, "Page.captureScreenshot", params)["data"]
+
+
+def _clip_rect(driver: WebDriver, clip: Union[WebElement, tuple[float, ...]]) -> dict:
+    rect = driver.execute_script(
+        _CLIP_RECT_JS, clip if isinstance(clip, WebElement) else list(clip)
+    )
+    if rect["width"] <= 0 or rect["height"] <= 0:
+        raise ValueError("Can not take screenshot of empty area {}".format(rect))
+    return rect
+
+
 def chromium_full_screenshot(driver: WebDriver, filepath: str) -> str:
     def send(cmd, params):
-        resource = f"/session/{driver.session_id}/chromium/send_command_and_get_result"
-
-        # pylint:disable=W0212
-        url = driver.service.service_url + resource
-        body = json.dumps({"cmd": cmd, "params": params})
-        response = driver.command_executor._request("POST", url, body)
-        return response.get("value")
+        return _chromium_send(driver, cmd, params)
 
     def evaluate(script):
         response = send("Runtime.evaluate", {"returnByValue": True, "expression": script})
@@ -346,9 +828,85 @@ def full_page_screenshot(driver: WebDriver, filepath: str, browser_name: str) ->
     if browser_name in firefox.NAMES:
         saved = driver.get_full_page_screenshot_as_file(filepath)  # type: ignore
     elif browser_name in chrome.NAMES or browser_name in edge.NAMES:
-        saved = chromium_full_screenshot(driver, filepath)
+        try:
+            saved = chromium_full_screenshot(driver, filepath)
+        except (AttributeError, WebDriverException) as e:
+            # remote sessions do not have chromium command endpoint
+            logger.debug("CDP full page screenshot failed: {}".format(e))
+            saved = stitched_full_screenshot(driver, filepath)
     else:
-        logger.warn("Your current browser does not support full page screenshots")
-        saved = save_screenshot(filepath, fullpage=False)
+        saved = stitched_full_screenshot(driver, filepath)
 
     return saved
+
+
+def stitched_full_screenshot(driver: WebDriver, filepath: str) -> str:
+    """Save full page screenshot by scrolling the page and stitching viewport screenshots.
+
+    Works with any webdriver. Slices are decoded one at a time into image
+    preallocated for the page height (at most STITCH_MAX_HEIGHT). Rows at the
+    top and bottom of the viewport that stay the same when scrolling (sticky
+    headers and footers) are stored only once. Scroll position is restored.
+    """
+    metrics = driver.execute_script(_PAGE_METRICS_JS)
+    first = _viewport_image(driver, 0)
+    view_height, width = first.shape[:2]
+    scale = width / metrics["innerWidth"]
+    page_height = min(metrics["height"], STITCH_MAX_HEIGHT)
+    if metrics["height"] > STITCH_MAX_HEIGHT:
+        logger.info("Full page screenshot is cut at {} pixels".format(STITCH_MAX_HEIGHT))
+    height = max(view_height, int(np.ceil(page_height * scale)))
+    try:
+        if height == view_height:
+            return filepath if cv2.imwrite(filepath, first) else ""
+        # probe which rows stay in place when scrolled by viewport height
+        probe_y = driver.execute_script(_SCROLL_TO_JS, 0, metrics["innerHeight"])
+        if probe_y <= 0:
+            logger.debug("Page does not scroll, saving visible area only")
+            return filepath if cv2.imwrite(filepath, first) else ""
+        header, footer = _sticky_rows(first, _viewport_image(driver))
+
+        image = np.empty((height, width, 3), np.uint8)
+        filled = min(view_height - footer, height)
+        image[:filled] = first[:filled]
+        del first
+        while filled < height:
+            scroll_y = driver.execute_script(_SCROLL_TO_JS, 0, (filled - header) / scale)
+            top = int(round(scroll_y * scale))
+            view = _viewport_image(driver)
+            start = filled - top
+            end = view.shape[0] if top + view.shape[0] >= height else view.shape[0] - footer
+            rows = min(end - start, height - filled)
+            if start < 0 or rows <= 0:
+                logger.debug("Page stopped scrolling at {}".format(scroll_y))
+                break
+            image[filled : filled + rows] = view[start : start + rows]
+            filled += rows
+        return filepath if cv2.imwrite(filepath, image[:filled]) else ""
+    finally:
+        driver.execute_script(_SCROLL_TO_JS, metrics["scrollX"], metrics["scrollY"])
+
+
+def _viewport_image(driver: WebDriver, scroll_y: Optional[float] = None) -> ndarray:
+    if scroll_y is not None:
+        driver.execute_script(_SCROLL_TO_JS, 0, scroll_y)
+    png = driver.get_screenshot_as_png()
+    return cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+
+
+def _sticky_rows(first: ndarray, scrolled: ndarray) -> tuple[int, int]:
+    """Return number of rows at the top and bottom which are the same after scrolling.
+
+    Rows are compared by hash. Matches covering half of the viewport are
+    treated as plain page background and ignored.
+    """
+    if first.shape != scrolled.shape:
+        return 0, 0
+    same = np.array([hash(a.tobytes()) == hash(b.tobytes()) for a, b in zip(first, scrolled)])
+    if same.all():
+        return 0, 0
+    header = int(np.argmin(same))
+    footer = int(np.argmin(same[::-1]))
+    if header + footer >= len(same) // 2:
+        return 0, 0
+    return header, footer
@@ -227,6 +227,9 @@ def get_text_using_anchor(text: str, anchor: str, **kwargs) -> WebElement:
     -------
     WebElement
     """
+    if _bundled_engine_supported(**kwargs):
+        return get_text_using_anchor_bundled(text, anchor, **kwargs)
+
     web_elements = get_all_text_elements(text, **kwargs)
 
     # filter elements by modal (dialog etc) if needed
@@ -242,6 +245,89 @@ def get_text_using_anchor(text: str, anchor: str, **kwargs) -> WebElement:
     return correct_element
 
 
+def _bundled_engine_supported(**kwargs) -> bool:
+    """Return True if bundled locator engine is selected and can handle the search.
+
+    Shadow DOM, all text nodes search, modal filtering and custom active area
+    functions are only supported by the default engine.
+    """
+    if CONFIG["LocatorEngine"] != "bundled":
+        return False
+    if CONFIG["ShadowDOM"] or CONFIG["IsModalXpath"] != SearchStrategies.IS_MODAL_XPATH:
+        return False
+    if util.par2bool(kwargs.get("all_text_nodes", CONFIG["AllTextNodes"])):
+        return False
+    return element.ACTIVE_AREA_FUNCTION is None
+
+
+@frame.all_frames
+def get_text_using_anchor_bundled(text: str, anchor: str, **kwargs) -> WebElement:
+    """Get WebElement that contains text using anchor with a single javascript call.
+
+    Does the same steps as the default engine (clickable and slot elements,
+    exact/containing text match, visibility check and anchor distance ranking),
+    but inside the page so that each frame costs only one round trip to the driver.
+
+    Parameters
+    ----------
+    text : str
+        Text on web page that is wanted to locate.
+    anchor : str
+        Unique text on web page which is close to the first argument or index.
+
+    Returns
+    -------
+    WebElement
+    """
+    partial = util.par2bool(kwargs.get("partial_match", CONFIG["PartialMatch"]))
+    anchor_index = None
+    if str(anchor).isdigit() and kwargs.get("anchor_type", "auto").lower() != "text":
+        anchor_index = int(anchor) - 1
+    escaped_text = util.escape_xpath_quotes(text)
+    escaped_anchor = util.escape_xpath_quotes(str(anchor))
+    slot_text = 'normalize-space(translate(., "\u00a0", " "))'
+    cfg = {
+        "skipClickable": "css" in kwargs,
+        "partialMatch": partial,
+        "visibility": util.par2bool(kwargs.get("visibility", CONFIG["Visibility"])),
+        "viewport": util.par2bool(kwargs.get("viewport", CONFIG["InViewport"])),
+        "offsetCheck": util.par2bool(kwargs.get("offset", CONFIG["OffsetCheck"])),
+        "activeAreaXpath": CONFIG["ActiveAreaXpath"],
+        "exactXpath": CONFIG["TextMatch"].replace('"{0}"', escaped_text),
+        "containsXpath": CONFIG["ContainingTextMatch"].replace('"{0}"', escaped_text),
+        "anchorExactXpath": CONFIG["TextMatch"].replace('"{0}"', escaped_anchor),
+        "anchorContainsXpath": CONFIG["ContainingTextMatch"].replace('"{0}"', escaped_anchor),
+        "slotExactXpath": f"//a[descendant::slot[{slot_text}={escaped_text}]]",
+        "slotContainsXpath": f"//a[descendant::slot[contains({slot_text}, {escaped_text})]]",
+        "anchorIndex": anchor_index,
+        "multipleAnchors": CONFIG["MultipleAnchors"],
+        "searchDirection": CONFIG["SearchDirection"],
+        "enforceDirection": CONFIG.enforce_direction(),
+    }
+    result = javascript.get_text_using_anchor(text, str(anchor), cfg)
+    status = result.get("status")
+    logger.debug(f"Bundled locator engine: {status}, diagnostics: {result.get('diagnostics')}")
+    if status == "found":
+        return result["elem"]
+    if status == "index_out_of_range":
+        raise QWebInstanceDoesNotExistError(
+            "Found {} elements. Given anchor was {}".format(
+                result["diagnostics"]["visible"], anchor
+            )
+        )
+    if status == "anchor_not_found":
+        raise QWebValueError('Text "{}" did not match any elements'.format(anchor))
+    if status == "anchor_not_unique":
+        raise QWebValueError(
+            'Text "{}" matched {} elements. Needs to be unique'.format(
+                anchor, result["diagnostics"]["anchorMatches"]
+            )
+        )
+    if status == "direction":
+        raise QWebElementNotFoundError("No elements found in enforced direction")
+    raise QWebElementNotFoundError('Webpage did not contain text "{}"'.format(text))
+
+
 def _get_exact_text_element(text: str, **kwargs) -> Optional[list[WebElement]]:
     xpath = CONFIG["TextMatch"].replace('"{0}"', util.escape_xpath_quotes(text))
     return element.get_webelements_in_active_area(xpath, **kwargs)
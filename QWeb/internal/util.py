@@ -404,6 +404,12 @@ def get_rfw_variable_value(key: str, default_value=None) -> Any:
         return default_value
 
 
+def is_debug_log_level() -> bool:
+    """Return True if robot fw log level is DEBUG or TRACE."""
+    level = str(get_rfw_variable_value("${LOG_LEVEL}", "INFO")).upper()
+    return level.startswith(("DEBUG", "TRACE"))
+
+
 def get_callable(pw: str) -> Callable[..., Any]:
     """Return function by Paceword name if exists."""
     lib = BuiltIn().get_library_instance("QWeb")
@@ -416,6 +422,24 @@ def get_callable(pw: str) -> Callable[..., Any]:
     raise QWebUnexpectedConditionError("Paceword {} not found".format(pw))
 
 
+def get_keyword_function(pw: str) -> Callable[..., Any]:
+    """Return function of Paceword without library's run before and run on failure handling.
+
+    Those run Robot Framework keywords (RunBefore, run on failure keyword,
+    DEV_MODE pause), which work only in main thread. Used for keywords run in
+    worker threads, which call decorators.prepare_keyword_kwargs before the
+    function to get the same argument handling and delay as the library.
+    """
+    fn = get_callable(pw)
+    # library wraps module functions with _run_on_failure_decorator and then
+    # _xpath_decorator, both using functools.wraps
+    keyword_function = getattr(getattr(fn, "__wrapped__", None), "__wrapped__", None)
+    if keyword_function is None:
+        return fn
+    lib = BuiltIn().get_library_instance("QWeb")
+    return lib._xpath_decorator(keyword_function)  # pylint: disable=protected-access
+
+
 def escape_xpath_quotes(text: str) -> str:
     """Return xpath text with proper quotes"""
     # both single and double quotes in text
@@ -497,3 +521,72 @@ def validate_wait_strategy(value: str) -> str:
     if value.lower() not in valid_strategies:
         raise ValueError(f"Invalid wait strategy: {value!r}. Must be one of: {valid_strategies}")
     return value.lower()
+
+
+def non_negative_int(value: Union[int, str]) -> int:
+    """Validate and convert value to integer >= 0."""
+    number = int(value)
+    if number < 0:
+        raise ValueError(f"Value must be 0 or greater, got {value!r}")
+    return number
+
+
+def validate_browser_pool_reset(value: str) -> str:
+    """Validate and normalize browser pool reset policy."""
+    valid_policies = ["reset", "keep", "restart"]
+    if value.lower() not in valid_policies:
+        raise ValueError(
+            f"Invalid browser pool reset policy: {value!r}. Must be one of: {valid_policies}"
+        )
+    return value.lower()
+
+
+def validate_icon_matcher(value: str) -> str:
+    """Validate and normalize icon matcher."""
+    valid_matchers = ["template", "orb", "akaze"]
+    if value.lower() not in valid_matchers:
+        raise ValueError(f"Invalid icon matcher: {value!r}. Must be one of: {valid_matchers}")
+    return value.lower()
+
+
+def validate_screenshot_format(value: str) -> str:
+    """Validate and normalize screenshot file format."""
+    valid_formats = ["png", "jpeg", "webp"]
+    image_format = value.lower().lstrip(".")
+    if image_format == "jpg":
+        image_format = "jpeg"
+    if image_format not in valid_formats:
+        raise ValueError(f"Invalid screenshot format: {value!r}. Must be one of: {valid_formats}")
+    return image_format
+
+
+def validate_screenshot_quality(value: Union[int, str]) -> int:
+    """Validate and convert screenshot quality to integer between 1 and 100."""
+    quality = int(value)
+    if not 1 <= quality <= 100:
+        raise ValueError(f"Screenshot quality must be between 1 and 100, got {value!r}")
+    return quality
+
+
+def validate_screenshot_scale(value: Union[float, str]) -> float:
+    """Validate and convert screenshot scale to float greater than 0 and at most 1."""
+    scale = float(value)
+    if not 0 < scale <= 1:
+        raise ValueError(f"Screenshot scale must be greater than 0 and at most 1, got {value!r}")
+    return scale
+
+
+def validate_retry_wait(value: str) -> str:
+    """Validate and normalize retry wait values."""
+    valid_values = ["poll", "event"]
+    if value.lower() not in valid_values:
+        raise ValueError(f"Invalid retry wait: {value!r}. Must be one of: {valid_values}")
+    return value.lower()
+
+
+def validate_locator_engine(value: str) -> str:
+    """Validate and normalize text locator engine values."""
+    valid_engines = ["default", "bundled"]
+    if value.lower() not in valid_engines:
+        raise ValueError(f"Invalid locator engine: {value!r}. Must be one of: {valid_engines}")
+    return value.lower()
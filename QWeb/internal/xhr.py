@@ -15,10 +15,16 @@
 # limitations under the License.
 # ---------------------------
 import time
+import weakref
 from robot.api import logger
-from selenium.common.exceptions import JavascriptException, WebDriverException
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
 from typing import Optional
-from QWeb.internal import javascript, util
+from QWeb.internal import browser, javascript, util
 from QWeb.internal.exceptions import QWebDriverError
 from QWeb.keywords import config
 
@@ -26,12 +32,31 @@ from QWeb.keywords import config
 # Install monitor (fetch/XMLHttpRequest + MutationObserver). Idempotent.
 JS_INSTALL_MONITOR = javascript.load_js("install_monitor.js")
 
+# Monitor as preload script, run when each document (window, frame) is created
+JS_PRELOAD_MONITOR = "function () {\n" + JS_INSTALL_MONITOR + "\n}"
+
 # Lightweight status
 JS_STATUS_LITE = javascript.load_js("wait_status_lite.js")
 
 # Separate spinner probe (selectors configurable)
 JS_IS_SPINNER_BUSY = javascript.load_js("spinner_busy.js")
 
+# Async wait in page: installs monitor and waits for readyState, network idle,
+# spinner and DOM quiet. Scripts above are wrapped as functions it calls.
+JS_WAIT_PAGE_READY = (
+    "function installMonitor() {\n" + JS_INSTALL_MONITOR + "\n}\n"
+    "function statusLite() {\n" + JS_STATUS_LITE + "\n}\n"
+    "function isSpinnerBusy() {\n" + JS_IS_SPINNER_BUSY + "\n}\n"
+    + javascript.load_js("wait_page_ready.js")
+)
+
+# Preload registrations of drivers: "bidi" or CDP registered window handles
+_PRELOADED: "weakref.WeakKeyDictionary[WebDriver, set[str]]" = weakref.WeakKeyDictionary()
+
+# Longest wait of one async script call. Kept below default script timeout
+# (30s) of webdrivers, longer waits are split to several calls.
+ASYNC_WAIT_MAX_MS = 10000
+
 
 def setup_xhr_monitor() -> bool:
     try:
@@ -41,6 +66,40 @@ def setup_xhr_monitor() -> bool:
         raise QWebDriverError(e)  # pylint: disable=W0707
 
 
+def register_xhr_monitor(driver: Optional[WebDriver] = None) -> bool:
+    """Register monitor to be installed when each document is created.
+
+    Requests made while the page boots are then counted from the first one.
+    Uses BiDi script.addPreloadScript (all windows and frames) when BiDi is
+    enabled, otherwise CDP Page.addScriptToEvaluateOnNewDocument (current
+    window) on Chromium. Returns False when neither is available, monitor is
+    then installed to the current document by setup_xhr_monitor or wait_xhr.
+    """
+    driver = driver or browser.get_current_browser()
+    registered = _PRELOADED.setdefault(driver, set())
+    if "bidi" in registered:
+        return True
+    capabilities = driver.capabilities
+    try:
+        if isinstance(capabilities.get("webSocketUrl"), str):
+            driver.script.add_preload_script(JS_PRELOAD_MONITOR)
+            registered.add("bidi")
+            return True
+        if "goog:chromeOptions" in capabilities or "ms:edgeOptions" in capabilities:
+            handle = driver.current_window_handle
+            if handle not in registered:
+                driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    {"source": f"({JS_PRELOAD_MONITOR})();"},
+                )
+                registered.add(handle)
+            return True
+    except (AttributeError, WebDriverException) as e:
+        # remote sessions may not support CDP commands
+        logger.debug(f"register_xhr_monitor failed: {e}")
+    return False
+
+
 def get_light_status(quiet_ms: int = 400) -> Optional[dict]:
     """Full status dict. None on failure."""
     try:
@@ -83,12 +142,46 @@ def _parse_spinner_selectors() -> Optional[list[str]]:
     return None
 
 
+def wait_page_ready(timeout_ms: int,
+                    quiet_ms: int = 400,
+                    dom_quiet_cap_ms: float = 600,
+                    spinner_css: Optional[list[str]] = None,
+                    skip_network: bool = False,
+                    poll_ms: int = 100) -> Optional[dict]:
+    """Wait inside the page with one async script call. None on failure.
+
+    Installs monitor if missing and waits readyState -> network idle -> spinner
+    gone -> DOM quiet (at most dom_quiet_cap_ms). Returns status of
+    get_light_status with "done", "phase" (step waited last) and "ms".
+    """
+    opts = {
+        "timeoutMs": timeout_ms,
+        "quietMs": quiet_ms,
+        "domQuietCapMs": dom_quiet_cap_ms,
+        "spinners": spinner_css,
+        "skipNetwork": skip_network,
+        "pollMs": poll_ms,
+    }
+    try:
+        st = javascript.execute_async_javascript(JS_WAIT_PAGE_READY, opts)
+        if isinstance(st, dict):
+            return st
+        logger.debug(f"wait_page_ready: unexpected return {type(st)}")
+        return None
+    except (JavascriptException, TimeoutException) as e:
+        # page navigating away aborts the script
+        logger.debug(f"wait_page_ready failed: {e}")
+        return None
+
+
 def wait_xhr(timeout: float = 15.0,
              poll_interval: float = 0.1,
              skip_network: bool = False) -> None:
     """
     Order: readyState -> network idle -> spinner gone -> DOM quiet (bounded).
     If skip_network is True, network idle check is skipped (for XHRTimeout='none').
+    Waiting is done in the page by wait_page_ready, which polls every `poll_interval`
+    without round trips to the driver. One call waits at most ASYNC_WAIT_MAX_MS.
     - `quiet_ms`: quiet window needed to call DOM "settled". This will come from
        config value `RenderWait`.
     - `dom_quiet_cap_ms`: capped maximum time to wait for DOM quiet. This is to avoid
@@ -102,57 +195,33 @@ def wait_xhr(timeout: float = 15.0,
     quiet_ms = util.parse_ms(config.get_config("RenderWait"))
     # wait at max configured quite_ms + multiplier or max amount (to avoid getting stuck)
     dom_quiet_cap_ms = min(quiet_ms * DOM_CAP_MULTIPLIER, DOM_QUIET_MAX_MS)
-    setup_xhr_monitor()
     start = time.time()
 
     while time.time() - start < timeout:
-        st = get_light_status(quiet_ms=quiet_ms)   # ready/networkIdle/domQuiet (no spinner)
+        remaining_ms = int((timeout - (time.time() - start)) * 1000)
+        st = wait_page_ready(min(remaining_ms, ASYNC_WAIT_MAX_MS),
+                             quiet_ms=quiet_ms,
+                             dom_quiet_cap_ms=dom_quiet_cap_ms,
+                             spinner_css=spinner_css,
+                             skip_network=skip_network,
+                             poll_ms=int(poll_interval * 1000))
 
         if st is None:
             logger.debug("wait_xhr: status probe failed (treating as not ready)")
             time.sleep(poll_interval)
             continue
 
-        if not st.get("ready"):
-            logger.debug("wait_xhr: waiting for document.readyState=complete")
-            time.sleep(poll_interval)
-            continue
-
-        if not skip_network and not st.get("networkIdle"):
-            logger.debug(
-                f"wait_xhr: waiting for network idle "
-                f"(pending={st.get('pending')} jqActive={st.get('jqActive')})"
-            )
-            time.sleep(poll_interval)
-            continue
-
-        # Spinner BEFORE DOM quiet (optional)
-        if spinner_css:
-            busy = is_spinner_busy(spinner_css)
-            if busy is None:
-                logger.debug("wait_xhr: spinner probe failed (ignoring); "
-                             "proceeding to bounded DOM quiet")
-            elif busy:
-                logger.debug("wait_xhr: spinner visible")
-                time.sleep(poll_interval)
-                continue
-
-        # BOUNDED DOM quiet (last, and capped)
-        if st.get("domQuiet"):
+        if st.get("done"):
+            if st.get("phase") == "domQuietCap":
+                # Cap reached; accept minor DOM churn and proceed
+                logger.debug("wait_xhr: DOM quiet cap reached, proceeding")
+            logger.debug(f"wait_xhr: page ready in {st.get('ms')}ms")
             return
 
-        logger.debug(f"wait_xhr: waiting for DOM quiet ({quiet_ms}ms window; "
-                     f"capped {dom_quiet_cap_ms}ms)")
-        dom_phase_start = time.time()
-        while (time.time() - dom_phase_start) * 1000.0 < dom_quiet_cap_ms:
-            st2 = get_light_status(quiet_ms=quiet_ms)
-            if st2 and st2.get("domQuiet"):
-                return
-            time.sleep(poll_interval)
-
-        # Cap reached; accept minor DOM churn and proceed
-        logger.debug("wait_xhr: DOM quiet cap reached, proceeding")
-        return
+        logger.debug(
+            f"wait_xhr: still waiting for {st.get('phase')} after {st.get('ms')}ms "
+            f"(pending={st.get('pending')} jqActive={st.get('jqActive')})"
+        )
 
     logger.debug(f"Page was not ready after {timeout} seconds. Trying to continue..")
 
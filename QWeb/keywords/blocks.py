@@ -20,8 +20,13 @@ from typing import Any, Union
 from robot.api import logger
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
-from QWeb.internal import decorators, blocks
-from QWeb.internal.exceptions import QWebElementNotFoundError, QWebUnexpectedConditionError
+from QWeb.internal import browser, decorators, blocks, util
+from QWeb.keywords import screenshot
+from QWeb.internal.exceptions import (
+    QWebElementNotFoundError,
+    QWebUnexpectedConditionError,
+    QWebValueError,
+)
 
 
 @keyword(tags=("Config", "Error handling"))
@@ -139,6 +144,94 @@ def appstate(block: str, *args) -> None:
         )
 
 
+@keyword(tags=("Browser", "Interaction"))
+def run_in_browsers(*steps: Any, browsers: str = "all", max_workers: int = 0) -> list[Any]:
+    r"""Run steps against several open browsers at the same time.
+
+    Each browser runs the steps in its own thread, with its own copy of
+    configuration, so one suite can run the same flow in N browser sessions
+    without separate robot processes.
+
+    Each step is a QWeb keyword name or a list containing keyword name and its
+    arguments. Only QWeb keywords are supported since Robot Framework can
+    run keywords from one thread only. Log messages from the steps are not
+    written to robot log, failures are reported after all browsers are done.
+    Delay is applied to the steps as usual, but RunBefore and run on failure
+    keyword are not run for them, instead a screenshot of each failed browser
+    is logged.
+
+    Examples
+    --------
+    .. code-block:: robotframework
+
+        OpenBrowser     ${URL}     chrome
+        OpenBrowser     ${URL}     chrome
+        OpenBrowser     ${URL}     firefox
+        ${login}=       Create List     TypeText    Username    demo
+        ${submit}=      Create List     ClickText   Login       timeout=20s
+        ${verify}=      Create List     VerifyText  Welcome
+        RunInBrowsers   ${login}   ${submit}   ${verify}
+        RunInBrowsers   RefreshPage   ${verify}   browsers=1,3   max_workers=2
+
+    Parameters
+    ----------
+    steps : str | list
+        Keywords to run. Keyword name or list of keyword name and arguments.
+    browsers : str
+        Comma separated indexes (as in SwitchBrowser, first = 1) of browsers
+        to use. Default all open browsers.
+    max_workers : int
+        Max number of browsers to drive at the same time. Default 0 (all).
+
+    Returns
+    -------
+    list
+        Return value of the last step for each browser.
+
+    Raises
+    ------
+    QWebUnexpectedConditionError
+        If steps failed in any of the browsers.
+
+    Related keywords
+    ----------------
+    \`ListBrowsers\`, \`OpenBrowser\`, \`SwitchBrowser\`
+    """
+    drivers = _get_browsers(browsers)
+    parsed = []
+    for step in steps:
+        name, args, kwargs = blocks.parse_step(step)
+        # failures are handled below in main thread
+        parsed.append((util.get_keyword_function(name), args, kwargs))
+    results = blocks.run_in_sessions(drivers, parsed, int(max_workers))
+    errors = []
+    for index, (driver, (_, error)) in enumerate(zip(drivers, results), start=1):
+        if error:
+            errors.append(f"Browser {index}: {error}")
+            with browser.session(driver):
+                screenshot.log_screenshot()
+    if errors:
+        raise QWebUnexpectedConditionError("\n".join(errors))
+    return [result for result, _ in results]
+
+
+def _get_browsers(browsers: str) -> list[Any]:
+    open_browsers = browser.get_open_browsers()
+    if not open_browsers:
+        raise QWebValueError("No browsers open. Use OpenBrowser keyword to open browsers first")
+    if str(browsers).lower() == "all":
+        return list(open_browsers)
+    drivers = []
+    for index in str(browsers).split(","):
+        i = int(index.strip()) - 1
+        if not 0 <= i < len(open_browsers):
+            raise QWebValueError(
+                f"No browser with index {index.strip()}, {len(open_browsers)} browsers open"
+            )
+        drivers.append(open_browsers[i])
+    return drivers
+
+
 @decorators.timeout_decorator
 def _execute_block(steps: list[dict[str, Any]], timeout: Union[int, float, str] = 0, **kwargs):  # pylint: disable=unused-argument
     logger.trace(f"Timeout for block: {timeout}")
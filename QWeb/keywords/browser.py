@@ -38,6 +38,7 @@ from QWeb.internal.browser import (
     bs_desktop,
     safari,
     edge,
+    pool,
 )
 from QWeb.internal.exceptions import QWebDriverError, QWebBrowserError
 
@@ -403,6 +404,8 @@ def open_browser(url: str,
             driver = bs_mobile.open_browser(bs_device, bs_project_name, bs_run_id, **kwargs)
         else:
             raise exceptions.QWebException("Unknown browserstack browser {}".format(browser_alias))
+    elif _use_pool(b_lower, option_list):
+        driver = _open_pooled_browser(b_lower, option_list, **kwargs)
     else:
         try:
             driver = _browser_checker(b_lower, option_list, **kwargs)
@@ -431,9 +434,13 @@ def open_browser(url: str,
     # variable BROWSER_REUSE=True. In that case no URL loaded needed as
     # user wants to continue with the existing browser session
     is_browser_reused = util.par2bool(util.get_rfw_variable_value("${BROWSER_REUSE}")) or False
-    if not (is_browser_reused and b_lower == "chrome"):
+    navigate = not (is_browser_reused and b_lower == "chrome")
+    # registered monitor is installed to the page before its first request
+    preloaded = xhr.register_xhr_monitor(driver)
+    if navigate:
         driver.get(url)
-    xhr.setup_xhr_monitor()
+    if not (preloaded and navigate):
+        xhr.setup_xhr_monitor()
 
 
 @keyword(tags=("Browser", "Interaction"))
@@ -544,11 +551,13 @@ def close_browser() -> None:
         # Clear browser re-use flag as no original session open anymore
         # not supported when running directly from Python
         BuiltIn().set_global_variable("${BROWSER_REUSE}", False)
-        driver.quit()
+        if not pool.POOL.release(driver):
+            driver.quit()
     except QWebDriverError:
         logger.info("All browser windows already closed")
     except RobotNotRunningError:
-        driver.quit()
+        if not pool.POOL.release(driver):
+            driver.quit()
 
 
 @keyword(tags=("Browser", "Interaction", "Remote"))
@@ -599,7 +608,8 @@ def close_all_browsers() -> None:
     drivers = browser.get_open_browsers()
     for driver in drivers:
         _close_remote_browser_session(driver, close_only=True)
-        driver.quit()
+        if not pool.POOL.release(driver):
+            driver.quit()
 
     # remove everything from our cache so that they will not be there for next case.
     browser.clear_browser_cache()
@@ -617,6 +627,41 @@ def close_all_browsers() -> None:
     CONFIG.set_value("Headless", False)
 
 
+@keyword(tags=("Browser", "Interaction"))
+def reset_browser_session() -> None:
+    r"""Reset current browser to clean state without closing it.
+
+    Faster alternative for CloseAllBrowsers + OpenBrowser in test setup.
+    Closes all but the first window, clears cookies, localStorage,
+    sessionStorage, IndexedDB and cache, navigates to about:blank and
+    resets all configurations to their defaults (see \`ResetConfig\`).
+
+    Storages are cleared from the origin of the page open in first window.
+    Cookies and cache of all sites are cleared with Chrome DevTools Protocol
+    in Chrome and Edge and with BiDi when browser was opened with bidi=True.
+    Otherwise only cookies of current site are cleared.
+
+    Examples
+    --------
+    .. code-block:: robotframework
+
+        *** Settings ***
+        Suite Setup       OpenBrowser    about:blank    chrome
+        Test Setup        ResetBrowserSession
+        Suite Teardown    CloseAllBrowsers
+
+    Related keywords
+    ----------------
+    \`CloseAllBrowsers\`, \`OpenBrowser\`, \`ResetConfig\`
+    """
+    driver = browser.get_current_browser()
+    pool.reset_browser(driver)
+    # Headless describes the open browser, not a setting
+    headless = CONFIG["Headless"]
+    CONFIG.reset_value()
+    CONFIG.set_value("Headless", headless)
+
+
 @keyword(tags=("Browser", "Verification"))
 def verify_links(
     url: str = "current", log_all: bool = False, header_only: bool = True, timeout=0
@@ -727,6 +772,38 @@ def _startup_logging() -> None:
         logger.warn("You have {} browser sessions already open".format(number_of_open_sessions))
 
 
+def _use_pool(browser_x: str, options: list[str]) -> bool:
+    """Pool is used only for local browsers without session re-use or own profile."""
+    if CONFIG["BrowserPoolSize"] <= 0 or browser_x not in pool.NAMES:
+        return False
+    # several browsers can't share the same profile
+    if any(opt.strip().startswith(("--user-data-dir", "-profile")) for opt in options):
+        return False
+    return not (
+        util.par2bool(util.get_rfw_variable_value("${BROWSER_REUSE}"))
+        or util.par2bool(util.get_rfw_variable_value("${BROWSER_REUSE_ENABLED}"))
+    )
+
+
+def _open_pooled_browser(browser_x: str, options: list[str], **kwargs) -> WebDriver:
+    """Take pre-launched browser from pool or open new one and start filling the pool."""
+    key = pool.make_key(browser_x, options, kwargs)
+    driver = pool.POOL.acquire(key)
+    if driver is not None:
+        browser.cache_browser(driver)
+        # Browser was launched in background, set config like browser openers do
+        if "headless" in kwargs or any("headless" in opt.lower() for opt in options):
+            CONFIG.set_value("Headless", True)
+    else:
+        driver = _browser_checker(browser_x, list(options), **dict(kwargs))
+
+    def factory() -> WebDriver:
+        return _browser_checker(browser_x, list(options), **dict(kwargs))
+
+    pool.POOL.adopt(key, driver, factory)
+    return driver
+
+
 def _browser_checker(browser_x: str, options: list[str], *args, **kwargs) -> WebDriver:
     """Determine the correct local browser in open_browser."""
 
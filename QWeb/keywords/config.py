@@ -36,8 +36,17 @@ def set_config(par: str, val: Any) -> Any:
     +---------------------+-----------------------------------------+----------------+
     | AllInputElements_   | Set search strategy for element search. |                |
     +---------------------+-----------------------------------------+----------------+
+    | BackgroundScreen-   | Write logged screenshots to disk in     |   True         |
+    | shots_              | background thread.                      |                |
+    +---------------------+-----------------------------------------+----------------+
     | BlindReturn_        | Return value without waiting            |   False        |
     +---------------------+-----------------------------------------+----------------+
+    | BrowserPoolReset_   | How pooled browser is cleaned when      |   reset        |
+    |                     | closed (reset, keep or restart).        |                |
+    +---------------------+-----------------------------------------+----------------+
+    | BrowserPoolSize_    | Number of browsers pre-launched in      |   0            |
+    |                     | background for OpenBrowser.             |                |
+    +---------------------+-----------------------------------------+----------------+
     | CaseInsensitive_    | Allow case insensitive search when      | False          |
     |                     | partial match is used                   |                |
     +---------------------+-----------------------------------------+----------------+
@@ -63,11 +72,23 @@ def set_config(par: str, val: Any) -> Any:
     | DoubleClick_        | Perform double-click action in all click|   False        |
     |                     | keywords.                               |                |
     +---------------------+-----------------------------------------+----------------+
+    | FrameAffinity_      | Search first from the frame where       |   False        |
+    |                     | element was found last time.            |                |
+    +---------------------+-----------------------------------------+----------------+
+    | FrameCache_         | Reuse found frames on same page and     |   False        |
+    |                     | search last matching frame first.       |                |
+    +---------------------+-----------------------------------------+----------------+
     | HandleAlerts_       | Automatically handle alerts.            |   True         |
     +---------------------+-----------------------------------------+----------------+
     | HighlightColor_     | Sets the highlight color to use when    |   blue         |
     |                     | element is highlighted.                 |                |
     +---------------------+-----------------------------------------+----------------+
+    | IconMatcher_        | Icon matching method: template, orb or  | template       |
+    |                     | akaze (keypoints, any scale).           |                |
+    +---------------------+-----------------------------------------+----------------+
+    | IconMatchWorkers_   | Number of threads used to match icon    |   0            |
+    |                     | scales in parallel (0 = no threads).    |                |
+    +---------------------+-----------------------------------------+----------------+
     | InputHandler_       | Use javascript, selenium or pyautogui   | selenium       |
     |                     | to input text.                          |                |
     +---------------------+-----------------------------------------+----------------+
@@ -80,6 +101,9 @@ def set_config(par: str, val: Any) -> Any:
     | LineBreak_          | Set key to send to text fields after    | ue004 (tab key)|
     |                     | typing.                                 |                |
     +---------------------+-----------------------------------------+----------------+
+    | LocatorEngine_      | Engine used to find elements by text    | default        |
+    |                     | (default or bundled).                   |                |
+    +---------------------+-----------------------------------------+----------------+
     | LogMatchedIcons_    | Highlights where icon was found on the  |   False        |
     |                     | screen and adds a sceenshot to logs     |                |
     +---------------------+-----------------------------------------+----------------+
@@ -107,11 +131,23 @@ def set_config(par: str, val: Any) -> Any:
     | RetryInterval_      | Timeout to wait before re-trying in     |   5s           |
     |                     | -Until/-While keywords.                 |                |
     +---------------------+-----------------------------------------+----------------+
+    | RetryWait_          | How to wait between element search      |   poll         |
+    |                     | retries (poll or event).                |                |
+    +---------------------+-----------------------------------------+----------------+
     | RunBefore_          | A keyword to be run before every        |   None         |
     |                     | interaction keyword. Useful for example |                |
     |                     | when there is a custom spinner that     |                |
     |                     | should be waited for                    |                |
     +---------------------+-----------------------------------------+----------------+
+    | ScreenshotFormat_   | File format of logged screenshots       | png            |
+    |                     | (png, jpeg, webp).                      |                |
+    +---------------------+-----------------------------------------+----------------+
+    | ScreenshotQuality_  | Quality of jpeg and webp screenshots    | 80             |
+    |                     | (1-100).                                |                |
+    +---------------------+-----------------------------------------+----------------+
+    | ScreenshotScale_    | Downscale logged screenshots by given   | 1.0            |
+    |                     | factor (greater than 0, at most 1).     |                |
+    +---------------------+-----------------------------------------+----------------+
     | ScreenShotType_     | Log html source, screenshot or both     | screenshot     |
     +---------------------+-----------------------------------------+----------------+
     | SearchDirection_    | Set relative search direction for       | closest        |
@@ -151,6 +187,27 @@ def set_config(par: str, val: Any) -> Any:
     +---------------------+-----------------------------------------+----------------+
 
 
+    .. _backgroundscreenshots:
+
+    ----
+
+    Parameter: BackgroundScreenshots
+    --------------------------------
+
+    Screenshots taken on failure only capture the screenshot and continue.
+    Decoding and writing the file is done in background thread, the log links
+    to the file right away. Files are written at the latest when the test
+    suite ends. If screenshots are taken faster than they are written, taking
+    a screenshot waits until there is room in the queue.
+
+    LogScreenshot always writes the file before it returns.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    BackgroundScreenshots    False
+
     .. _blindreturn:
 
     ----
@@ -173,6 +230,54 @@ def set_config(par: str, val: Any) -> Any:
         # One time use:
         ${VALUE}     GetInputValue     username     blind=True
 
+    .. _browserpoolreset:
+
+    ----
+
+    Parameter: BrowserPoolReset
+    ---------------------------
+
+    Sets what is done to pooled browser when it's closed with CloseBrowser
+    or CloseAllBrowsers. Has effect only when BrowserPoolSize_ is greater than 0.
+
+    **reset** closes extra windows, clears cookies, local and session storage
+    and navigates to about:blank. Browser is returned to the pool.
+
+    **keep** only navigates to about:blank. Cookies and storage are kept.
+
+    **restart** quits browser and launches a new one to the pool.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    BrowserPoolReset       restart
+
+    .. _browserpoolsize:
+
+    ----
+
+    Parameter: BrowserPoolSize
+    --------------------------
+
+    Sets how many browser sessions are kept pre-launched in background.
+    When OpenBrowser is called with the same browser and options again, ready
+    session is taken from the pool instead of starting a new browser. Closed
+    browsers are returned to the pool according to BrowserPoolReset_.
+
+    Pool is used only for local Chrome, Edge and Firefox. It's not used with
+    browser re-use, BrowserStack or browser profiles (--user-data-dir, -profile).
+    Default 0 disables the pool.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig      BrowserPoolSize    1
+        OpenBrowser    about:blank        chrome    # starts one more in background
+        CloseBrowser                                # browser is reset and kept open
+        OpenBrowser    about:blank        chrome    # uses pre-launched browser
+
     .. _caseinsensitive:
 
     ----
@@ -374,6 +479,47 @@ def set_config(par: str, val: Any) -> Any:
         SetConfig    DoubleClick          True    # All Click keywords perform double-click action
         SetConfig    DoubleClick          False   # Single-click action(default)
 
+    .. _frameaffinity:
+
+    ----
+
+    Parameter: FrameAffinity
+    ------------------------
+
+    When True, keywords first search the frame where they last found an element.
+    Other frames are searched only if element is not found there, so tests working
+    inside one deeply nested frame do not go through all frames on every keyword.
+
+    Note that if the same element exists in several frames, the one from the last
+    used frame is returned. Use GetFrameAffinityStats to see hit and miss counts.
+    Not used with Safari. Default = False.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    FrameAffinity    True
+
+    .. _framecache:
+
+    ----
+
+    Parameter: FrameCache
+    ---------------------
+
+    When True, frames found from a page are cached and reused by following keywords
+    instead of looking them up again on every search. Cache is invalidated when page
+    navigates or when frames are added, removed or changed on the page.
+    Frame where element was last found is searched first.
+
+    Not used with ShadowDOM or Safari. Default = False.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    FrameCache       True
+
     .. _handlealerts:
 
     ----
@@ -423,6 +569,53 @@ def set_config(par: str, val: Any) -> Any:
 
         SetConfig    HighlightColor       olive
 
+    .. _iconmatcher:
+
+    ----
+
+    Parameter: IconMatcher
+    ----------------------
+
+    Sets how ClickIcon, VerifyIcon and other icon keywords search the icon.
+    Icon keywords also have matcher argument to set it for one call.
+
+    template (default) correlates the icon scaled to a list of common
+    scalings with the screenshot.
+
+    orb and akaze match keypoints of the icon to keypoints of the screenshot,
+    which finds the icon at any scale in one pass. Found position is verified
+    by correlating the icon scaled to the found scale, so tolerance works as
+    with template. orb is usually faster, akaze finds different keypoints
+    and may suit some icons better. Icons with too few keypoints are searched with template matching.
+    Keypoints of icons are cached like the icon images.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    IconMatcher    orb
+        ClickIcon    person
+
+    .. _iconmatchworkers:
+
+    ----
+
+    Parameter: IconMatchWorkers
+    ---------------------------
+
+    Sets how many threads are used to match icon with different scales in
+    ClickIcon, VerifyIcon and other icon keywords. All scales are matched
+    concurrently, but the result is the same as without threads: the first
+    scale (in the order of likely scalings) which reaches tolerance wins.
+    Default 0 (and 1) matches scales one after another in current thread.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    IconMatchWorkers    8
+        ClickIcon    person
+
     .. _inputhandler:
 
     ----
@@ -575,6 +768,33 @@ def set_config(par: str, val: Any) -> Any:
         SetConfig   LineBreak    \ue007    # Enter key
         SetConfig   LineBreak    ${EMPTY}  # Do not send anything
 
+    .. _locatorengine:
+
+    ----
+
+    Parameter: LocatorEngine
+    ------------------------
+
+    Selects the engine used to find elements by their visible text (ClickText,
+    VerifyText, textual anchors etc.).
+
+    **default** finds candidates, checks their visibility and ranks them by anchor
+    with several separate WebDriver calls.
+
+    **bundled** does the same text matching, slot handling, visibility filtering and
+    anchor distance ranking inside the page with a single javascript call per frame.
+    This reduces latency especially with remote browsers (Selenium Grid etc.).
+    Searches using ShadowDOM, AllTextNodes, IsModalXpath or custom active area
+    function always use the default engine.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    LocatorEngine       bundled
+        ClickText    Save                anchor=Cancel
+        SetConfig    LocatorEngine       default
+
     .. _logmatchedicons:
 
     ----
@@ -749,6 +969,30 @@ def set_config(par: str, val: Any) -> Any:
         # One time use:
         ClickUntil      Foo         button       interval=3
 
+    .. _retrywait:
+
+    ----
+
+    Parameter: RetryWait
+    --------------------
+
+    Sets how keywords wait before searching element again when it was not found.
+
+    **poll** sleeps a short fixed delay (200ms) between searches.
+
+    **event** waits in browser with MutationObserver until locator text appears
+    to the page and searches again right after that. Changes inside cross origin
+    frames are not observed, so those are noticed latest after one second.
+    XPath locators and icons are always polled.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    RetryWait       event
+        VerifyText   Order saved     timeout=30s
+        SetConfig    RetryWait       poll
+
     .. _runbefore:
 
     ----
@@ -785,6 +1029,63 @@ def set_config(par: str, val: Any) -> Any:
         ClickText    Foo
         # Waits that text "Loading..." disappears before running other keywords
 
+    .. _screenshotformat:
+
+    ----
+
+    Parameter: ScreenshotFormat
+    ---------------------------
+
+    File format of screenshots logged by LogScreenshot and on failure. Value
+    can be png (default), jpeg or webp. Jpeg and webp files are much smaller
+    than png, which makes archiving long runs faster. Screenshots saved with
+    given filename, full page screenshots and VerifyApp images are always
+    saved as given.
+
+    Identical screenshots within a run are saved only once, later log entries
+    link to the same file.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    ScreenshotFormat    webp
+        SetConfig    ScreenshotFormat    jpeg
+
+    .. _screenshotquality:
+
+    ----
+
+    Parameter: ScreenshotQuality
+    ----------------------------
+
+    Quality of jpeg and webp screenshots from 1 to 100. Default is 80.
+    Not used with png.
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    ScreenshotFormat     jpeg
+        SetConfig    ScreenshotQuality    60
+
+    .. _screenshotscale:
+
+    ----
+
+    Parameter: ScreenshotScale
+    --------------------------
+
+    Scale logged screenshots down before saving them. Value must be greater
+    than 0 and at most 1. Default is 1.0 (original size).
+
+    Examples
+    ^^^^^^^^
+    .. code-block:: robotframework
+
+        SetConfig    ScreenshotScale    0.5
+        # Screenshots are saved with half of the width and height
+
     .. _screenshottype:
 
     ----
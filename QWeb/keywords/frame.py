@@ -24,9 +24,10 @@ from __future__ import print_function
 
 from selenium.common.exceptions import NoSuchFrameException
 
+from robot.api import logger
 from robot.api.deco import keyword
 
-from QWeb.internal import browser, element, frame, javascript
+from QWeb.internal import browser, element, frame, javascript, util
 
 
 @keyword(tags=["Config"])
@@ -83,6 +84,45 @@ def use_page() -> None:
     driver.switch_to.default_content()
 
 
+@keyword(tags=["Logging"])
+def get_frame_affinity_stats(reset: bool = False) -> dict[str, int]:
+    r"""Return how many times element was found from the frame where it was found last time.
+
+    Counts are collected when SetConfig FrameAffinity is True. Each hit is a search
+    that did not need to go through all frames on a page. Miss means element was not
+    in the last used frame and all frames were searched.
+
+    Examples
+    --------
+    .. code-block:: robotframework
+
+       SetConfig               FrameAffinity    True
+       ClickText               Save
+       ${stats}=               GetFrameAffinityStats
+       Log                     Hits: ${stats}[hits], misses: ${stats}[misses]
+       GetFrameAffinityStats   reset=True
+
+    Parameters
+    ----------
+    reset : bool
+        Clear stored frames and counts after getting them. Default False.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys hits and misses.
+
+    Related keywords
+    ----------------
+    \`UseFrame\`, \`UsePage\`
+    """
+    stats = frame.get_frame_affinity_stats()
+    logger.info("Frame affinity hits: {hits}, misses: {misses}".format(**stats))
+    if util.par2bool(reset):
+        frame.reset_frame_affinity()
+    return stats
+
+
 @keyword(tags=("Browser", "Interaction"))
 def refresh_page() -> None:
     r"""Refresh the current window.
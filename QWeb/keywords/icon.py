@@ -14,12 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ---------------------------
-from typing import Union, Optional
+from typing import Any, Union, Optional
 
 import pyautogui
 from selenium.webdriver.remote.webelement import WebElement
 from QWeb.internal import icon, decorators, screenshot, util, text, element
-from QWeb.internal.exceptions import QWebElementNotFoundError, QWebIconNotFoundError
+from QWeb.internal.region import get_region as _get_region
+from QWeb.internal.exceptions import (
+    QWebElementNotFoundError,
+    QWebIconNotFoundError,
+    QWebValueError,
+)
 from QWeb.internal.config_defaults import CONFIG
 from PIL import Image
 from robot.api import logger
@@ -37,6 +42,8 @@ def click_icon(
     timeout: Union[int, float, str] = 0,  # pylint: disable=unused-argument
     tolerance: float = 0.95,
     grayscale: bool = True,
+    region: Optional[str] = None,
+    matcher: Optional[str] = None,
 ) -> None:
     r"""Click the icon/bitmap on the screen.
 
@@ -62,6 +69,8 @@ def click_icon(
         ClickIcon                   plane
         # Click icon with stricter tolerance and comparing colors
         ClickIcon                   plane      tolerance=0.99     grayscale=False
+        # Search only inside toolbar element
+        ClickIcon                   plane      region=//div[@id\="toolbar"]
 
     Parameters
     ----------
@@ -82,6 +91,14 @@ def click_icon(
         and more reliable.
         When set to False, the comparison is done in color, which provides a stricter assessment.
         The default setting is True.
+    region : str
+        Search icon only from part of the screen. Locator of an element (text or xpath)
+        to search inside it, "viewport" for browser's visible area or
+        "x, y, width, height" in page (CSS) pixels relative to viewport.
+        None (default) searches the whole screenshot.
+    matcher : str
+        "template", "orb" or "akaze". Keypoint matchers orb and akaze find the icon
+        at any scale. None (default) uses IconMatcher configuration.
 
     Related keywords
     ----------------
@@ -105,6 +122,8 @@ def click_icon(
         pyautog=True,
         tolerance=tolerance,
         grayscale=grayscale,
+        region=_get_region(region),
+        matcher=matcher,
     )
     if x == -1:
         raise QWebElementNotFoundError("Couldn't find the icon from the screen")
@@ -122,6 +141,8 @@ def is_icon(
     browser_res_w: Optional[int] = None,
     tolerance: float = 0.95,
     grayscale: bool = True,
+    region: Optional[str] = None,
+    matcher: Optional[str] = None,
 ) -> bool:
     r"""Check is the icon on the screen.
 
@@ -143,6 +164,7 @@ def is_icon(
         ${status}    IsIcon    plane
         # Verify image with stricter tolerance and comparing colors
         ${status}    IsIcon    plane_red    tolerance=0.99    grayscale=False
+        ${status}    IsIcon    plane        region=viewport
 
     ${status} will be True or False.
 
@@ -163,6 +185,14 @@ def is_icon(
         and more reliable.
         When set to False, the comparison is done in color, which provides a stricter assessment.
         The default setting is True.
+    region : str
+        Search icon only from part of the screen. Locator of an element (text or xpath)
+        to search inside it, "viewport" for browser's visible area or
+        "x, y, width, height" in page (CSS) pixels relative to viewport.
+        None (default) searches the whole screenshot.
+    matcher : str
+        "template", "orb" or "akaze". Keypoint matchers orb and akaze find the icon
+        at any scale. None (default) uses IconMatcher configuration.
 
     Related keywords
     ----------------
@@ -184,6 +214,8 @@ def is_icon(
         pyautog=False,
         tolerance=tolerance,
         grayscale=grayscale,
+        region=_get_region(region),
+        matcher=matcher,
     )
 
     if x == -1:
@@ -200,6 +232,8 @@ def verify_icon(
     timeout: Union[int, float, str] = 0,  # pylint: disable=unused-argument
     tolerance: float = 0.95,
     grayscale: bool = True,
+    region: Optional[str] = None,
+    matcher: Optional[str] = None,
 ) -> bool:
     r"""Verify page contains icon/bitmap.
 
@@ -229,6 +263,9 @@ def verify_icon(
         VerifyIcon                   plane
         # Verify image with stricter tolerance and comparing colors
         VerifyIcon                   plane_red      tolerance=0.99     grayscale=False
+        VerifyIcon                   plane          region=0, 0, 400, 80
+        # Find icon rendered at any scale
+        VerifyIcon                   plane          matcher=orb
 
     Parameters
     ----------
@@ -249,6 +286,14 @@ def verify_icon(
         and more reliable.
         When set to False, the comparison is done in color, which provides a stricter assessment.
         The default setting is True.
+    region : str
+        Search icon only from part of the screen. Locator of an element (text or xpath)
+        to search inside it, "viewport" for browser's visible area or
+        "x, y, width, height" in page (CSS) pixels relative to viewport.
+        None (default) searches the whole screenshot.
+    matcher : str
+        "template", "orb" or "akaze". Keypoint matchers orb and akaze find the icon
+        at any scale. None (default) uses IconMatcher configuration.
 
     Related keywords
     ----------------
@@ -271,12 +316,129 @@ def verify_icon(
         pyautog=False,
         tolerance=tolerance,
         grayscale=grayscale,
+        region=_get_region(region),
+        matcher=matcher,
     )
     if x == -1:
         raise QWebIconNotFoundError("Couldn't find the icon from the screen")
     return True
 
 
+@keyword(tags=("Icon", "Verification"))
+@decorators.timeout_decorator
+def verify_icons(
+    images: Union[str, list[str]],
+    template_res_w: Optional[int] = None,
+    browser_res_w: Optional[int] = None,
+    timeout: Union[int, float, str] = 0,  # pylint: disable=unused-argument
+    tolerance: float = 0.95,
+    grayscale: bool = True,
+    region: Optional[str] = None,
+    matcher: Optional[str] = None,
+    raise_error: bool = True,
+) -> dict[str, dict[str, Any]]:
+    r"""Verify page contains all given icons/bitmaps.
+
+    Works like \`VerifyIcon\`, but takes one screenshot and matches all
+    reference images against it. This is much faster than verifying icons one
+    by one, as the screen is captured and converted only once. With
+    IconMatchWorkers configuration icons are matched in parallel.
+
+    Returns a result for each icon, keyed by the given image name.
+
+    Examples
+    --------
+    .. code-block:: robotframework
+
+        VerifyIcons                  plane, car, boat
+        @{icons}=                    Create List    plane    car    boat
+        ${result}=                   VerifyIcons    ${icons}    region=viewport
+        Log                          ${result}[plane][score]
+        # Return results without failing when some icons are missing
+        ${result}=                   VerifyIcons    plane, car    raise_error=False
+        Should Be True               ${result}[car][found]
+
+    Parameters
+    ----------
+    images : str | list
+        Image names with or without extension as a list or a comma separated string.
+    template_res_w : int
+        Reference image resolution / width. 1920 by default and
+        image will be scaled to most common resolutions.
+    browser_res_w : int
+        Browser resolution / width. None (default) indicates
+        that QWeb will figure out current browser width.
+    timeout : int
+        How long we try to find the icons for.
+    tolerance : float
+        Tolerance level for image comparison. Default is 0.95, where 1.0 is exact match.
+    grayscale : bool
+        When set to True, the image comparison is done in grayscale, which tends to be quicker
+        and more reliable.
+        When set to False, the comparison is done in color, which provides a stricter assessment.
+        The default setting is True.
+    region : str
+        Search icons only from part of the screen. Locator of an element (text or xpath)
+        to search inside it, "viewport" for browser's visible area or
+        "x, y, width, height" in page (CSS) pixels relative to viewport.
+        None (default) searches the whole screenshot.
+    matcher : str
+        "template", "orb" or "akaze". Keypoint matchers orb and akaze find the icon
+        at any scale. None (default) uses IconMatcher configuration.
+    raise_error : bool
+        Fail if any of the icons is not found. Default True. When False, results
+        are returned right away without retrying.
+
+    Returns
+    -------
+    dict
+        Dictionary of image name to dictionary with keys found (bool),
+        score (best correlation value), x and y (center of match, -1 if not found).
+
+    Related keywords
+    ----------------
+    \`ClickIcon\`, \`IsIcon\`, \`VerifyIcon\`
+    """
+    if isinstance(images, str):
+        images = [image.strip() for image in images.split(",") if image.strip()]
+    if not images:
+        raise QWebValueError("No images given")
+
+    if not browser_res_w:
+        browser_res_w = util.get_browser_width()
+
+    # use current resolution by default
+    if not template_res_w:
+        template_res_w = browser_res_w
+
+    template_res_w, browser_res_w = int(template_res_w), int(browser_res_w)
+
+    image_paths = [str(icon.get_full_image_path(image)) for image in images]
+    matches = icon.images_recognition(
+        image_paths,
+        template_res_w,
+        browser_res_w,
+        pyautog=False,
+        tolerance=tolerance,
+        grayscale=grayscale,
+        region=_get_region(region),
+        matcher=matcher,
+    )
+    result = {}
+    for image, image_path in zip(images, image_paths):
+        match = matches[image_path]
+        x, y = match.location if match.found else (-1, -1)
+        result[image] = {"found": match.found, "score": round(match.score, 4), "x": x, "y": y}
+    missing = [image for image, item in result.items() if not item["found"]]
+    if missing and util.par2bool(raise_error):
+        raise QWebIconNotFoundError(
+            "Couldn't find icons from the screen: {}".format(
+                ", ".join(f"{image} (score {result[image]['score']})" for image in missing)
+            )
+        )
+    return result
+
+
 @keyword(tags=("Icon", "Interaction"))
 @decorators.timeout_decorator
 def capture_icon(
@@ -333,3 +495,45 @@ def capture_icon(
         screenshot.log_screenshot_file(filepath)
 
     return filepath
+
+
+@keyword(tags=["Logging"])
+def get_icon_cache_stats(reset: bool = False) -> dict[str, int]:
+    r"""Return statistics of the icon template cache.
+
+    Icon keywords keep decoded and scaled reference images in memory, so
+    the same icon is not read from disk and resized again on every call.
+    Cached images are re-read when the image file changes. Least recently
+    used images are evicted when cache grows over 64 MB.
+
+    Examples
+    --------
+    .. code-block:: robotframework
+
+       ClickIcon             plane
+       ${stats}=             GetIconCacheStats
+       Log                   Hits: ${stats}[hits], evictions: ${stats}[evictions]
+       GetIconCacheStats     reset=True
+
+    Parameters
+    ----------
+    reset : bool
+        Clear cached images and counts after getting them. Default False.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys hits, misses, evictions, bytes and size (cached icons).
+
+    Related keywords
+    ----------------
+    \`ClickIcon\`, \`IsIcon\`, \`VerifyIcon\`
+    """
+    stats = icon.get_template_cache_stats()
+    logger.info(
+        "Icon cache hits: {hits}, misses: {misses}, evictions: {evictions}, "
+        "icons: {size}, bytes: {bytes}".format(**stats)
+    )
+    if util.par2bool(reset):
+        icon.clear_template_cache()
+    return stats
@@ -15,26 +15,34 @@
 # limitations under the License.
 # ---------------------------
 
-from typing import Optional
+from typing import Optional, Union
+from selenium.webdriver.remote.webelement import WebElement
 from QWeb.internal import screenshot
 from QWeb.internal.config_defaults import CONFIG
+from QWeb.internal.region import get_region as _get_region
 from robot.api import logger
 from robot.api.deco import keyword
 
 
-def verify_app(imagename: str) -> None:
+def verify_app(imagename: str, region: Optional[str] = None) -> None:
     """Compare image to a known good one.
 
     :param imagename:
+    :param region: locator of an element (text or xpath) or "x, y, width, height"
+        in viewport CSS pixels to compare only that area
     :return:
     """
-    status = screenshot.compare_screenshots(imagename, CONFIG["VerifyAppAccuracy"])
+    status = screenshot.compare_screenshots(
+        imagename, CONFIG["VerifyAppAccuracy"], clip=_get_clip(region)
+    )
     if status is False:
         raise ValueError("Images differ")
 
 
 @keyword(tags=["Logging"])
-def log_screenshot(filename: str = "screenshot_{}.png", fullpage: bool = False) -> Optional[str]:
+def log_screenshot(
+    filename: str = "screenshot_{}.png", fullpage: bool = False, region: Optional[str] = None
+) -> Optional[str]:
     r"""Log screenshot to Robot Framework log.
 
     Examples
@@ -43,6 +51,8 @@ def log_screenshot(filename: str = "screenshot_{}.png", fullpage: bool = False)
 
        LogScreenshot
        ${file}=     LogScreenshot  # returns full path to saved image file
+       LogScreenshot    region=//div[@id\="cart"]
+       LogScreenshot    region=0, 0, 400, 300
 
     Parameters
     ----------
@@ -54,9 +64,20 @@ def log_screenshot(filename: str = "screenshot_{}.png", fullpage: bool = False)
 
     fullpage : str
         | Capture full page screenshot instead of visible area only (if browser/driver supports it).
-        | Currently supported in Firefox and Chromium based browsers (Chrome/Edge).
+        | Firefox and Chromium based browsers (Chrome/Edge) capture the page natively.
+        | Other browsers and remote Chromium sessions scroll the page and stitch the
+        | screenshots together, sticky headers and footers are included once.
         | Default: False (visible area only)
 
+    region : str
+        | Capture only an element or area of the page. Locator of an element (text
+        | or xpath) or "x, y, width, height" in page (CSS) pixels relative to viewport.
+        | Element is scrolled into view first. Chromium based browsers capture only
+        | the area, also beyond the visible area. Other browsers use element
+        | screenshot for elements and crop areas and elements inside frames from
+        | the visible area.
+        | Overrides fullpage. Default: None (whole visible area)
+
     Returns
     -------
     filepath : full path to saved screenshot
@@ -65,16 +86,30 @@ def log_screenshot(filename: str = "screenshot_{}.png", fullpage: bool = False)
     ----------------
     \`LogPage\`
     """
+    return _log_screenshot(filename, fullpage, _get_clip(region))
+
+
+def _log_screenshot(
+    filename: str = "screenshot_{}.png",
+    fullpage: bool = False,
+    clip: Union[WebElement, tuple[float, ...], None] = None,
+    background: bool = False,
+) -> Optional[str]:
+    """Implementation of LogScreenshot, background is used by run on failure only."""
     filepath: Optional[str] = None
     if CONFIG["LogScreenshot"]:
         screenshot_type = CONFIG["ScreenshotType"]
         if screenshot_type == "screenshot":
-            filepath = screenshot.save_screenshot(filename, fullpage=fullpage)
+            filepath = screenshot.save_screenshot(
+                filename, fullpage=fullpage, background=background, clip=clip
+            )
             screenshot.log_screenshot_file(filepath)
         elif screenshot_type == "html":
             screenshot.log_html()
         elif screenshot_type == "all":
-            filepath = screenshot.save_screenshot(filename, fullpage=fullpage)
+            filepath = screenshot.save_screenshot(
+                filename, fullpage=fullpage, background=background, clip=clip
+            )
             screenshot.log_screenshot_file(filepath)
             screenshot.log_html()
         else:
@@ -83,3 +118,10 @@ def log_screenshot(filename: str = "screenshot_{}.png", fullpage: bool = False)
         logger.info("Screenshots have been disabled with the SetConfig keyword.")
 
     return filepath
+
+
+def _get_clip(region: Optional[str]) -> Union[WebElement, tuple[float, ...], None]:
+    """Returns element or region (x, y, width, height) in viewport CSS pixels,
+    None for whole viewport. Elements inside frames are returned as region."""
+    area = _get_region(region, top_element=True)
+    return None if isinstance(area, str) else area
@@ -108,6 +108,8 @@ def open_window() -> str:
     window.switch_to_window(new_handle)
 
     try:
+        # pages loaded to the new window get monitor at creation
+        xhr.register_xhr_monitor()
         xhr.setup_xhr_monitor()
     except QWebDriverError:
         logger.debug("XHR monitor threw exception. Bypassing jQuery injection")
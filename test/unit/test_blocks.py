@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+from QWeb.internal import blocks, browser
+from QWeb.internal.config_defaults import CONFIG
+from QWeb.internal.exceptions import QWebElementNotFoundError
+from unittest.mock import patch
+
+
+def test_run_in_sessions():
+    def current_browser():
+        return browser.get_current_browser()
+
+    def fail_in_second():
+        if browser.get_current_browser() == 'driver2':
+            raise QWebElementNotFoundError('not found')
+
+    steps = [(current_browser, [], {})]
+    assert blocks.run_in_sessions(['driver1', 'driver2'], steps) == [('driver1', None),
+                                                                     ('driver2', None)]
+    results = blocks.run_in_sessions(['driver1', 'driver2'], [(fail_in_second, [], {})])
+    assert results[0] == (None, None)
+    assert isinstance(results[1][1], QWebElementNotFoundError)
+
+
+@patch('QWeb.internal.decorators.time.sleep')
+def test_run_in_sessions_delay(patched_sleep):
+    def step(text, **kwargs):
+        return kwargs
+
+    # delay argument of step, names are lowercased as in library wrapper
+    results = blocks.run_in_sessions(['driver1'], [(step, ['Login'], {'Delay': '2s'})])
+    assert results == [({'delay': '2s'}, None)]
+    patched_sleep.assert_called_once_with(2.0)
+
+    # configured Delay
+    patched_sleep.reset_mock()
+    CONFIG.set_value("Delay", "1s")
+    try:
+        blocks.run_in_sessions(['driver1', 'driver2'], [(step, ['Login'], {})])
+    finally:
+        CONFIG.reset_value("Delay")
+    assert patched_sleep.call_count == 2
+    patched_sleep.assert_called_with(1.0)
+
+
+def test_parse_step():
+    assert blocks.parse_step('RefreshPage') == ('RefreshPage', [], {})
+    assert blocks.parse_step(['ClickText', 'Login', 'timeout=5s']) == \
+        ('ClickText', ['Login'], {'timeout': '5s'})
@@ -8,6 +8,7 @@
 # derivative works, or reverse engineering are prohibited.
 # ---------------------------
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
 from QWeb.internal.config_defaults import CONFIG
 from QWeb.keywords import config
@@ -179,3 +180,101 @@ class TestConfig:
 
         config.reset_config("WaitStrategy")
         assert config.get_config("WaitStrategy") == "enhanced"
+
+    @staticmethod
+    def test_set_locator_engine():
+        with pytest.raises(ValueError):
+            config.set_config("LocatorEngine", "unknown")
+        assert config.get_config("LocatorEngine") == "default"
+
+        old_val = config.set_config("LocatorEngine", "Bundled")
+        assert old_val == "default"
+        assert config.get_config("LocatorEngine") == "bundled"
+
+        config.reset_config("LocatorEngine")
+        assert config.get_config("LocatorEngine") == "default"
+
+    @staticmethod
+    def test_config_session():
+        config.set_config("SearchDirection", "down")
+
+        def worker():
+            with CONFIG.session():
+                config.set_config("SearchDirection", "up")
+                return config.get_config("SearchDirection")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(worker).result() == "up"
+        assert config.get_config("SearchDirection") == "down"
+
+    @staticmethod
+    def test_set_retry_wait():
+        with pytest.raises(ValueError):
+            config.set_config("RetryWait", "sometimes")
+        assert config.get_config("RetryWait") == "poll"
+
+        old_val = config.set_config("RetryWait", "Event")
+        assert old_val == "poll"
+        assert config.get_config("RetryWait") == "event"
+
+        config.reset_config("RetryWait")
+        assert config.get_config("RetryWait") == "poll"
+
+    @staticmethod
+    def test_set_browser_pool():
+        with pytest.raises(ValueError):
+            config.set_config("BrowserPoolSize", "-1")
+        assert config.get_config("BrowserPoolSize") == 0
+        config.set_config("BrowserPoolSize", "2")
+        assert config.get_config("BrowserPoolSize") == 2
+        config.reset_config("BrowserPoolSize")
+
+        with pytest.raises(ValueError):
+            config.set_config("BrowserPoolReset", "clean")
+        old_val = config.set_config("BrowserPoolReset", "Restart")
+        assert old_val == "reset"
+        assert config.get_config("BrowserPoolReset") == "restart"
+        config.reset_config("BrowserPoolReset")
+
+    @staticmethod
+    def test_set_icon_match_workers():
+        with pytest.raises(ValueError):
+            config.set_config("IconMatchWorkers", "-2")
+        old_val = config.set_config("IconMatchWorkers", "4")
+        assert old_val == 0
+        assert config.get_config("IconMatchWorkers") == 4
+        config.reset_config("IconMatchWorkers")
+
+    @staticmethod
+    def test_set_background_screenshots():
+        old_val = config.set_config("BackgroundScreenshots", "false")
+        assert old_val is True
+        assert config.get_config("BackgroundScreenshots") is False
+        config.reset_config("BackgroundScreenshots")
+
+    @staticmethod
+    def test_set_screenshot_encoding():
+        with pytest.raises(ValueError):
+            config.set_config("ScreenshotFormat", "gif")
+        with pytest.raises(ValueError):
+            config.set_config("ScreenshotQuality", "0")
+        with pytest.raises(ValueError):
+            config.set_config("ScreenshotScale", "1.5")
+        assert config.set_config("ScreenshotFormat", "JPG") == "png"
+        assert config.get_config("ScreenshotFormat") == "jpeg"
+        assert config.set_config("ScreenshotQuality", "60") == 80
+        assert config.get_config("ScreenshotQuality") == 60
+        assert config.set_config("ScreenshotScale", "0.5") == 1.0
+        assert config.get_config("ScreenshotScale") == 0.5
+        config.reset_config("ScreenshotFormat")
+        config.reset_config("ScreenshotQuality")
+        config.reset_config("ScreenshotScale")
+
+    @staticmethod
+    def test_set_icon_matcher():
+        with pytest.raises(ValueError):
+            config.set_config("IconMatcher", "sift")
+        old_val = config.set_config("IconMatcher", "ORB")
+        assert old_val == "template"
+        assert config.get_config("IconMatcher") == "orb"
+        config.reset_config("IconMatcher")
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+import time
+from QWeb.internal import decorators
+from QWeb.internal.config_defaults import CONFIG, SHORT_DELAY
+from QWeb.internal.exceptions import QWebDriverError
+from selenium.common.exceptions import TimeoutException
+from unittest.mock import patch
+
+
+def teardown_function():
+    CONFIG.reset_value("RetryWait")
+
+
+def test_is_text_locator():
+    assert decorators._is_text_locator('Login')
+    assert decorators._is_text_locator('Save // Exit')
+    assert not decorators._is_text_locator('//button')
+    assert not decorators._is_text_locator('(//button)[2]')
+    assert not decorators._is_text_locator('xpath=//button')
+    assert not decorators._is_text_locator('css=.login')
+    assert not decorators._is_text_locator('  ')
+    assert not decorators._is_text_locator(None)
+    assert not decorators._is_text_locator(3)
+
+
+@patch('QWeb.internal.decorators.time.sleep')
+@patch('QWeb.internal.javascript.execute_async_javascript')
+def test_wait_before_retry_poll(patched_js, patched_sleep):
+    decorators._wait_before_retry('Login', time.time() + 5)
+    patched_js.assert_not_called()
+    patched_sleep.assert_called_once_with(SHORT_DELAY)
+
+    # xpath locators are always polled
+    CONFIG.set_value("RetryWait", "event")
+    decorators._wait_before_retry('//button', time.time() + 5)
+    patched_js.assert_not_called()
+    assert patched_sleep.call_count == 2
+
+
+@patch('QWeb.internal.decorators.time.sleep')
+@patch('QWeb.internal.javascript.execute_async_javascript')
+def test_wait_before_retry_event(patched_js, patched_sleep):
+    CONFIG.set_value("RetryWait", "event")
+
+    # text appeared, element is searched again right away
+    patched_js.return_value = {'status': 'appeared'}
+    decorators._wait_before_retry('Login', time.time() + 5)
+    args = patched_js.call_args[0]
+    assert args[1] == 'Login'
+    assert args[2] == int(decorators.EVENT_WAIT_MAX * 1000)
+    patched_sleep.assert_not_called()
+
+    # wait is capped by remaining timeout
+    decorators._wait_before_retry('Login', time.time() + 0.5)
+    assert 0 < patched_js.call_args[0][2] <= 500
+
+    # text already in DOM, element is not usable yet
+    patched_js.return_value = {'status': 'present'}
+    decorators._wait_before_retry('Login', time.time() + 5)
+    patched_sleep.assert_called_once_with(SHORT_DELAY)
+
+    # deadline has passed
+    patched_js.reset_mock()
+    decorators._wait_before_retry('Login', time.time() - 1)
+    patched_js.assert_not_called()
+    assert patched_sleep.call_count == 1
+
+
+@patch('QWeb.internal.decorators.time.sleep')
+@patch('QWeb.internal.javascript.execute_async_javascript')
+def test_wait_before_retry_event_fails(patched_js, patched_sleep):
+    CONFIG.set_value("RetryWait", "event")
+    for error in (TimeoutException('script timeout'), QWebDriverError('no browser')):
+        patched_sleep.reset_mock()
+        patched_js.side_effect = error
+        decorators._wait_before_retry('Login', time.time() + 5)
+        patched_sleep.assert_called_once_with(SHORT_DELAY)
@@ -17,9 +17,12 @@
 
 import pytest
 from QWeb.internal.exceptions import QWebElementNotFoundError, QWebValueError
-from QWeb.internal.element import _overlap, \
-                                  _get_closest_ortho_element, \
+import numpy as np
+from QWeb.internal.element import _overlaps, \
+                                  _closest_distances, \
+                                  _closest_ortho_index, \
                                   get_closest_element, \
+                                  DEFAULT_DISTANCE, \
                                   get_unique_element_by_xpath, CONFIG
 from QWeb.keywords.config import  set_config
 from unittest.mock import patch, MagicMock
@@ -28,53 +31,45 @@ def setup_function():
     # we can't draw rectangle to mocked objects
     set_config("SearchMode", None)
 
-@patch('QWeb.internal.element._get_corners_locations')
-def test_no_overlap(patch_corners):
-    c1 = ({'x': 10, 'y': 10}, {'x': 20, 'y': 10},
-          {'x': 10, 'y': 20}, {'x': 20, 'y': 20})
-    c2 = ({'x': 30, 'y': 30}, {'x': 40, 'y': 30},
-          {'x': 30, 'y': 40}, {'x': 40, 'y': 40})
-    patch_corners.side_effect = [c1, c2]
-    assert not _overlap(None, None)
-
-
-@patch('QWeb.internal.element._get_corners_locations')
-def test_overlap_side(patch_corners):
-    c1 = ({'x': 10, 'y': 15}, {'x': 20, 'y': 15},
-          {'x': 10, 'y': 20}, {'x': 20, 'y': 20})
-    c2 = ({'x': 15, 'y': 10}, {'x': 40, 'y': 10},
-          {'x': 15, 'y': 30}, {'x': 40, 'y': 30})
-    patch_corners.side_effect = [c1, c2]
-    assert _overlap(None, None)
-
-
-@patch('QWeb.internal.element._get_corners_locations')
-def test_overlap_corner(patch_corners):
-    c1 = ({'x': 10, 'y': 10}, {'x': 20, 'y': 10},
-          {'x': 10, 'y': 20}, {'x': 20, 'y': 20})
-    c2 = ({'x': 15, 'y': 15}, {'x': 40, 'y': 15},
-          {'x': 15, 'y': 30}, {'x': 40, 'y': 30})
-    patch_corners.side_effect = [c1, c2]
-    assert _overlap(None, None)
-
-
-@patch('QWeb.internal.element._get_corners_locations')
-def test_inside(patch_corners):
-    c1 = ({'x': 10, 'y': 10}, {'x': 20, 'y': 10},
-          {'x': 10, 'y': 20}, {'x': 20, 'y': 20})
-    c2 = ({'x': 15, 'y': 15}, {'x': 18, 'y': 15},
-          {'x': 15, 'y': 18}, {'x': 18, 'y': 18})
-    patch_corners.side_effect = [c1, c2]
-    assert _overlap(None, None)
-
-
-@patch('QWeb.internal.element._get_center_location')
-def test_get_closest_parallel_element(patch_center):
-    c1 = {'x': 10, 'y': 10}
-    c2 = {'x': 12, 'y': 10}
-    c3 = {'x': 12, 'y': 12}
-    patch_center.side_effect = [c1, c2, c1, c3]
-    assert _get_closest_ortho_element('mock1', ['mock2', 'mock3']) == 'mock2'
+def test_no_overlap():
+    anchor = np.array([10, 10, 10, 10], dtype=float)
+    rects = np.array([[30, 30, 10, 10]], dtype=float)
+    assert not _overlaps(anchor, rects)[0]
+
+
+def test_overlap_side():
+    anchor = np.array([10, 15, 10, 5], dtype=float)
+    rects = np.array([[15, 10, 25, 20]], dtype=float)
+    assert _overlaps(anchor, rects)[0]
+
+
+def test_overlap_corner():
+    anchor = np.array([10, 10, 10, 10], dtype=float)
+    rects = np.array([[15, 15, 25, 15]], dtype=float)
+    assert _overlaps(anchor, rects)[0]
+
+
+def test_inside():
+    anchor = np.array([10, 10, 10, 10], dtype=float)
+    rects = np.array([[15, 15, 3, 3], [30, 30, 10, 10]], dtype=float)
+    assert _overlaps(anchor, rects).tolist() == [True, False]
+
+
+def test_closest_distances():
+    anchor = np.array([0, 0, 10, 10], dtype=float)
+    rects = np.array([[20, -30, 10, 10], [0, 30, 10, 10]], dtype=float)
+    assert _closest_distances(anchor, rects, "closest").tolist() == [30, 20]
+    assert _closest_distances(anchor, rects, "down").tolist() == [DEFAULT_DISTANCE, 20]
+    assert _closest_distances(anchor, rects, "up").tolist() == [30, DEFAULT_DISTANCE]
+
+
+def test_get_closest_parallel_element():
+    anchor = np.array([10, 10, 0, 0], dtype=float)
+    rects = np.array([[12, 12, 0, 0], [12, 10, 0, 0], [30, 30, 0, 0]], dtype=float)
+    assert _closest_ortho_index(anchor, rects, [0, 1]) == 1
+    assert _closest_ortho_index(anchor, rects, [2]) == 2
+    with pytest.raises(IndexError):
+        _closest_ortho_index(anchor, rects, [])
 
 
 def test_no_visible_elements():
@@ -243,6 +238,29 @@ def test_get_closest_element_rounding_simulate_py3_rounding():
     assert get_closest_element(locator_element, [cand3, cand1, cand2]) == cand2
 
 
+@patch('QWeb.internal.javascript.get_bounding_rects')
+def test_get_closest_element_batched_rects(patch_rects):
+    locator_element = MagicMock()
+    cand1, cand2, cand3 = MagicMock(), MagicMock(), MagicMock()
+    patch_rects.return_value = {
+        'rects': [[28, 328, 337, 31], [370, 150, 96, 22], [370, 332, 96, 22], [550, 432, 96, 22]],
+        'html': []
+    }
+    assert get_closest_element(locator_element, [cand1, cand2, cand3]) == cand2
+    assert patch_rects.call_count == 1
+    locator_element.get_attribute.assert_not_called()
+
+    CONFIG.set_value("SearchDirection", "down!")
+    patch_rects.return_value = {
+        'rects': [[28, 328, 337, 31], [370, 150, 96, 22], [550, 432, 96, 22]],
+        'html': []
+    }
+    assert get_closest_element(locator_element, [cand1, cand3]) == cand3
+    CONFIG.set_value("SearchDirection", "up!")
+    assert get_closest_element(locator_element, [cand1, cand3]) == cand1
+    CONFIG.reset_value("SearchDirection")
+
+
 @patch('QWeb.internal.element.get_webelements_in_active_area')
 def test_get_unique_element_by_xpath_positives(patch_webelements):
     xpath1 = "xpath=//div[@bar='bar']"
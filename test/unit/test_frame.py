@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+from QWeb.internal import frame
+from QWeb.internal.config_defaults import CONFIG
+from QWeb.internal.exceptions import QWebElementNotFoundError
+from unittest.mock import patch, MagicMock
+import pytest
+
+
+@patch('QWeb.internal.frame.util.is_safari', return_value=False)
+@patch('QWeb.internal.frame.fc.get_frames')
+@patch('QWeb.internal.frame.browser.get_current_browser')
+def test_frame_affinity(patched_browser, patched_frames, _):
+    current = []
+    driver = MagicMock()
+    driver.switch_to.default_content.side_effect = current.clear
+    driver.switch_to.frame.side_effect = current.append
+    driver.switch_to.parent_frame.side_effect = lambda: current.pop()
+    patched_browser.return_value = driver
+    patched_frames.side_effect = lambda d, reorder=True: (None, [] if current else ['frame1'])
+    elements = {'frame1': 'elem'}
+
+    @frame.all_frames
+    def find(text, **kwargs):
+        if current and current[-1] in elements:
+            return elements[current[-1]]
+        raise QWebElementNotFoundError('not found')
+
+    frame.reset_frame_affinity()
+    CONFIG.set_value("FrameAffinity", True)
+    CONFIG.set_value("FrameTimeout", 1.0)
+    assert find('foo') == 'elem'
+    assert frame.get_frame_affinity_stats() == {'hits': 0, 'misses': 0}
+    assert find('foo') == 'elem'
+    assert frame.get_frame_affinity_stats() == {'hits': 1, 'misses': 0}
+
+    elements.clear()
+    with pytest.raises(QWebElementNotFoundError):
+        find('foo')
+    assert frame.get_frame_affinity_stats() == {'hits': 1, 'misses': 1}
+
+    CONFIG.reset_value("FrameAffinity")
+    CONFIG.reset_value("FrameTimeout")
+    frame.reset_frame_affinity()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+from QWeb.internal import frame_checker
+from QWeb.internal.config_defaults import CONFIG
+from unittest.mock import patch
+
+
+@patch('QWeb.internal.frame_checker.check_frames')
+@patch('QWeb.internal.frame_checker.javascript.get_frame_state')
+def test_frame_cache(patched_state, patched_check):
+    frame_checker.clear_frame_cache()
+    patched_check.return_value = ['frame1', 'frame2']
+    patched_state.return_value = {'id': 'doc1', 'url': 'http://foo', 'gen': 0}
+
+    # cache is off by default
+    assert frame_checker.get_frames(None) == (None, ['frame1', 'frame2'])
+    assert patched_check.call_count == 1
+
+    CONFIG.set_value("FrameCache", True)
+    key, frames = frame_checker.get_frames(None)
+    assert frames == ['frame1', 'frame2']
+    frame_checker.get_frames(None)
+    assert patched_check.call_count == 2
+
+    # last hit is returned first
+    frame_checker.remember_hit(key, 'frame2')
+    assert frame_checker.get_frames(None)[1] == ['frame2', 'frame1']
+    assert frame_checker.get_frames(None, reorder=False)[1] == ['frame1', 'frame2']
+
+    # frames changed in document
+    patched_state.return_value = {'id': 'doc1', 'url': 'http://foo', 'gen': 1}
+    frame_checker.get_frames(None)
+    assert patched_check.call_count == 3
+
+    CONFIG.reset_value("FrameCache")
+    frame_checker.clear_frame_cache()
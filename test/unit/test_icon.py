@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+import time
+import cv2
+import numpy as np
+from unittest.mock import patch, MagicMock
+from QWeb.internal import icon, screenshot
+from QWeb.internal.icon import QIcon
+from QWeb.internal.config_defaults import CONFIG
+
+
+def _screenshot_with_icons(positions):
+    rng = np.random.default_rng(1)
+    screenshot = rng.integers(0, 255, (1080, 1920), dtype=np.uint8)
+    icon = rng.integers(0, 255, (100, 100), dtype=np.uint8)
+    for x, y in positions:
+        screenshot[y:y + 100, x:x + 100] = icon
+    return screenshot, icon
+
+
+def _extract_points_loop(height, res, threshold, width):
+    """Previous pixel by pixel implementation, used as reference."""
+    points = []
+    highest_max_val = 0.0
+    highest_max_val_loc = (-1, -1)
+    for _ in range(100):
+        _, max_val, _, top_left = cv2.minMaxLoc(res)
+        if max_val >= highest_max_val:
+            highest_max_val = max_val
+            highest_max_val_loc = (int(round(top_left[0] + width / 2)),
+                                   int(round(top_left[1] + height / 2)))
+        if max_val <= threshold:
+            break
+        for loc_x in range(int(round(top_left[0] - width / 2)),
+                           int(round(top_left[0] + width / 2))):
+            for loc_y in range(int(round(top_left[1] - height / 2)),
+                               int(round(top_left[1] + height / 2))):
+                try:
+                    res[loc_y][loc_x] = np.float32(-10000)
+                except IndexError:
+                    pass
+        points.append(highest_max_val_loc)
+    return points, highest_max_val, highest_max_val_loc
+
+
+def test_extract_points_same_as_loop():
+    positions = [(200 + 150 * i, 100 + 90 * (i % 9)) for i in range(10)]
+    screenshot, icon = _screenshot_with_icons(positions)
+    res = cv2.matchTemplate(screenshot, icon, cv2.TM_CCOEFF_NORMED)
+    expected = _extract_points_loop(100, res.copy(), 0.9, 100)
+    result = QIcon._extract_points(100, res.copy(), 0.9, 100)
+    assert result == expected
+    assert len(result[0]) == len(positions)
+
+
+def test_extract_points_near_edges():
+    # template-sized mask is clipped to result matrix instead of wrapping around
+    screenshot, icon = _screenshot_with_icons([(0, 0), (1820, 980)])
+    res = cv2.matchTemplate(screenshot, icon, cv2.TM_CCOEFF_NORMED)
+    points, max_val, max_loc = QIcon._extract_points(100, res, 0.9, 100)
+    assert len(points) == 2
+    assert max_val > 0.99
+    assert res[:50, :50].max() < -1000
+    assert res[-50:, -50:].max() < -1000
+
+
+def _write_icon_files(tmp_path):
+    screenshot = np.full((1080, 1920, 3), 230, np.uint8)
+    for i in range(40):
+        cv2.putText(screenshot, f"Lorem ipsum {i}", (40 + 37 * i, 60 + 25 * i),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (40, 40, 40), 2)
+    needle = np.full((64, 64, 3), 255, np.uint8)
+    cv2.circle(needle, (32, 32), 20, (0, 120, 255), -1)
+    cv2.rectangle(needle, (20, 28), (44, 36), (255, 255, 255), -1)
+    # icon is scaled 0.75 in screenshot
+    screenshot[700:748, 1500:1548] = cv2.resize(needle, (48, 48), interpolation=cv2.INTER_AREA)
+    haystack_path, needle_path = str(tmp_path / "haystack.png"), str(tmp_path / "needle.png")
+    cv2.imwrite(haystack_path, screenshot)
+    cv2.imwrite(needle_path, needle)
+    return needle_path, haystack_path
+
+
+def test_image_location_coarse_to_fine(tmp_path):
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    CONFIG.set_value("RetinaDisplay", False)
+    try:
+        with patch("QWeb.internal.icon.QIcon._match_coarse_to_fine",
+                   wraps=QIcon._match_coarse_to_fine) as coarse:
+            location = QIcon().image_location(needle_path, haystack_path, draw=0,
+                                              template_res_w=1440, device_res_w=1080)
+        assert coarse.called
+        assert location == (1524, 724)
+        with patch("QWeb.internal.icon.COARSE_FACTORS", ()):
+            assert QIcon().image_location(needle_path, haystack_path, draw=0,
+                                          template_res_w=1440, device_res_w=1080) == location
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+
+
+def _match_icons(tmp_path, positions, **kwargs):
+    haystack, needle = _screenshot_with_icons(positions)
+    needle_path = str(tmp_path / "needle.png")
+    cv2.imwrite(needle_path, needle)
+    image = cv2.cvtColor(haystack, cv2.COLOR_GRAY2BGR)
+    with patch.object(QIcon, "_match_scale", wraps=QIcon._match_scale) as match_scale:
+        match = QIcon().match_needle(needle_path, image, haystack, template_res_w=1920,
+                                     device_res_w=1920, **kwargs)
+    full_resolution = [c for c in match_scale.call_args_list if c.args[1] is None]
+    return match, len(full_resolution)
+
+
+def test_match_needle_coarse_boxes(tmp_path):
+    CONFIG.set_value("RetinaDisplay", False)
+    CONFIG.set_value("LogMatchedIcons", True)
+    try:
+        match, _ = _match_icons(tmp_path, [(200, 100), (900, 600)])
+        with patch("QWeb.internal.icon.COARSE_FACTORS", ()):
+            reference, _ = _match_icons(tmp_path, [(200, 100), (900, 600)])
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+        CONFIG.reset_value("LogMatchedIcons")
+    # all matches are drawn as with full resolution search
+    assert match.found
+    assert sorted(match.boxes) == sorted(reference.boxes)
+    assert {box[:2] for box in match.boxes} == {(200, 100), (900, 600)}
+
+
+def test_match_needle_coarse_miss(tmp_path):
+    CONFIG.set_value("RetinaDisplay", False)
+    try:
+        match, full_resolution = _match_icons(tmp_path, [])
+        with patch("QWeb.internal.icon.COARSE_FACTORS", ()):
+            _, all_scales = _match_icons(tmp_path, [])
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+    assert not match.found
+    # no coarse match near tolerance, full resolution search is skipped
+    assert full_resolution == 0
+    assert all_scales > 1
+
+
+def test_image_location_parallel(tmp_path):
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    CONFIG.set_value("RetinaDisplay", False)
+    CONFIG.set_value("IconMatchWorkers", 4)
+    try:
+        with patch("QWeb.internal.icon.COARSE_FACTORS", ()):
+            assert QIcon().image_location(needle_path, haystack_path, draw=0,
+                                          template_res_w=1440, device_res_w=1080) == (1524, 724)
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+        CONFIG.reset_value("IconMatchWorkers")
+
+
+def test_map_in_order():
+    def match(scale):
+        # first item finishes last
+        time.sleep(0.05 if scale == 1.0 else 0)
+        return scale
+
+    assert list(icon._map_in_order(match, [1.0, 0.75, 0.5])) == [1.0, 0.75, 0.5]
+    CONFIG.set_value("IconMatchWorkers", 4)
+    try:
+        assert list(icon._map_in_order(match, [1.0, 0.75, 0.5])) == [1.0, 0.75, 0.5]
+    finally:
+        CONFIG.reset_value("IconMatchWorkers")
+
+
+def test_image_recognition_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    driver = MagicMock()
+    with open(haystack_path, 'rb') as png:
+        driver.get_screenshot_as_png.return_value = png.read()
+    CONFIG.set_value("RetinaDisplay", False)
+    try:
+        with patch('QWeb.internal.screenshot.browser.get_current_browser', return_value=driver), \
+                patch('QWeb.internal.icon.frame.wait_page_loaded'), \
+                patch('QWeb.internal.screenshot.save_screenshot') as save_screenshot:
+            assert icon.image_recognition(needle_path, 1440, 1080, pyautog=False) == (1524, 724)
+        save_screenshot.assert_not_called()
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+
+
+def test_template_cache(tmp_path):
+    needle_path, _ = _write_icon_files(tmp_path)
+    icon.clear_template_cache()
+    template, scaled = icon.get_templates(needle_path, True, [1.0, 0.5])
+    assert template.shape == (64, 64)
+    assert scaled[0] is template
+    assert scaled[1].shape == (32, 32)
+    assert not template.flags.writeable
+    assert icon.get_templates(needle_path, True, [1.0, 0.5])[0] is template
+    # different scales or color are cached separately
+    icon.get_templates(needle_path, False, [1.0, 0.5])
+    stats = icon.get_template_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+    assert stats["bytes"] == 64 * 64 + 32 * 32 + (64 * 64 + 32 * 32) * 3
+
+    with patch("QWeb.internal.icon.TEMPLATE_CACHE_MAX_BYTES", 22000):
+        icon.get_templates(needle_path, True, [0.75])
+    stats = icon.get_template_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 15360 + 64 * 64 + 48 * 48
+    icon.clear_template_cache()
+    assert icon.get_template_cache_stats()["size"] == 0
+
+
+def test_image_location_region(tmp_path):
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    CONFIG.set_value("RetinaDisplay", False)
+    try:
+        # result is translated back to whole screenshot
+        location = QIcon().image_location(needle_path, haystack_path, draw=0, template_res_w=1440,
+                                          device_res_w=1080, region=(1400, 650, 300, 200))
+        assert location == (1524, 724)
+        assert QIcon().image_location(needle_path, haystack_path, draw=0, template_res_w=1440,
+                                      device_res_w=1080, region=(0, 0, 1400, 1080)) == (-1, -1)
+        # region smaller than icon
+        assert QIcon().image_location(needle_path, haystack_path, draw=0, template_res_w=1440,
+                                      device_res_w=1080, region=(1500, 700, 20, 20)) == (-1, -1)
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+
+
+@patch('QWeb.internal.icon.javascript.execute_javascript')
+def test_region_to_pixels(patched_js):
+    patched_js.return_value = {'innerWidth': 960, 'innerHeight': 500, 'outerWidth': 1000,
+                               'outerHeight': 600, 'screenX': 10, 'screenY': 20,
+                               'screenWidth': 1280}
+    # browser screenshot with devicePixelRatio 2
+    assert icon._region_to_pixels((10, 20, 100, 50.5), 1920, False) == (20, 40, 200, 101)
+    assert icon._region_to_pixels('viewport', 1920, False) == (0, 0, 1920, 1000)
+    # screen screenshot, viewport starts after window borders and toolbars
+    assert icon._region_to_pixels((0, 0, 100, 50), 1280, True) == (50, 120, 100, 50)
+
+
+def test_images_recognition(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    missing_path = str(tmp_path / "missing.png")
+    missing = np.full((64, 64, 3), 255, np.uint8)
+    cv2.rectangle(missing, (10, 10), (54, 54), (200, 0, 0), 6)
+    cv2.imwrite(missing_path, missing)
+    driver = MagicMock()
+    with open(haystack_path, 'rb') as png:
+        driver.get_screenshot_as_png.return_value = png.read()
+    CONFIG.set_value("RetinaDisplay", False)
+    CONFIG.set_value("IconMatchWorkers", 2)
+    try:
+        with patch('QWeb.internal.screenshot.browser.get_current_browser', return_value=driver), \
+                patch('QWeb.internal.icon.frame.wait_page_loaded'):
+            matches = icon.images_recognition([needle_path, missing_path], 1440, 1080,
+                                              pyautog=False)
+        # one capture for all icons
+        assert driver.get_screenshot_as_png.call_count == 1
+        assert list(matches) == [needle_path, missing_path]
+        assert matches[needle_path].found
+        assert matches[needle_path].location == (1524, 724)
+        assert matches[needle_path].score > 0.95
+        assert not matches[missing_path].found
+        assert not (tmp_path / "temp_matched_area.png").exists()
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+        CONFIG.reset_value("IconMatchWorkers")
+
+
+def test_image_location_features(tmp_path):
+    screenshot = np.full((1080, 1920, 3), 230, np.uint8)
+    for i in range(40):
+        cv2.putText(screenshot, f"Lorem ipsum {i}", (40 + 37 * i, 60 + 25 * i),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (40, 40, 40), 2)
+    needle = np.full((96, 96, 3), 255, np.uint8)
+    cv2.circle(needle, (30, 30), 18, (0, 120, 255), -1)
+    cv2.rectangle(needle, (50, 10), (86, 40), (200, 40, 0), -1)
+    cv2.putText(needle, "QW", (12, 86), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (20, 20, 20), 3)
+    cv2.line(needle, (60, 50), (90, 90), (0, 0, 0), 3)
+    # scale not in the list of template scale ratios
+    scaled = cv2.resize(needle, None, fx=0.62, fy=0.62, interpolation=cv2.INTER_AREA)
+    screenshot[500:500 + scaled.shape[0], 1200:1200 + scaled.shape[1]] = scaled
+    needle_path = str(tmp_path / "needle.png")
+    cv2.imwrite(needle_path, needle)
+    CONFIG.set_value("RetinaDisplay", False)
+    icon.clear_template_cache()
+    try:
+        x, y = QIcon().image_location(needle_path, screenshot.copy(), draw=0, template_res_w=1080,
+                                      device_res_w=1080, matcher="orb")
+        assert abs(x - 1230) <= 1 and abs(y - 530) <= 1
+        # keypoints of icon are cached
+        misses = icon.get_template_cache_stats()["misses"]
+        CONFIG.set_value("IconMatcher", "orb")
+        match = QIcon().match_needle(needle_path, screenshot,
+                                     cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY),
+                                     draw=0, template_res_w=1080, device_res_w=1080)
+        assert icon.get_template_cache_stats()["misses"] == misses
+        assert match.found and match.score > 0.95
+        assert abs(match.scale_ratio - 0.62) < 0.02
+        # not found
+        blank = np.full((1080, 1920, 3), 230, np.uint8)
+        assert QIcon().image_location(needle_path, blank, draw=0, template_res_w=1080,
+                                      device_res_w=1080) == (-1, -1)
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+        CONFIG.reset_value("IconMatcher")
+        icon.clear_template_cache()
+
+
+def test_image_location_features_fallback(tmp_path):
+    # plain icon has too few keypoints, template matching is used
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    CONFIG.set_value("RetinaDisplay", False)
+    try:
+        with patch("QWeb.internal.icon.FEATURE_MIN_INLIERS", 1000):
+            assert QIcon().image_location(needle_path, haystack_path, draw=0,
+                                          template_res_w=1440, device_res_w=1080,
+                                          matcher="akaze") == (1524, 724)
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+
+
+def test_log_matched_image_lazy(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    needle_path, haystack_path = _write_icon_files(tmp_path)
+    haystack = cv2.imread(haystack_path)
+    original = haystack.copy()
+    CONFIG.set_value("RetinaDisplay", False)
+    try:
+        with patch("QWeb.internal.icon.save_image_async") as save_image, \
+                patch("QWeb.internal.icon.np.zeros", wraps=np.zeros) as zeros:
+            assert QIcon().image_location(needle_path, haystack, template_res_w=1440,
+                                          device_res_w=1080) == (1524, 724)
+        # nothing rendered or written without LogMatchedIcons
+        zeros.assert_not_called()
+        save_image.assert_not_called()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["haystack.png", "needle.png"]
+
+        CONFIG.set_value("LogMatchedIcons", True)
+        with patch("QWeb.internal.icon.log_screenshot_file") as log_file:
+            assert QIcon().image_location(needle_path, haystack, template_res_w=1440,
+                                          device_res_w=1080) == (1524, 724)
+        filepath = log_file.call_args[0][0]
+        assert np.array_equal(haystack, original)
+        screenshot.flush_screenshots()
+        composite = cv2.imread(filepath)
+        assert composite.shape == (1080, 1920 + 64, 3)
+        # best match is drawn red
+        assert tuple(composite[700, 64 + 1500]) == (0, 0, 255)
+    finally:
+        CONFIG.reset_value("RetinaDisplay")
+        CONFIG.reset_value("LogMatchedIcons")
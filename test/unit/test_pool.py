@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+from QWeb.internal.browser import pool
+from QWeb.internal.config_defaults import CONFIG
+from unittest.mock import MagicMock
+
+
+def test_browser_pool():
+    launched = []
+
+    def factory():
+        driver = MagicMock()
+        driver.window_handles = ['w1']
+        launched.append(driver)
+        return driver
+
+    CONFIG.set_value("BrowserPoolSize", 1)
+    browser_pool = pool.BrowserPool()
+    key = pool.make_key('chrome', ['--headless'], {})
+    assert browser_pool.acquire(key) is None
+    first = factory()
+    browser_pool.adopt(key, first, factory)
+    browser_pool._executor.shutdown(wait=True)
+    browser_pool._executor = None
+    assert len(launched) == 2
+    assert browser_pool.acquire(pool.make_key('firefox', [], {})) is None
+    second = browser_pool.acquire(key)
+    assert second is launched[1]
+
+    # released browser is reset and returned to pool, not owned ones are not
+    assert browser_pool.release(first)
+    first.delete_all_cookies.assert_called_once()
+    first.get.assert_called_with('about:blank')
+    first.quit.assert_not_called()
+    assert not browser_pool.release(MagicMock())
+    # pool is full, extra browser is quit
+    assert browser_pool.release(second)
+    second.quit.assert_called_once()
+
+    browser_pool.shutdown()
+    first.quit.assert_called_once()
+    CONFIG.reset_value("BrowserPoolSize")
+
+
+def test_reset_browser():
+    driver = MagicMock()
+    driver.window_handles = ['w1', 'w2']
+    driver.capabilities = {'browserName': 'chrome', 'goog:chromeOptions': {}}
+    pool.reset_browser(driver)
+    driver.switch_to.window.assert_called_with('w1')
+    driver.close.assert_called_once()
+    driver.execute_async_script.assert_called_once()
+    driver.execute_cdp_cmd.assert_any_call('Network.clearBrowserCookies', {})
+    driver.execute_cdp_cmd.assert_any_call('Network.clearBrowserCache', {})
+    driver.get.assert_called_with('about:blank')
+
+    driver = MagicMock()
+    driver.window_handles = ['w1']
+    driver.capabilities = {'browserName': 'firefox', 'webSocketUrl': 'ws://localhost/session'}
+    pool.reset_browser(driver)
+    driver.close.assert_not_called()
+    driver.execute_cdp_cmd.assert_not_called()
+    driver.storage.delete_cookies.assert_called_once()
+
+    # storage module missing in older Selenium versions
+    driver = MagicMock()
+    driver.window_handles = ['w1']
+    driver.capabilities = {'browserName': 'firefox', 'webSocketUrl': 'ws://localhost/session'}
+    del driver.storage
+    pool.reset_browser(driver)
+    driver.delete_all_cookies.assert_called_once()
+    driver.get.assert_called_with('about:blank')
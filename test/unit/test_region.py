@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+from unittest.mock import patch, MagicMock
+import pytest
+from QWeb.internal import region
+from QWeb.internal.exceptions import QWebElementNotFoundError
+
+
+def test_get_region_coordinates():
+    assert region.get_region(None) is None
+    assert region.get_region(" Viewport ") == "viewport"
+    assert region.get_region("10, 20, 300, 40.5") == (10.0, 20.0, 300.0, 40.5)
+
+
+@patch("QWeb.internal.region.browser.get_current_browser")
+@patch("QWeb.internal.region.javascript.execute_javascript")
+@patch("QWeb.internal.region.text.get_item_using_anchor")
+@patch("QWeb.internal.region.text.get_element_by_locator_text")
+def test_get_region_element(by_text, by_attribute, execute, driver):
+    web_element = MagicMock()
+    by_text.return_value = web_element
+    execute.return_value = {"x": 110, "y": 220, "width": 30, "height": 40}
+    assert region.get_region("Shopping cart") == (110, 220, 30, 40)
+    by_text.assert_called_once_with("Shopping cart", allow_non_existent=True)
+    by_attribute.assert_not_called()
+    assert execute.call_args.args[1] is web_element
+    # element search may have switched to a frame
+    driver.return_value.switch_to.default_content.assert_called_once()
+
+    # attributes (title, alt...) are matched when there is no such text
+    by_text.return_value = None
+    assert region.get_region("cart icon") == (110, 220, 30, 40)
+    by_attribute.assert_called_once_with("cart icon", anchor="1", allow_non_existent=True)
+
+    by_attribute.return_value = None
+    with pytest.raises(QWebElementNotFoundError):
+        region.get_region("missing")
+
+    by_text.return_value = web_element
+    execute.return_value = None
+    with pytest.raises(QWebElementNotFoundError, match="another origin"):
+        region.get_region("Shopping cart")
+
+
+@patch("QWeb.internal.region.browser.get_current_browser")
+@patch("QWeb.internal.region.javascript.execute_javascript")
+@patch("QWeb.internal.region.text.get_element_by_locator_text")
+def test_get_region_top_element(by_text, execute, driver):
+    web_element = MagicMock()
+    by_text.return_value = web_element
+    # element of top document is returned for element screenshot
+    execute.return_value = True
+    assert region.get_region("Shopping cart", top_element=True) is web_element
+    execute.assert_called_once_with("return window === window.top")
+    driver.return_value.switch_to.default_content.assert_called_once()
+
+    # element inside a frame is returned as region of top document
+    execute.side_effect = [False, {"x": 110, "y": 220, "width": 30, "height": 40}]
+    assert region.get_region("Shopping cart", top_element=True) == (110, 220, 30, 40)
+    assert region.get_region("10, 20, 30, 40", top_element=True) == (10, 20, 30, 40)
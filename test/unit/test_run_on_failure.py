@@ -24,10 +24,11 @@ from unittest.mock import Mock
 def test_run_once():
     qweb = QWeb_.QWeb()
     # Patch the default run-on-failure method, log_screenshot
-    QWeb_.screenshot.log_screenshot = Mock()
+    QWeb_.screenshot._log_screenshot = Mock()
     with pytest.raises(AttributeError):
         qweb.click_text(u"Browser not open")
-    QWeb_.screenshot.log_screenshot.assert_called_once()
+    # file is not returned to the caller, so it is written in background
+    QWeb_.screenshot._log_screenshot.assert_called_once_with(background=True)
 
 
 def test_correct_keyword():
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+from unittest.mock import patch, MagicMock
+import base64
+import os
+import threading
+from uuid import uuid4
+import cv2
+import numpy as np
+from skimage.metrics import structural_similarity
+from QWeb.internal import screenshot
+from QWeb.keywords import config
+
+
+def _screen(height=1080, width=1920):
+    image = np.full((height, width), 230, np.uint8)
+    for i in range(30):
+        cv2.putText(image, f"Lorem ipsum {i}", (40 + 37 * i, 60 + 25 * i),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, 40, 2)
+    return image
+
+
+def test_compare_identical_files(tmp_path):
+    ref_path, cmp_path = str(tmp_path / "ref.png"), str(tmp_path / "cmp.png")
+    cv2.imwrite(ref_path, _screen())
+    cv2.imwrite(cmp_path, _screen())
+    with patch("QWeb.internal.screenshot.structural_similarity") as ssim, \
+            patch("QWeb.internal.screenshot.cv2.imdecode") as imdecode:
+        score, _, exact = screenshot._compare_image_files(ref_path, cmp_path)
+    assert score == 1.0
+    assert exact
+    ssim.assert_not_called()
+    imdecode.assert_not_called()
+
+
+def test_compare_identical_pixels(tmp_path):
+    ref_path, cmp_path = str(tmp_path / "ref.png"), str(tmp_path / "cmp.png")
+    cv2.imwrite(ref_path, _screen(), [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    cv2.imwrite(cmp_path, _screen(), [cv2.IMWRITE_PNG_COMPRESSION, 9])
+    with patch("QWeb.internal.screenshot.structural_similarity") as ssim:
+        score, changed_areas, _ = screenshot._compare_image_files(ref_path, cmp_path)
+    assert score == 1.0
+    ssim.assert_not_called()
+    assert changed_areas == []
+
+
+def test_tiled_structural_similarity():
+    # size not divisible by tile size, last column of tiles is narrow
+    for height, width in ((1080, 1920), (301, 257)):
+        ref = _screen(height, width)
+        new = ref.copy()
+        new[0:5, 0:9] = 0
+        new[height - 3:, width - 20:width - 3] = 255
+        cv2.putText(new, "changed", (width // 3, height // 2), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+        expected = structural_similarity(ref, new)
+        with patch("QWeb.internal.screenshot.structural_similarity",
+                   wraps=structural_similarity) as ssim:
+            score, _, exact = screenshot._tiled_structural_similarity(ref, new)
+        assert abs(score - expected) < 1e-9
+        assert exact
+        # only changed tiles are compared
+        assert ssim.call_count < len(screenshot._tile_edges(height)) * len(
+            screenshot._tile_edges(width)) / 2
+
+
+def test_tiled_structural_similarity_early_exit():
+    ref = _screen()
+    new = ref.copy()
+    for i in range(10):
+        cv2.putText(new, f"changed {i}", (100 + 150 * i, 900), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+    expected = structural_similarity(ref, new)
+    with patch("QWeb.internal.screenshot.structural_similarity",
+               wraps=structural_similarity) as ssim:
+        screenshot._tiled_structural_similarity(ref, new)
+    changed_tiles = ssim.call_count
+    for accuracy in (expected - 0.1, expected + 0.001):
+        with patch("QWeb.internal.screenshot.SSIM_WORKERS", 1), \
+                patch("QWeb.internal.screenshot.structural_similarity",
+                      wraps=structural_similarity) as ssim:
+            score, _, exact = screenshot._tiled_structural_similarity(ref, new, accuracy)
+        # result is the same as with full comparison, not all tiles compared
+        assert (score > accuracy) == (expected > accuracy)
+        assert not exact
+        assert 0 < ssim.call_count < changed_tiles
+
+
+def test_changed_areas():
+    ref = _screen()
+    new = ref.copy()
+    new[100:110, 60:200] = 0  # spans three tiles
+    new[500, 1000] = 0
+    score, changed_areas, _ = screenshot._tiled_structural_similarity(ref, new, 0.9)
+    assert score > 0.9
+    assert sorted(changed_areas) == [(60, 100, 140, 10), (1000, 500, 1, 1)]
+
+
+def test_score_text():
+    assert screenshot._score_text(0.95, True, 0.9) == "score: 0.95"
+    assert screenshot._score_text(0.95, False, 0.9) == "score \u2265 0.95"
+    assert screenshot._score_text(0.85, False, 0.9) == "score \u2264 0.85"
+
+
+def test_save_screenshot_background(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    png = cv2.imencode(".png", _screen(100, 200))[1].tobytes()
+    driver = MagicMock()
+    driver.get_screenshot_as_base64.return_value = base64.b64encode(png).decode()
+    writer = screenshot._ScreenshotWriter()
+    started, release = threading.Event(), threading.Event()
+    write = screenshot._write_base64_png
+
+    def slow_write(*args):
+        started.set()
+        release.wait(5)
+        write(*args)
+
+    with patch("QWeb.internal.screenshot.browser.get_current_browser", return_value=driver), \
+            patch("QWeb.internal.screenshot.SCREENSHOT_WRITER", writer), \
+            patch("QWeb.internal.screenshot._write_base64_png", slow_write):
+        filepath = screenshot.save_screenshot(f"shot-{uuid4()}.png", background=True)
+        started.wait(5)
+        # keyword continues before file is written
+        assert not os.path.exists(filepath)
+        driver.save_screenshot.assert_not_called()
+        release.set()
+        assert writer.flush() == []
+    with open(filepath, "rb") as shot:
+        assert shot.read() == png
+    os.remove(filepath)
+
+
+def test_screenshot_writer_bounded_queue():
+    writer = screenshot._ScreenshotWriter(max_queue=1)
+    release = threading.Event()
+    writer.submit("first", release.wait, 5)
+    writer.submit("second", lambda: None)
+    # third waits until writer has room in queue
+    third = threading.Thread(target=writer.submit, args=("third", lambda: None))
+    third.start()
+    third.join(0.2)
+    assert third.is_alive()
+    release.set()
+    third.join(5)
+    assert not third.is_alive()
+
+    def fail():
+        raise OSError("disk full")
+
+    writer.submit("failing.png", fail)
+    assert writer.flush() == ["Writing failing.png failed: disk full"]
+    assert writer.flush() == []
+
+
+def test_save_screenshot_encoded_and_deduplicated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(screenshot, "_SCREENSHOT_FILES", {})
+    png = cv2.imencode(".png", _screen(100, 200))[1].tobytes()
+    driver = MagicMock()
+    driver.get_screenshot_as_base64.return_value = base64.b64encode(png).decode()
+    config.set_config("ScreenshotFormat", "webp")
+    config.set_config("ScreenshotScale", 0.5)
+    try:
+        with patch("QWeb.internal.screenshot.browser.get_current_browser", return_value=driver):
+            first = screenshot.save_screenshot()
+            second = screenshot.save_screenshot()
+            driver.get_screenshot_as_base64.return_value = base64.b64encode(
+                cv2.imencode(".png", _screen(100, 201))[1].tobytes()).decode()
+            third = screenshot.save_screenshot()
+    finally:
+        config.reset_config("ScreenshotFormat")
+        config.reset_config("ScreenshotScale")
+    assert first.endswith(".webp")
+    assert second == first
+    assert third != first
+    assert cv2.imread(first).shape == (50, 100, 3)
+    assert os.path.exists(third)
+    driver.save_screenshot.assert_not_called()
+    os.remove(first)
+    os.remove(third)
+
+
+def test_store_screenshot_waits_pending_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(screenshot, "_SCREENSHOT_FILES", {})
+    png = cv2.imencode(".png", _screen(100, 200))[1].tobytes()
+    image = base64.b64encode(png).decode()
+    encoding = ("png", 80, 1.0)
+    writer = screenshot._ScreenshotWriter()
+    started, release = threading.Event(), threading.Event()
+    write = screenshot._write_base64_png
+
+    def slow_write(*args):
+        started.set()
+        release.wait(5)
+        write(*args)
+
+    first, second = str(tmp_path / "first.png"), str(tmp_path / "second.png")
+    with patch("QWeb.internal.screenshot.SCREENSHOT_WRITER", writer), \
+            patch("QWeb.internal.screenshot._write_base64_png", slow_write):
+        assert screenshot._store_screenshot(first, image, "digest", encoding, True) == first
+        started.wait(5)
+        threading.Timer(0.2, release.set).start()
+        # identical screenshot is used by caller, file must be written when returned
+        assert screenshot._store_screenshot(second, image, "digest", encoding, False) == first
+        assert release.is_set()
+        assert os.path.exists(first)
+        assert not os.path.exists(second)
+        assert writer.flush() == []
+
+
+def test_clipped_screenshot():
+    driver = MagicMock()
+    driver.execute_script.return_value = {
+        "x": 30, "y": 1020, "width": 100, "height": 40,
+        "scrollX": 0, "scrollY": 1000, "innerWidth": 200,
+    }
+    with patch("QWeb.internal.screenshot._chromium_send",
+               return_value={"data": "Y2xpcA=="}) as send:
+        assert screenshot.clipped_screenshot(driver, (30, 20, 100, 40), "chrome") == "Y2xpcA=="
+    # clip is in page coordinates
+    assert send.call_args.args[2]["clip"] == {
+        "x": 30, "y": 1020, "width": 100, "height": 40, "scale": 1}
+    driver.execute_script.assert_called_once()
+    assert driver.execute_script.call_args.args[1] == [30, 20, 100, 40]
+
+    # other browsers crop from viewport screenshot with device pixel ratio
+    viewport = np.zeros((200, 400, 3), np.uint8)
+    viewport[40:120, 60:260] = 255
+    driver.get_screenshot_as_png.return_value = cv2.imencode(".png", viewport)[1].tobytes()
+    png = base64.b64decode(screenshot.clipped_screenshot(driver, (30, 20, 100, 40), "firefox"))
+    clipped = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+    assert clipped.shape == (80, 200, 3)
+    assert clipped.min() == 255
+
+    # remote chromium session without CDP endpoint crops too
+    with patch("QWeb.internal.screenshot._chromium_send",
+               side_effect=AttributeError("'WebDriver' object has no attribute 'service'")):
+        png = base64.b64decode(
+            screenshot.clipped_screenshot(driver, (30, 20, 100, 40), "chrome"))
+    assert cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR).shape == (80, 200, 3)
+
+    web_element = MagicMock(spec=screenshot.WebElement)
+    web_element.screenshot_as_base64 = "ZWxlbWVudA=="
+    assert screenshot.clipped_screenshot(driver, web_element, "firefox") == "ZWxlbWVudA=="
+
+
+def test_stitched_full_screenshot(tmp_path):
+    # page of 1500 x 200 CSS pixels with device pixel ratio 2, viewport 300 high
+    rng = np.random.default_rng(0)
+    page = rng.integers(0, 255, (3000, 400, 3), np.uint8)
+    header = np.full((50, 400, 3), 10, np.uint8)
+    footer = np.full((30, 400, 3), 20, np.uint8)
+    position = {"y": 0.0}
+
+    def execute_script(script, *args):
+        if script == screenshot._PAGE_METRICS_JS:
+            return {"height": 1500, "innerWidth": 200, "innerHeight": 300,
+                    "scrollX": 0, "scrollY": 40}
+        position["y"] = min(1200.0, max(0.0, round(args[1] * 2) / 2))
+        return position["y"]
+
+    def get_screenshot_as_png():
+        top = int(position["y"] * 2)
+        view = page[top:top + 600].copy()
+        view[:50], view[-30:] = header, footer
+        return cv2.imencode(".png", view)[1].tobytes()
+
+    driver = MagicMock()
+    driver.execute_script.side_effect = execute_script
+    driver.get_screenshot_as_png.side_effect = get_screenshot_as_png
+    filepath = str(tmp_path / "full.png")
+    assert screenshot.stitched_full_screenshot(driver, filepath) == filepath
+    expected = page.copy()
+    expected[:50], expected[-30:] = header, footer
+    assert np.array_equal(cv2.imread(filepath), expected)
+    # scroll position is restored
+    assert position["y"] == 40
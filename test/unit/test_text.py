@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+from QWeb.internal import element, text
+from QWeb.internal.config_defaults import CONFIG
+from QWeb.internal.exceptions import QWebElementNotFoundError, QWebInstanceDoesNotExistError, \
+    QWebValueError
+from unittest.mock import patch
+import pytest
+
+# bundled search without frame handling
+bundled_search = text.get_text_using_anchor_bundled.__wrapped__
+
+
+def teardown_function():
+    CONFIG.reset_value("LocatorEngine")
+    CONFIG.reset_value("ShadowDOM")
+    CONFIG.reset_value("AllTextNodes")
+    CONFIG.reset_value("IsModalXpath")
+
+
+def test_bundled_engine_supported():
+    assert not text._bundled_engine_supported()
+    CONFIG.set_value("LocatorEngine", "bundled")
+    assert text._bundled_engine_supported()
+    assert not text._bundled_engine_supported(all_text_nodes=True)
+
+    CONFIG.set_value("AllTextNodes", True)
+    assert not text._bundled_engine_supported()
+    assert text._bundled_engine_supported(all_text_nodes=False)
+    CONFIG.reset_value("AllTextNodes")
+
+    CONFIG.set_value("ShadowDOM", True)
+    assert not text._bundled_engine_supported()
+    CONFIG.reset_value("ShadowDOM")
+
+    CONFIG.set_value("IsModalXpath", "//div[@role='dialog']")
+    assert not text._bundled_engine_supported()
+    CONFIG.reset_value("IsModalXpath")
+
+    with patch.object(element, 'ACTIVE_AREA_FUNCTION', lambda: None):
+        assert not text._bundled_engine_supported()
+
+
+@patch('QWeb.internal.text.filter_by_modal_ancestor', side_effect=lambda elements: elements)
+@patch('QWeb.internal.text.get_all_text_elements')
+@patch('QWeb.internal.text.get_text_using_anchor_bundled')
+def test_get_text_using_anchor_engine(patched_bundled, patched_default, _):
+    patched_bundled.return_value = 'bundled_elem'
+    patched_default.return_value = ['default_elem']
+
+    assert text.get_text_using_anchor('Login', '1') == 'default_elem'
+    patched_bundled.assert_not_called()
+
+    CONFIG.set_value("LocatorEngine", "bundled")
+    assert text.get_text_using_anchor('Login', '1', partial_match=True) == 'bundled_elem'
+    patched_bundled.assert_called_once_with('Login', '1', partial_match=True)
+
+    # unsupported search falls back to default engine
+    CONFIG.set_value("ShadowDOM", True)
+    assert text.get_text_using_anchor('Login', '1') == 'default_elem'
+    assert patched_bundled.call_count == 1
+
+
+@patch('QWeb.internal.javascript.execute_javascript')
+def test_get_text_using_anchor_bundled(patched_js):
+    patched_js.return_value = {'status': 'found', 'elem': 'elem', 'diagnostics': {}}
+    assert bundled_search('Login', '2') == 'elem'
+    cfg = patched_js.call_args[0][3]
+    assert patched_js.call_args[0][1:3] == ('Login', '2')
+    assert cfg['anchorIndex'] == 1
+    assert not cfg['skipClickable']
+    assert '"Login"' in cfg['exactXpath']
+
+    # digit anchor is used as text when anchor_type is text
+    bundled_search('Login', '2', anchor_type='text', css=False)
+    cfg = patched_js.call_args[0][3]
+    assert cfg['anchorIndex'] is None
+    assert cfg['skipClickable']
+    assert '"2"' in cfg['anchorExactXpath']
+
+
+@pytest.mark.parametrize('result, error, message', [
+    ({'status': 'index_out_of_range', 'diagnostics': {'visible': 2}},
+     QWebInstanceDoesNotExistError, 'Found 2 elements. Given anchor was 3'),
+    ({'status': 'anchor_not_found', 'diagnostics': {}},
+     QWebValueError, 'Text "3" did not match any elements'),
+    ({'status': 'anchor_not_unique', 'diagnostics': {'anchorMatches': 4}},
+     QWebValueError, 'Text "3" matched 4 elements. Needs to be unique'),
+    ({'status': 'direction', 'diagnostics': {}},
+     QWebElementNotFoundError, 'No elements found in enforced direction'),
+    ({'status': 'not_found', 'diagnostics': {}},
+     QWebElementNotFoundError, 'Webpage did not contain text "Login"'),
+])
+@patch('QWeb.internal.javascript.execute_javascript')
+def test_get_text_using_anchor_bundled_errors(patched_js, result, error, message):
+    patched_js.return_value = result
+    with pytest.raises(error, match=message):
+        bundled_search('Login', '3')
@@ -18,6 +18,7 @@
 from QWeb.internal.util import get_substring, set_line_break, prefs_to_dict, xpath_validator,\
     par2bool, option_handler, parse_option_list, parse_env_option_list
 from QWeb.internal.exceptions import QWebValueMismatchError
+from QWeb.internal import util
 from unittest.mock import patch
 import pytest
 
@@ -107,3 +108,15 @@ def test_parse_env_option_list_preserves_commas_without_spaces():
         "disable-impl-side-painting",
         "--allow-remote-origins=localhost:8000,localhost:8001",
     ]
+
+
+def test_get_keyword_function():
+    import QWeb as QWeb_
+    from QWeb.keywords import config as config_keywords
+    qweb = QWeb_.QWeb()
+    with patch('QWeb.internal.util.BuiltIn') as builtin:
+        builtin.return_value.get_library_instance.return_value = qweb
+        fn = util.get_keyword_function('Get Config')
+    # run on failure wrapper is left out, selector handling is kept
+    assert fn.__wrapped__ is config_keywords.get_config
+    assert fn('DefaultTimeout') == config_keywords.get_config('DefaultTimeout')
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# --------------------------
+# Copyright © 2014 -            Qentinel Group.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ---------------------------
+
+from QWeb.internal import xhr
+from unittest.mock import patch, MagicMock
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+
+def test_wait_xhr_waits_in_page():
+    statuses = [
+        JavascriptException("document unloaded while waiting for result"),
+        {"done": False, "phase": "network", "pending": 2, "ms": 10000},
+        {"done": True, "phase": "idle", "ms": 120},
+    ]
+    with patch("QWeb.internal.xhr.javascript.execute_async_javascript",
+               side_effect=statuses) as execute, \
+            patch("QWeb.internal.xhr.time.sleep"):
+        xhr.wait_xhr(timeout=30, skip_network=True)
+    assert execute.call_count == 3
+    for call in execute.call_args_list:
+        script, opts = call.args
+        assert script == xhr.JS_WAIT_PAGE_READY
+        assert 0 < opts["timeoutMs"] <= xhr.ASYNC_WAIT_MAX_MS
+        assert opts["skipNetwork"] is True
+        assert opts["pollMs"] == 100
+
+
+def test_wait_xhr_timeout():
+    with patch("QWeb.internal.xhr.javascript.execute_async_javascript",
+               return_value={"done": False, "phase": "spinner", "ms": 50}) as execute:
+        xhr.wait_xhr(timeout=0.05)
+    assert execute.call_args.args[1]["timeoutMs"] <= 50
+
+
+def test_register_xhr_monitor():
+    driver = MagicMock()
+    driver.capabilities = {"browserName": "chrome", "goog:chromeOptions": {}}
+    driver.current_window_handle = "first"
+    assert xhr.register_xhr_monitor(driver) is True
+    assert xhr.register_xhr_monitor(driver) is True
+    driver.execute_cdp_cmd.assert_called_once_with(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {"source": f"({xhr.JS_PRELOAD_MONITOR})();"})
+    # CDP script is registered for each window
+    driver.current_window_handle = "second"
+    assert xhr.register_xhr_monitor(driver) is True
+    assert driver.execute_cdp_cmd.call_count == 2
+
+    bidi_driver = MagicMock()
+    bidi_driver.capabilities = {"browserName": "firefox", "webSocketUrl": "ws://localhost"}
+    assert xhr.register_xhr_monitor(bidi_driver) is True
+    assert xhr.register_xhr_monitor(bidi_driver) is True
+    bidi_driver.script.add_preload_script.assert_called_once_with(xhr.JS_PRELOAD_MONITOR)
+
+    remote_driver = MagicMock()
+    remote_driver.capabilities = {"browserName": "chrome", "goog:chromeOptions": {}}
+    remote_driver.execute_cdp_cmd.side_effect = WebDriverException("unknown command")
+    assert xhr.register_xhr_monitor(remote_driver) is False
+    safari = MagicMock()
+    safari.capabilities = {"browserName": "safari"}
+    assert xhr.register_xhr_monitor(safari) is False